@@ -0,0 +1,199 @@
+# ansi.py
+
+import re
+from collections import namedtuple
+
+from constants import ANSI_COLOR_MAP
+
+# Комбинированный стиль текста. Цвета — строки "#rrggbb" или имена цветов Tk,
+# None означает цвет по умолчанию.
+SGRStyle = namedtuple(
+    "SGRStyle",
+    ["fg", "bg", "bold", "italic", "underline", "reverse", "strike"],
+    defaults=[None, None, False, False, False, False, False],
+)
+DEFAULT_STYLE = SGRStyle()
+
+# 16 базовых цветов в порядке индексов палитры 0-15
+BASE_COLORS = [ANSI_COLOR_MAP[str(30 + i)] for i in range(8)] + [
+    ANSI_COLOR_MAP[str(90 + i)] for i in range(8)
+]
+
+# Флаги, включаемые и выключаемые SGR кодами
+ATTRIBUTE_ON = {1: "bold", 3: "italic", 4: "underline", 7: "reverse", 9: "strike"}
+ATTRIBUTE_OFF = {
+    22: ("bold",),
+    23: ("italic",),
+    24: ("underline",),
+    27: ("reverse",),
+    29: ("strike",),
+}
+
+
+def palette_color(index):
+    """Цвет из 256-цветной палитры xterm."""
+    if index < 16:
+        return BASE_COLORS[index]
+    if index < 232:
+        index -= 16
+        steps = (index // 36, index // 6 % 6, index % 6)
+        levels = [0 if step == 0 else 55 + 40 * step for step in steps]
+        return "#{:02x}{:02x}{:02x}".format(*levels)
+    gray = 8 + 10 * (index - 232)
+    return f"#{gray:02x}{gray:02x}{gray:02x}"
+
+
+class SGRParser:
+    """
+    Инкрементальный разбор ANSI escape последовательностей.
+
+    Поддерживаются SGR атрибуты: жирный, курсив, подчёркивание, инверсия,
+    зачёркивание, 16 цветов, 256-цветная палитра (38;5;n / 48;5;n),
+    truecolor (38;2;r;g;b / 48;2;r;g;b) и фон. Остальные CSI, OSC и
+    двухсимвольные escape-последовательности вырезаются из текста.
+
+    Текст можно подавать произвольными кусками: текущий стиль и незавершённая
+    escape-последовательность на конце куска сохраняются до следующего вызова.
+    Результат — список сегментов (текст, стиль), в котором соседние сегменты
+    с одинаковым стилем уже объединены. Стиль — SGRStyle или None для стиля
+    по умолчанию.
+    """
+
+    ESCAPE_PATTERN = re.compile(
+        r"\x1b(?:"
+        r"\[([0-?]*)[ -/]*([@-~])"  # CSI: параметры и финальный символ
+        r"|\][^\x07\x1b]*(?:\x07|\x1b\\)"  # OSC, завершённая BEL или ST
+        r"|[ -/]*[0-Z\\^-~]"  # прочие escape-последовательности (ESC ( B и т.п.)
+        r")"
+    )
+    # Возможное начало escape-последовательности, обрезанной концом куска
+    PARTIAL_PATTERN = re.compile(
+        r"\x1b(?:\[[0-?]*[ -/]*|\][^\x07\x1b]*\x1b?|[ -/]*)\Z"
+    )
+    # Незавершённая последовательность длиннее этого считается мусором
+    MAX_PENDING = 4096
+    # Размер кэша переходов (стиль, параметры SGR) -> новый стиль
+    MAX_TRANSITIONS = 4096
+
+    def __init__(self, colored=True, color_map=ANSI_COLOR_MAP):
+        self.colored = colored
+        self.color_map = color_map
+        self.style = DEFAULT_STYLE
+        self._pending = ""
+        self._transitions = {}
+
+    def reset(self):
+        """Сброс стиля и недочитанного хвоста."""
+        self.style = DEFAULT_STYLE
+        self._pending = ""
+
+    def feed(self, text):
+        """
+        Разбор очередного куска текста.
+
+        Args:
+            text (str): Кусок вывода, возможно обрывающийся посреди escape-последовательности.
+
+        Returns:
+            list: Сегменты (текст, стиль) с объединёнными соседними стилями.
+        """
+        if self._pending:
+            text = self._pending + text
+            self._pending = ""
+
+        runs = []
+        style = self.style
+        transitions = self._transitions
+        last_end = 0
+
+        for match in self.ESCAPE_PATTERN.finditer(text):
+            start = match.start()
+            if start > last_end:
+                self._append(runs, text[last_end:start], style)
+            if match.group(2) == "m":
+                # В логах повторяется несколько одних и тех же переходов,
+                # поэтому разбор параметров кэшируется
+                key = (style, match.group(1))
+                new_style = transitions.get(key)
+                if new_style is None:
+                    if len(transitions) >= self.MAX_TRANSITIONS:
+                        transitions.clear()
+                    new_style = transitions[key] = self.apply_sgr(*key)
+                style = new_style
+            last_end = match.end()
+
+        tail = text[last_end:]
+        escape = tail.rfind("\x1b")
+        if (
+            escape != -1
+            and len(tail) - escape <= self.MAX_PENDING
+            and self.PARTIAL_PATTERN.match(tail, escape)
+        ):
+            self._pending = tail[escape:]
+            tail = tail[:escape]
+        if tail:
+            self._append(runs, tail, style)
+
+        self.style = style
+        return runs
+
+    def apply_sgr(self, style, params):
+        """
+        Применение параметров SGR последовательности к стилю.
+
+        Args:
+            style (SGRStyle): Текущий стиль.
+            params (str): Параметры между "ESC[" и "m", например "1;38;5;208".
+
+        Returns:
+            SGRStyle: Новый стиль.
+        """
+        codes = [
+            int(code) if code.isdigit() else 0 for code in re.split("[;:]", params)
+        ]
+        changes = {}
+        i = 0
+        while i < len(codes):
+            code = codes[i]
+            i += 1
+            if code == 0:
+                style = DEFAULT_STYLE
+                changes.clear()
+            elif code in ATTRIBUTE_ON:
+                changes[ATTRIBUTE_ON[code]] = True
+            elif code in ATTRIBUTE_OFF:
+                for name in ATTRIBUTE_OFF[code]:
+                    changes[name] = False
+            elif 30 <= code <= 37 or 90 <= code <= 97:
+                changes["fg"] = self.color_map.get(str(code))
+            elif 40 <= code <= 47 or 100 <= code <= 107:
+                changes["bg"] = self.color_map.get(str(code - 10))
+            elif code == 39:
+                changes["fg"] = None
+            elif code == 49:
+                changes["bg"] = None
+            elif code in (38, 48):
+                color, i = self._extended_color(codes, i)
+                if color is not None:
+                    changes["fg" if code == 38 else "bg"] = color
+        if changes:
+            style = style._replace(**changes)
+        return style
+
+    @staticmethod
+    def _extended_color(codes, i):
+        """Разбор 38;5;n и 38;2;r;g;b; возвращает цвет и позицию после него."""
+        if i < len(codes) and codes[i] == 5 and i + 1 < len(codes):
+            return palette_color(min(codes[i + 1], 255)), i + 2
+        if i < len(codes) and codes[i] == 2 and i + 3 < len(codes):
+            r, g, b = (min(c, 255) for c in codes[i + 1 : i + 4])
+            return f"#{r:02x}{g:02x}{b:02x}", i + 4
+        return None, len(codes)
+
+    def _append(self, runs, text, style):
+        if not self.colored or style is DEFAULT_STYLE or style == DEFAULT_STYLE:
+            style = None
+        if runs and runs[-1][1] == style:
+            runs[-1] = (runs[-1][0] + text, style)
+        else:
+            runs.append((text, style))
@@ -0,0 +1,183 @@
+"""
+Микро-бенчмарк разбора цветного вывода.
+
+Сравнивает прежнюю вставку (insert на каждый сегмент и tag_names() внутри
+цикла) с SGRParser + одним многосегментным insert на кусок вывода.
+
+Использование:
+    python benchmarks/bench_ansi.py [--size-mb 50] [--chunk-kb 64] [--tk]
+
+По умолчанию вместо tk.Text используется виджет-заглушка, считающая вызовы
+(каждый вызов — отдельный round-trip в Tcl). С флагом --tk используется
+настоящий tk.Text (нужен дисплей; имеет смысл уменьшить --size-mb).
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ansi import SGRParser  # noqa: E402
+from constants import ANSI_COLOR_MAP  # noqa: E402
+
+LEGACY_PATTERN = re.compile(r"\x1b\[(?:\d+;?)*m")
+
+
+class CallCounter:
+    """Заглушка tk.Text: считает вызовы insert, tag_names и tag_configure."""
+
+    def __init__(self):
+        self.calls = 0
+        self.tags = set()
+
+    def insert(self, index, *args):
+        self.calls += 1
+
+    def tag_names(self):
+        self.calls += 1
+        return tuple(self.tags)
+
+    def tag_configure(self, tag, **kwargs):
+        self.calls += 1
+        self.tags.add(tag)
+
+
+def legacy_insert_colored_text(widget, text):
+    """Прежняя реализация ScriptRunnerGUI.insert_colored_text."""
+    current_color = None
+    last_end = 0
+    for match in LEGACY_PATTERN.finditer(text):
+        start, end = match.span()
+        if start > last_end:
+            segment = text[last_end:start]
+            if current_color:
+                widget.insert("end", segment, current_color)
+            else:
+                widget.insert("end", segment)
+        for code in match.group()[2:-1].split(";"):
+            if code == "0":
+                current_color = None
+            elif code in ANSI_COLOR_MAP:
+                color = ANSI_COLOR_MAP[code]
+                if color not in widget.tag_names():
+                    widget.tag_configure(color, foreground=color)
+                current_color = color
+        last_end = end
+    if last_end < len(text):
+        segment = text[last_end:]
+        if current_color:
+            widget.insert("end", segment, current_color)
+        else:
+            widget.insert("end", segment)
+
+
+def batched_insert(widget, parser, tag_for, text):
+    """SGRParser и один многосегментный insert на кусок."""
+    args = []
+    for segment, style in parser.feed(text):
+        args.append(segment)
+        args.append(tag_for(style))
+    if args:
+        widget.insert("end", *args)
+
+
+def generate_log(size_bytes):
+    """Цветной лог в формате extract_png_in_directory.py."""
+    levels = [
+        ("\033[36m", "DEBUG"),
+        ("\033[32m", "INFO"),
+        ("\033[33m", "WARNING"),
+        ("\033[31m", "ERROR"),
+    ]
+    lines = []
+    size = 0
+    i = 0
+    while size < size_bytes:
+        color, level = levels[i % len(levels)]
+        line = f"{color}{level}: Файл 'part_{i}.png' перемещен в 'Organized_PNGs/set_{i % 97}'\033[0m\n"
+        lines.append(line)
+        size += len(line.encode("utf-8"))
+        i += 1
+    return "".join(lines)
+
+
+def chunks(text, chunk_size):
+    for start in range(0, len(text), chunk_size):
+        yield text[start : start + chunk_size]
+
+
+def make_widget(use_tk):
+    if not use_tk:
+        return CallCounter(), None
+    import tkinter as tk
+
+    root = tk.Tk()
+    widget = tk.Text(root)
+    for color in ANSI_COLOR_MAP.values():
+        widget.tag_configure(color, foreground=color)
+    return widget, root
+
+
+def make_tag_for(widget, use_tk):
+    """Отображение стиля в тег: пул тегов консоли или словарь для заглушки."""
+    if use_tk:
+        from widgets.tag_pool import TagPool
+
+        return TagPool(widget).tag_for
+    tags = {}
+
+    def tag_for(style):
+        if style is None:
+            return ()
+        if style not in tags:
+            widget.tag_configure(f"sgr{len(tags)}")
+            tags[style] = f"sgr{len(tags)}"
+        return tags[style]
+
+    return tag_for
+
+
+def run(label, func, use_tk):
+    widget, root = make_widget(use_tk)
+    started = time.perf_counter()
+    func(widget)
+    elapsed = time.perf_counter() - started
+    calls = getattr(widget, "calls", None)
+    extra = f", вызовов Tk: {calls}" if calls is not None else ""
+    print(f"{label:<12} {elapsed:8.2f} с{extra}")
+    if root is not None:
+        root.destroy()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=float, default=50)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    parser.add_argument("--tk", action="store_true", help="Использовать tk.Text.")
+    args = parser.parse_args()
+
+    text = generate_log(int(args.size_mb * 1024 * 1024))
+    chunk_size = args.chunk_kb * 1024
+    print(f"Лог: {args.size_mb} МБ, кусками по {args.chunk_kb} КБ")
+
+    def legacy(widget):
+        for chunk in chunks(text, chunk_size):
+            legacy_insert_colored_text(widget, chunk)
+
+    def batched(widget):
+        sgr = SGRParser()
+        tag_for = make_tag_for(widget, args.tk)
+        for chunk in chunks(text, chunk_size):
+            batched_insert(widget, sgr, tag_for, chunk)
+
+    legacy_time = run("прежний", legacy, args.tk)
+    batched_time = run("SGRParser", batched, args.tk)
+    print(f"ускорение: x{legacy_time / batched_time:.1f}")
+
+
+if __name__ == "__main__":
+    main()
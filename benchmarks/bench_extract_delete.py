@@ -0,0 +1,171 @@
+"""
+Бенчмарк удаления подкаталогов в scripts/extract_png_in_directory.py.
+
+Строит одинаковые деревья с глубокими цепочками папок внутри целевых
+папок и удаляет подкаталоги второго уровня:
+
+- прежним способом: rglob("*") по целевой папке и rmtree детей каждой
+  папки, которую он выдает (обход продолжается по уже удаленным папкам);
+- обходом scan_source_folder(), который останавливается на уровне
+  удаления, и delete_directories_at_specific_level() с rmtree через
+  dir_fd, в одном и в нескольких потоках.
+
+Выводит время, количество ошибок и проверяет, что деревья после удаления
+совпадают. С --latency к каждому удалению файла и папки добавляется
+задержка, как на сетевом диске.
+
+Использование:
+    python benchmarks/bench_extract_delete.py [--targets 20] [--branches 4]
+        [--depth 30] [--files 3] [--jobs 4] [--latency 0]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from extract_png_in_directory import (  # noqa: E402
+    delete_directories_at_specific_level,
+    scan_source_folder,
+)
+
+TARGET_NAME = "Vector Parts"
+
+
+def make_tree(root, targets, branches, depth, files):
+    """
+    Целевые папки с цепочками подкаталогов глубины depth.
+
+    Returns:
+        int: Количество созданных папок.
+    """
+    created = 0
+    for t in range(targets):
+        target = os.path.join(root, f"group_{t}", TARGET_NAME)
+        for b in range(branches):
+            path = os.path.join(target, f"layer_{b}")
+            for level in range(depth):
+                path = os.path.join(path, f"level_{level}")
+                os.makedirs(path)
+                for f in range(files):
+                    with open(os.path.join(path, f"file_{f}.png"), "wb"):
+                        pass
+                created += 1
+    return created
+
+
+def legacy_delete(start_path):
+    """Прежний delete_directories_at_specific_level; возвращает количество ошибок."""
+    errors = 0
+    for dir_path in start_path.rglob("*"):
+        if dir_path.is_dir():
+            try:
+                sub_dirs = list(dir_path.iterdir())
+            except OSError:
+                errors += 1
+                continue
+            for sub_dir in sub_dirs:
+                if sub_dir.is_dir():
+                    try:
+                        shutil.rmtree(sub_dir)
+                    except Exception:
+                        errors += 1
+    return errors
+
+
+def run_legacy(root):
+    errors = 0
+    for target in sorted(Path(root).glob(f"*/{TARGET_NAME}")):
+        errors += legacy_delete(target)
+    return errors
+
+
+def run_single_pass(root, jobs):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        targets = scan_source_folder(Path(root), TARGET_NAME, set())
+        delete_directories_at_specific_level(
+            [sub_dir for target in targets for sub_dir in target.nested_dirs], jobs
+        )
+    return output.getvalue().count("ERROR")
+
+
+@contextlib.contextmanager
+def network_latency(latency):
+    """Задержка для os.unlink и os.rmdir (их вызывает shutil.rmtree)."""
+    original = os.unlink, os.rmdir
+
+    def delayed(function):
+        def call(*args, **kwargs):
+            time.sleep(latency)
+            return function(*args, **kwargs)
+
+        return call
+
+    if latency:
+        os.unlink, os.rmdir = (delayed(function) for function in original)
+    try:
+        yield
+    finally:
+        os.unlink, os.rmdir = original
+
+
+def listing(root):
+    return sorted(
+        os.path.relpath(os.path.join(dirpath, name), root)
+        for dirpath, dirnames, filenames in os.walk(root)
+        for name in dirnames + filenames
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк удаления подкаталогов.")
+    parser.add_argument("--targets", type=int, default=20)
+    parser.add_argument("--branches", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=30)
+    parser.add_argument("--files", type=int, default=3)
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0, help="Задержка, мс")
+    args = parser.parse_args()
+
+    variants = [
+        ("rglob + rmtree (прежний)", run_legacy),
+        ("scandir + dir_fd", lambda root: run_single_pass(root, 1)),
+        (
+            f"scandir + dir_fd, {args.jobs} п.",
+            lambda root: run_single_pass(root, args.jobs),
+        ),
+    ]
+    workdir = tempfile.mkdtemp(prefix="bench_delete_")
+    try:
+        expected = None
+        print(f"{'Способ':<30}{'папок':>8}{'время, с':>10}{'ошибок':>8}")
+        for index, (name, run) in enumerate(variants):
+            root = os.path.join(workdir, str(index))
+            created = make_tree(
+                root, args.targets, args.branches, args.depth, args.files
+            )
+            with network_latency(args.latency / 1000):
+                started = time.perf_counter()
+                errors = run(root)
+                elapsed = time.perf_counter() - started
+            result = listing(root)
+            if expected is None:
+                expected = result
+            elif result != expected:
+                raise RuntimeError(f"{name}: дерево после удаления отличается")
+            print(f"{name:<30}{created:>8}{elapsed:>10.2f}{errors:>8}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Бенчмарк initialize_group_info в scripts/extract_png_in_directory.py.
+
+Первый настоящий запуск с --group строит Group_PNGs из --groups групп по
+--parts файлов частей тела (файлы связываются жесткими ссылками, чтобы
+подготовка шла быстрее) и записывает индекс счетчиков. На получившейся
+папке сравнивается время определения счетчиков:
+
+- прежним способом: glob("*.png") и re.match с новым выражением на каждый файл;
+- сканированием папок (scandir и одно заранее скомпилированное выражение),
+  когда индекса нет;
+- по файлу индекса, записанному первым запуском.
+
+Затем --runs раз добавляются --new новых групп и скрипт запускается снова;
+выводится время initialize_group_info внутри этих запусков и сколько
+частей взято из индекса. Время изменения папок не подменяется.
+
+Использование:
+    python benchmarks/bench_extract_group_index.py [--parts 40] [--groups 1000]
+        [--new 2] [--runs 5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import extract_png_in_directory as extract  # noqa: E402
+
+TARGET_NAME = "Vector Parts"
+
+
+def make_sources(root, first, count, parts):
+    """Группы first..first + count - 1 с одним файлом каждой части тела."""
+    for g in range(first, first + count):
+        target = os.path.join(root, f"group_{g}", TARGET_NAME)
+        os.makedirs(target)
+        for p in range(parts):
+            with open(os.path.join(target, f"Part {p}.png"), "wb"):
+                pass
+
+
+def legacy_group_info(group_destination_base):
+    """Прежний initialize_group_info."""
+    group_info = {}
+    for group_folder in group_destination_base.iterdir():
+        if group_folder.is_dir():
+            sanitized_part_name = extract.sanitize_name(group_folder.name)
+            max_index = 0
+            for file in group_folder.glob("*.png"):
+                match = re.match(
+                    rf"^{re.escape(sanitized_part_name)}_(\d+)\.png$", file.name
+                )
+                if match:
+                    max_index = max(max_index, int(match.group(1)))
+            group_info[sanitized_part_name] = max_index
+    return group_info
+
+
+def measure(function, runs):
+    timings = []
+    result = None
+    for _ in range(runs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            result = function()
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def run_script(root):
+    """
+    Настоящий запуск с --group.
+
+    Returns:
+        tuple: (время initialize_group_info в мс, счетчики, вывод скрипта).
+    """
+    original = extract.initialize_group_info
+    timing = {}
+
+    def timed(group_destination_base):
+        started = time.perf_counter()
+        result = original(group_destination_base)
+        timing["ms"] = (time.perf_counter() - started) * 1000
+        timing["result"] = dict(result)
+        return result
+
+    output = io.StringIO()
+    extract.initialize_group_info = timed
+    try:
+        with contextlib.redirect_stdout(output):
+            extract.rename_folders_and_clean_files(
+                Path(root), TARGET_NAME, group=True, link_mode="hardlink"
+            )
+    finally:
+        extract.initialize_group_info = original
+    return timing["ms"], timing["result"], output.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк индекса Group_PNGs.")
+    parser.add_argument("--parts", type=int, default=40)
+    parser.add_argument("--groups", type=int, default=1000)
+    parser.add_argument("--new", type=int, default=2)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_group_index_")
+    try:
+        base = Path(workdir) / extract.GROUP_FOLDER_NAME
+        index_file = base / extract.GROUP_INDEX_FILE_NAME
+        make_sources(workdir, 0, args.groups, args.parts)
+        run_script(workdir)
+
+        legacy_ms, expected = measure(lambda: legacy_group_info(base), args.runs)
+        rows = [("glob + re.match (прежний)", legacy_ms)]
+        # Индекс убирается на время замера и возвращается без изменений
+        moved_index = index_file.with_name(index_file.name + ".bench")
+        os.replace(index_file, moved_index)
+        try:
+            elapsed, result = measure(
+                lambda: extract.initialize_group_info(base), args.runs
+            )
+        finally:
+            os.replace(moved_index, index_file)
+        rows.append(("scandir, без индекса", elapsed))
+        elapsed, result = measure(
+            lambda: extract.initialize_group_info(base), args.runs
+        )
+        if result != expected:
+            raise RuntimeError("Счетчики по индексу отличаются")
+        rows.append(("индекс после 1-го запуска", elapsed))
+
+        timings = []
+        from_index = []
+        for run in range(args.runs):
+            expected = legacy_group_info(base)
+            make_sources(workdir, args.groups + run * args.new, args.new, args.parts)
+            elapsed, result, output = run_script(workdir)
+            if result != expected:
+                raise RuntimeError(f"Запуск {run + 2}: счетчики отличаются")
+            timings.append(elapsed)
+            from_index.append(output.count("(из файла индекса)"))
+        rows.append(("индекс, следующие запуски", statistics.median(timings)))
+
+        print(f"Папок частей: {args.parts}, файлов: {args.parts * args.groups}")
+        print(f"{'Способ':<30}{'мс':>10}")
+        for name, elapsed in rows:
+            print(f"{name:<30}{elapsed:>10.1f}")
+        print(
+            f"Частей из индекса в следующих запусках: "
+            f"{min(from_index)}-{max(from_index)} из {args.parts}"
+        )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
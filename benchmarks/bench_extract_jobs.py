@@ -0,0 +1,152 @@
+"""
+Бенчмарк параллельной обработки групп в scripts/extract_png_in_directory.py.
+
+Строит одинаковые синтетические деревья и обрабатывает их с --group при
+разном числе потоков (--jobs). Чтобы локальный диск вел себя как сетевой
+ресурс (NFS/SMB), к каждому перемещению, копированию, удалению файла и
+удалению папки добавляется задержка --latency. Выводит время и файлы/с
+и проверяет, что Organized_PNGs и Group_PNGs получаются одинаковыми при
+любом числе потоков.
+
+Использование:
+    python benchmarks/bench_extract_jobs.py [--groups 16] [--targets 3]
+        [--files 20] [--latency 2] [--jobs 1 4 8] [--link-mode copy]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import pathlib
+import shutil
+import sys
+import tempfile
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import extract_png_in_directory as extract  # noqa: E402
+
+TARGET_NAME = "Vector Parts"
+PARTS = ("Head", "Left Arm", "Right Arm", "Body", "Left Leg", "Right Leg")
+
+
+def make_tree(root, groups, targets, files):
+    """
+    Синтетическое дерево исходной папки.
+
+    Returns:
+        int: Количество созданных файлов.
+    """
+    created = 0
+    for g in range(groups):
+        for t in range(targets):
+            target = os.path.join(root, f"group_{g}", f"char_{t}", TARGET_NAME)
+            os.makedirs(os.path.join(target, extract.TXT_FOLDER_NAME))
+            os.makedirs(os.path.join(target, "layers", "old"))
+            for f in range(files):
+                name = f"{PARTS[f % len(PARTS)]} {f // len(PARTS)}.png"
+                with open(os.path.join(target, name), "wb") as file:
+                    file.write(name.encode() * 64)
+            for name in ("notes.txt", "preview.jpg"):
+                with open(os.path.join(target, name), "wb"):
+                    pass
+            created += files + 2
+    return created
+
+
+def with_latency(function, latency):
+    def delayed(*args, **kwargs):
+        # sleep отпускает GIL, как ожидание ответа от сетевого диска
+        time.sleep(latency)
+        return function(*args, **kwargs)
+
+    return delayed
+
+
+@contextlib.contextmanager
+def network_latency(latency):
+    """Задержка для операций скрипта с файлами на время замера."""
+    original_shutil = extract.shutil
+    original_move = extract.move_file
+    original_place = extract.place_in_group
+    original_unlink = pathlib.Path.unlink
+    extract.shutil = types.SimpleNamespace(
+        **{**vars(shutil), "rmtree": with_latency(shutil.rmtree, latency)}
+    )
+    extract.move_file = with_latency(original_move, latency)
+    extract.place_in_group = with_latency(original_place, latency)
+    pathlib.Path.unlink = with_latency(original_unlink, latency)
+    try:
+        yield
+    finally:
+        extract.shutil = original_shutil
+        extract.move_file = original_move
+        extract.place_in_group = original_place
+        pathlib.Path.unlink = original_unlink
+
+
+def snapshot(root):
+    """Содержимое папок результата: относительный путь -> размер файла."""
+    result = {}
+    for name in (extract.ORGANIZED_FOLDER_NAME, extract.GROUP_FOLDER_NAME):
+        base = os.path.join(root, name)
+        for dirpath, _, filenames in os.walk(base):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                result[os.path.relpath(path, root)] = os.path.getsize(path)
+    return result
+
+
+def run(root, jobs, latency, link_mode):
+    with network_latency(latency), contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        extract.rename_folders_and_clean_files(
+            pathlib.Path(root), TARGET_NAME, group=True, jobs=jobs, link_mode=link_mode
+        )
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк --jobs.")
+    parser.add_argument("--groups", type=int, default=16)
+    parser.add_argument("--targets", type=int, default=3)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=2, help="Задержка, мс")
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--link-mode", choices=list(extract.LINK_MODES), default="copy")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_jobs_")
+    try:
+        # Перемещается и копируется files, удаляется 2 файла на целевую папку
+        operations = args.groups * args.targets * (args.files * 2 + 2)
+        print(
+            f"Групп: {args.groups}, целевых папок: {args.groups * args.targets}, "
+            f"операций с файлами: {operations}, задержка: {args.latency} мс"
+        )
+        print(f"{'Потоков':<10}{'время, с':>10}{'файлов/с':>12}{'ускорение':>12}")
+        baseline = None
+        expected = None
+        for jobs in args.jobs:
+            root = os.path.join(workdir, f"jobs_{jobs}")
+            make_tree(root, args.groups, args.targets, args.files)
+            elapsed = run(root, jobs, args.latency / 1000, args.link_mode)
+            result = snapshot(root)
+            if expected is None:
+                expected = result
+            elif result != expected:
+                raise RuntimeError(f"Результат при --jobs {jobs} отличается")
+            baseline = baseline or elapsed
+            print(
+                f"{jobs:<10}{elapsed:>10.2f}{operations / elapsed:>12.0f}"
+                f"{baseline / elapsed:>11.1f}x"
+            )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Бенчмарк способов группировки (--link-mode) в scripts/extract_png_in_directory.py.
+
+Для каждого способа строит одинаковое дерево с файлами размера --size КБ,
+обрабатывает его с --group и выводит время и место, которое заняла
+Group_PNGs сверх Organized_PNGs (блоки файлов с уникальными inode).
+
+Использование:
+    python benchmarks/bench_extract_link.py [--groups 8] [--files 50]
+        [--size 256] [--dir /путь/на/проверяемом/диске]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+import extract_png_in_directory as extract  # noqa: E402
+
+TARGET_NAME = "Vector Parts"
+
+
+def make_tree(root, groups, files, size):
+    data = os.urandom(size * 1024)
+    for g in range(groups):
+        target = os.path.join(root, f"group_{g}", TARGET_NAME)
+        os.makedirs(target)
+        for f in range(files):
+            with open(os.path.join(target, f"Part {f}.png"), "wb") as file:
+                file.write(data)
+
+
+def group_usage(root):
+    """Байты на диске под файлы Group_PNGs, которых нет в Organized_PNGs."""
+    seen = set()
+    for name in (extract.ORGANIZED_FOLDER_NAME, extract.GROUP_FOLDER_NAME):
+        usage = 0
+        for dirpath, _, filenames in os.walk(os.path.join(root, name)):
+            for filename in filenames:
+                info = os.lstat(os.path.join(dirpath, filename))
+                if (info.st_dev, info.st_ino) not in seen:
+                    seen.add((info.st_dev, info.st_ino))
+                    usage += info.st_blocks * 512
+    return usage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк --link-mode.")
+    parser.add_argument("--groups", type=int, default=8)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--size", type=int, default=256, help="Размер файла, КБ")
+    parser.add_argument("--dir", default=None, help="Где создавать деревья")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_link_", dir=args.dir)
+    try:
+        print(f"Файлов: {args.groups * args.files} по {args.size} КБ")
+        print(f"{'Способ':<10}{'время, с':>10}{'Group_PNGs, МБ':>16}")
+        for link_mode in extract.LINK_MODES:
+            root = os.path.join(workdir, link_mode)
+            make_tree(root, args.groups, args.files, args.size)
+            with contextlib.redirect_stdout(io.StringIO()):
+                started = time.perf_counter()
+                extract.rename_folders_and_clean_files(
+                    Path(root), TARGET_NAME, group=True, link_mode=link_mode
+                )
+                elapsed = time.perf_counter() - started
+            usage = group_usage(root) / 1024 / 1024
+            print(f"{link_mode:<10}{elapsed:>10.2f}{usage:>16.1f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
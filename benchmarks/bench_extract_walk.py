@@ -0,0 +1,181 @@
+"""
+Бенчмарк поиска целевых папок в scripts/extract_png_in_directory.py.
+
+Строит синтетическое дерево (группы с вложенными папками, целевые папки
+с .png, 'TXT' и подкаталогами, «шумовые» папки с файлами и уже
+заполненную Organized_PNGs) и сравнивает прежний поиск — rglob по
+имени и отдельные glob/iterdir/rglob по каждой целевой папке — с
+однопроходным обходом scan_source_folder(). Оба варианта только читают
+дерево; результаты сверяются между собой.
+
+Использование:
+    python benchmarks/bench_extract_walk.py [--groups 40] [--targets 5]
+        [--files 30] [--noise 200] [--organized 5000] [--runs 5]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from extract_png_in_directory import (  # noqa: E402
+    GROUP_FOLDER_NAME,
+    ORGANIZED_FOLDER_NAME,
+    TXT_FOLDER_NAME,
+    scan_source_folder,
+)
+
+TARGET_NAME = "Vector Parts"
+
+
+def touch(path):
+    with open(path, "wb"):
+        pass
+
+
+def make_tree(root, groups, targets, files, noise, organized):
+    """
+    Синтетическое дерево исходной папки.
+
+    Returns:
+        int: Количество созданных файлов.
+    """
+    created = 0
+    for g in range(groups):
+        for t in range(targets):
+            target = os.path.join(root, f"group_{g}", f"char_{t}", "parts", TARGET_NAME)
+            os.makedirs(os.path.join(target, TXT_FOLDER_NAME))
+            for f in range(files):
+                touch(os.path.join(target, f"part_{f}.png"))
+            touch(os.path.join(target, "notes.txt"))
+            touch(os.path.join(target, TXT_FOLDER_NAME, "parts.txt"))
+            for s in range(3):
+                nested = os.path.join(target, f"layer_{s}", "old", "tmp")
+                os.makedirs(nested)
+                touch(os.path.join(nested, "draft.png"))
+            created += files + 5
+        noise_dir = os.path.join(root, f"group_{g}", "sources", "psd")
+        os.makedirs(noise_dir)
+        for f in range(noise):
+            touch(os.path.join(noise_dir, f"layer_{f}.psd"))
+        created += noise
+    for name in (ORGANIZED_FOLDER_NAME, GROUP_FOLDER_NAME):
+        folder = os.path.join(root, name, "group_0_1")
+        os.makedirs(folder)
+        for f in range(organized):
+            touch(os.path.join(folder, f"part_{f}.png"))
+        created += organized
+    return created
+
+
+def legacy_scan(start_path):
+    """Прежние проходы: rglob по имени, затем glob/iterdir/rglob на каждую папку."""
+    result = []
+    for target in start_path.rglob(TARGET_NAME):
+        if target.parts[len(start_path.parts)] in (
+            ORGANIZED_FOLDER_NAME,
+            GROUP_FOLDER_NAME,
+        ):
+            continue
+        png_files = [file for file in target.glob("*.png") if file.is_file()]
+        txt_folder = target / TXT_FOLDER_NAME
+        has_txt = txt_folder.exists() and txt_folder.is_dir()
+        other_files = [
+            file
+            for file in target.iterdir()
+            if file.is_file() and file not in png_files
+        ]
+        # Прежний rglob("*") обходил всё поддерево; удалялись подкаталоги
+        # второго уровня (папка 'TXT' к этому моменту уже удалена)
+        nested_dirs = [
+            sub_dir
+            for dir_path in target.rglob("*")
+            if dir_path.is_dir()
+            and dir_path.parent == target
+            and dir_path != txt_folder
+            for sub_dir in dir_path.iterdir()
+            if sub_dir.is_dir()
+        ]
+        result.append((target, png_files, has_txt, other_files, nested_dirs))
+    return result
+
+
+def single_pass_scan(start_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        targets = scan_source_folder(start_path, TARGET_NAME, set())
+    return [
+        (
+            target.path,
+            target.png_files,
+            target.txt_folder is not None,
+            target.other_files,
+            target.nested_dirs,
+        )
+        for target in targets
+    ]
+
+
+def normalized(result):
+    return sorted(
+        (str(path), sorted(pngs), txt, sorted(others), sorted(nested))
+        for path, pngs, txt, others, nested in result
+    )
+
+
+def measure(scan, start_path, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = scan(start_path)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк обхода дерева папок.")
+    parser.add_argument("--groups", type=int, default=40)
+    parser.add_argument("--targets", type=int, default=5)
+    parser.add_argument("--files", type=int, default=30)
+    parser.add_argument("--noise", type=int, default=200)
+    parser.add_argument("--organized", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_walk_")
+    try:
+        created = make_tree(
+            workdir,
+            args.groups,
+            args.targets,
+            args.files,
+            args.noise,
+            args.organized,
+        )
+        start_path = Path(workdir)
+        print(
+            f"Файлов: {created}, целевых папок: {args.groups * args.targets}, "
+            f"запусков: {args.runs}"
+        )
+        legacy_ms, legacy = measure(legacy_scan, start_path, args.runs)
+        single_ms, single = measure(single_pass_scan, start_path, args.runs)
+        if normalized(legacy) != normalized(single):
+            raise RuntimeError("Результаты обходов не совпадают")
+        print(f"{'Обход':<26}{'мс':>10}")
+        print(f"{'rglob + glob/iterdir':<26}{legacy_ms:>10.1f}")
+        print(f"{'scandir, один проход':<26}{single_ms:>10.1f}")
+        print(f"Ускорение: {legacy_ms / single_ms:.1f}x")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Бенчмарк холодного старта GUI.
+
+Замеряет:
+    1. Время импорта main.py по -X importtime (кумулятивное время модуля main)
+       и модули с наибольшим собственным временем импорта.
+    2. Время до первого кадра: от запуска процесса `python main.py` до
+       отрисовки окна (нужен дисплей; без него замер пропускается).
+
+Результаты сравниваются с целевыми значениями IMPORT_BUDGET_MS и
+FIRST_FRAME_BUDGET_MS; при превышении скрипт завершается с кодом 1,
+поэтому его можно использовать для проверки регрессий.
+
+Использование:
+    python benchmarks/bench_startup.py [--runs 5] [--top 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from constants import STARTUP_PROBE_ENV, STARTUP_PROBE_MARKER  # noqa: E402
+
+# Целевые значения (медиана по запускам)
+IMPORT_BUDGET_MS = 250
+FIRST_FRAME_BUDGET_MS = 1000
+
+
+def measure_import(top):
+    """Кумулятивное время импорта main и самые медленные модули, в мс."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    total = None
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append((int(self_us) / 1000, name.strip()))
+        if name.strip() == "main":
+            total = int(cumulative_us) / 1000
+    modules.sort(reverse=True)
+    return total, modules[:top]
+
+
+def measure_first_frame(timeout=30):
+    """Время от запуска main.py до отрисовки первого кадра, в мс (None без дисплея)."""
+    env = dict(os.environ, **{STARTUP_PROBE_ENV: "1"})
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        for line in process.stdout:
+            if line.strip() == STARTUP_PROBE_MARKER:
+                return (time.perf_counter() - started) * 1000
+        return None
+    finally:
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк холодного старта GUI.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    failed = False
+
+    imports = []
+    slowest = []
+    for _ in range(args.runs):
+        total, slowest = measure_import(args.top)
+        imports.append(total)
+    import_ms = statistics.median(imports)
+    print(f"Импорт main: {import_ms:.1f} мс (цель {IMPORT_BUDGET_MS} мс)")
+    print("Самые медленные модули (собственное время):")
+    for self_ms, name in slowest:
+        print(f"  {self_ms:8.1f} мс  {name}")
+    failed |= import_ms > IMPORT_BUDGET_MS
+
+    frames = [measure_first_frame() for _ in range(args.runs)]
+    if None in frames:
+        print("Первый кадр: пропущено (нет дисплея или окно не открылось)")
+    else:
+        frame_ms = statistics.median(frames)
+        print(f"Первый кадр: {frame_ms:.1f} мс (цель {FIRST_FRAME_BUDGET_MS} мс)")
+        failed |= frame_ms > FIRST_FRAME_BUDGET_MS
+
+    if failed:
+        print("Превышено целевое время старта.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Бенчмарк тёплого пула интерпретаторов (warm_pool.WarmPool).
+
+Замеряет время от запуска до завершения коротких скриптов из scripts/
+при обычном запуске нового процесса и при запуске в тёплом воркере,
+и выводит сэкономленное время. Между запусками делается пауза --settle,
+за которую пул успевает подготовить замену использованному воркеру
+(так запуски выглядят при работе из GUI); пауза в замер не входит.
+
+Использование:
+    python benchmarks/bench_warm_pool.py [--runs 20] [--settle 0.3] [--pool-size 2]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from runner import ScriptProcess, build_command  # noqa: E402
+from warm_pool import WarmPool  # noqa: E402
+
+
+def run_once(command, pool):
+    """Время выполнения команды в мс и признак запуска в воркере."""
+    started = time.perf_counter()
+    process = ScriptProcess(command, pool=pool)
+    process.start()
+    for _ in process.iter_output():
+        pass
+    elapsed = (time.perf_counter() - started) * 1000
+    if process.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)}: код {process.returncode}")
+    return elapsed, process.warm
+
+
+def measure(command, runs, settle, pool):
+    timings = []
+    warm_runs = 0
+    for _ in range(runs):
+        time.sleep(settle)
+        elapsed, warm = run_once(command, pool)
+        timings.append(elapsed)
+        warm_runs += warm
+    return timings, warm_runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк тёплого пула.")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--settle", type=float, default=0.3)
+    parser.add_argument("--pool-size", type=int, default=2)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_warm_")
+    scripts = [
+        ("list_directory.py", [ROOT]),
+        ("create_directory.py", [os.path.join(workdir, "new_dir")]),
+    ]
+    pool = WarmPool(args.pool_size)
+    print(f"Запусков: {args.runs}, воркеров в пуле: {args.pool_size}")
+    print(f"{'Скрипт':<22}{'обычный, мс':>14}{'тёплый, мс':>14}{'экономия':>12}")
+    try:
+        for name, script_args in scripts:
+            command = build_command(os.path.join(ROOT, "scripts", name), script_args)
+            cold, _ = measure(command, args.runs, args.settle, None)
+            # Первый запуск прогревает пул и выполняется обычным способом
+            run_once(command, pool)
+            warm, warm_runs = measure(command, args.runs, args.settle, pool)
+            cold_ms = statistics.median(cold)
+            warm_ms = statistics.median(warm)
+            saved = cold_ms - warm_ms
+            print(
+                f"{name:<22}{cold_ms:>14.1f}{warm_ms:>14.1f}"
+                f"{saved:>8.1f} мс ({saved / cold_ms:.0%})"
+            )
+            if warm_runs < args.runs:
+                print(f"  в воркере выполнено {warm_runs} из {args.runs} запусков")
+    finally:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,525 @@
+# cli.py
+
+"""
+Консольный запуск зарегистрированных скриптов без GUI.
+
+Использование:
+    python cli.py list
+    python cli.py run [--timeout СЕКУНДЫ] SCRIPT [АРГУМЕНТЫ...]
+    python cli.py batch SCRIPT [--file ФАЙЛ] [--jobs N]
+    python cli.py history [SCRIPT]
+    python cli.py logs [ЗАПРОС] [--regex] [--script SCRIPT] [--show ЗАПУСК]
+    python cli.py pipeline [НАЗВАНИЕ] [--force] [--jobs N]
+
+SCRIPT — путь, номер в списке (с 1), имя файла или имя без .py.
+Параметры run указываются до SCRIPT: всё, что идёт после него, передаётся
+скрипту без изменений.
+Для batch строки аргументов читаются из файла или из stdin (--file -).
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+from ansi import SGRParser
+from config import ConfigManager
+from constants import (
+    DEFAULT_LOG_COMPRESSION,
+    DEFAULT_OUTPUT_LOG_DIR,
+    DEFAULT_WARM_POOL_SIZE,
+    OUTPUT_FLUSH_INTERVAL_MS,
+)
+from interpreters import InterpreterResolver
+from jobs import Job, JobManager
+from limits import Limits
+from log_store import LogStore
+from pipeline import Pipeline, PipelineRun, PipelineState
+from registry import ScriptRegistry
+from run_history import RunHistory, format_bytes, make_record
+from runner import ScriptProcess, build_command, split_args
+from warm_pool import WarmPool
+
+
+class OutputWriter:
+    """Вывод кусков текста в stdout с сохранением или удалением ANSI цветов."""
+
+    def __init__(self, colored, prefix=""):
+        self.colored = colored
+        self.prefix = prefix
+        self.parser = None if colored else SGRParser(colored=False)
+        self._line_start = True
+
+    def write(self, text):
+        if self.parser is not None:
+            text = "".join(segment for segment, _ in self.parser.feed(text))
+        if self.prefix:
+            text = self._add_prefix(text)
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def _add_prefix(self, text):
+        """Префикс задачи в начале каждой строки (цвет сбрасывается перед ним)."""
+        prefix = f"\x1b[0m{self.prefix}" if self.colored else self.prefix
+        lines = text.split("\n")
+        result = []
+        for i, line in enumerate(lines):
+            if i:
+                result.append("\n")
+                self._line_start = True
+            if line:
+                if self._line_start:
+                    result.append(prefix)
+                    self._line_start = False
+                result.append(line)
+        return "".join(result)
+
+
+def use_color(mode):
+    if mode == "auto":
+        return sys.stdout.isatty() and "NO_COLOR" not in os.environ
+    return mode == "always"
+
+
+def command_list(registry, args):
+    """Вывод списка зарегистрированных скриптов."""
+    if not len(registry):
+        print("Нет добавленных скриптов.")
+        return 0
+    for number, path in enumerate(registry, start=1):
+        mark = "" if registry.is_valid(path) else "  [не найден]"
+        print(f"{number:>3}. {os.path.basename(path)}  {path}{mark}")
+    return 0
+
+
+def script_limits(registry, script_path, args):
+    """Ограничения запуска из конфигурации с учётом параметра --timeout."""
+    config = registry.config_manager.config
+    settings = config.get("script_settings", {}).get(script_path, {})
+    limits = Limits.from_settings(config.get("limits"), settings.get("limits"))
+    if args.timeout is not None:
+        limits.timeout = args.timeout
+    return limits
+
+
+def open_log_store(registry):
+    """Хранилище логов запусков из конфигурации (при ошибке формата — gzip)."""
+    config = registry.config_manager.config
+    log_dir = config.get("output_log_dir", DEFAULT_OUTPUT_LOG_DIR)
+    try:
+        return LogStore(
+            log_dir, codec=config.get("log_compression", DEFAULT_LOG_COMPRESSION)
+        )
+    except ValueError as ve:
+        print(f"{ve} Логи будут сжиматься gzip.", file=sys.stderr)
+        return LogStore(log_dir)
+
+
+def command_run(registry, args):
+    """Запуск одного скрипта с потоковым выводом; возвращает его код завершения."""
+    script_path = registry.find(args.script)
+    resolver = InterpreterResolver(
+        registry.config_manager.config.get("script_settings", {})
+    )
+    try:
+        command = build_command(script_path, args.script_args, resolver)
+    except ValueError as ve:
+        print(f"Не удалось разобрать флаги интерпретатора: {ve}", file=sys.stderr)
+        return 2
+    limits = script_limits(registry, script_path, args)
+    process = ScriptProcess(command, limits=limits)
+    start_time = time.time()
+    started = time.monotonic()
+    try:
+        process.start()
+    except Exception as e:
+        print(f"Ошибка при запуске скрипта: {e}", file=sys.stderr)
+        return 1
+    writer = OutputWriter(use_color(args.color))
+    # В лог запуска текст попадает без ANSI последовательностей
+    log = open_log_store(registry).open_run(script_path, " ".join(args.script_args))
+    log_parser = SGRParser(colored=False)
+    try:
+        for chunk in process.iter_output():
+            writer.write(chunk)
+            log.write("".join(segment for segment, _ in log_parser.feed(chunk)))
+    except KeyboardInterrupt:
+        process.terminate()
+        log.exit_code = 130
+        log.close()
+        return 130
+    log.exit_code = process.returncode
+    log.close()
+    if process.timed_out:
+        print(
+            f"Превышено время выполнения ({limits.timeout} с), скрипт остановлен.",
+            file=sys.stderr,
+        )
+    RunHistory().append(
+        make_record(
+            script_path,
+            start_time,
+            time.monotonic() - started,
+            process.returncode,
+            process.usage,
+        )
+    )
+    return process.returncode
+
+
+def read_batch_lines(file_name):
+    """Строки аргументов пакета без пустых строк и комментариев."""
+    if file_name == "-":
+        content = sys.stdin.read()
+    else:
+        with open(file_name, "r", encoding="utf-8") as f:
+            content = f.read()
+    lines = [line.strip() for line in content.splitlines()]
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def command_batch(registry, args):
+    """Пакетный запуск скрипта; возвращает 0, если все запуски успешны."""
+    script_path = registry.find(args.script)
+    resolver = InterpreterResolver(
+        registry.config_manager.config.get("script_settings", {})
+    )
+    items = []
+    for number, line in enumerate(read_batch_lines(args.file), start=1):
+        try:
+            command = build_command(script_path, split_args(line), resolver)
+            items.append((line, command))
+        except ValueError as ve:
+            print(f"Не удалось разобрать строку {number}: {ve}", file=sys.stderr)
+            return 2
+    if not items:
+        print("Нет строк аргументов для запуска.", file=sys.stderr)
+        return 2
+
+    colored = use_color(args.color)
+    pool = None
+    if registry.config_manager.config.get("execution_mode") == "warm":
+        # Короткие запуски пакета выигрывают от готовых интерпретаторов
+        pool = WarmPool(
+            registry.config_manager.config.get(
+                "warm_pool_size", DEFAULT_WARM_POOL_SIZE
+            )
+        )
+    manager = JobManager(
+        args.jobs,
+        log_store=open_log_store(registry),
+        pool=pool,
+        history=RunHistory(),
+    )
+    # Вывод задач в памяти не нужен: он сразу печатается с префиксом задачи
+    batch = manager.submit_batch(
+        script_path,
+        items,
+        manager.max_concurrent,
+        max_lines=1,
+        limits=script_limits(registry, script_path, args),
+    )
+    for job in batch.jobs:
+        job.on_output = OutputWriter(colored, prefix=f"[{job.id}] ").write
+
+    try:
+        while manager.active:
+            _, changed = manager.poll()
+            for job in changed:
+                if not job.active:
+                    print(
+                        f"[{job.id}] {job.status_name}: код {job.exit_code}, "
+                        f"{job.elapsed:.2f} с ({job.args})",
+                        file=sys.stderr,
+                    )
+            time.sleep(OUTPUT_FLUSH_INTERVAL_MS / 1000)
+    except KeyboardInterrupt:
+        manager.shutdown()
+        return 130
+
+    if pool is not None:
+        pool.shutdown()
+    print(batch.summary(), file=sys.stderr)
+    return 0 if all(job.status == Job.FINISHED for job in batch.jobs) else 1
+
+
+def command_history(registry, args):
+    """Сводка истории запусков: перцентили времени и ресурсов по скриптам."""
+    summary = RunHistory.summarize(RunHistory().load())
+    if args.script:
+        script_path = registry.find(args.script)
+        summary = [row for row in summary if row["script"] == script_path]
+    if not summary:
+        print("История запусков пуста.")
+        return 0
+
+    def seconds(value):
+        return "" if value is None else f"{value:.2f}"
+
+    print(
+        f"{'Скрипт':<28}{'запусков':>9}{'ошибок':>8}{'p50, с':>9}{'p90, с':>9}"
+        f"{'p99, с':>9}{'ЦП p50':>9}{'память p50':>13}"
+    )
+    for row in summary:
+        print(
+            f"{os.path.basename(row['script']):<28}{row['runs']:>9}"
+            f"{row['failed']:>8}{seconds(row['wall_p50']):>9}"
+            f"{seconds(row['wall_p90']):>9}{seconds(row['wall_p99']):>9}"
+            f"{seconds(row['cpu_p50']):>9}{format_bytes(row['rss_p50']):>13}"
+        )
+    return 0
+
+
+def command_logs(registry, args):
+    """Список сохранённых логов, поиск по ним или вывод лога одного запуска."""
+    store = open_log_store(registry)
+    if args.show:
+        info = store.get(args.show)
+        if info is None:
+            print(f"Запуск {args.show} не найден в логах.", file=sys.stderr)
+            return 2
+        for text in store.iter_text(info):
+            sys.stdout.write(text)
+        return 0
+
+    runs = store.runs()
+    if args.script:
+        script_path = registry.find(args.script)
+        runs = [info for info in runs if info.script_path == script_path]
+    if not args.query:
+        for info in runs:
+            started = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(info.start_time)
+            )
+            code = "" if info.exit_code is None else info.exit_code
+            print(f"{info.run_id}  {started}  {info.name}  строк: {info.lines}  {code}")
+        return 0
+
+    try:
+        pattern = store.compile(
+            args.query, regex=args.regex, ignore_case=not args.case_sensitive
+        )
+    except re.error as e:
+        print(f"Некорректное выражение: {e}", file=sys.stderr)
+        return 2
+    found = 0
+    for info, line, text in store.search(pattern, runs):
+        print(f"{info.run_id}:{line + 1}: {text}")
+        found += 1
+    return 0 if found else 1
+
+
+def print_timeline(run, width=40):
+    """Шаги конвейера с полосами времени выполнения."""
+    rows = run.timeline()
+    total = max([row["end"] or 0 for row in rows] + [run.elapsed, 0.001])
+    name_width = max(len(row["name"]) for row in rows)
+    for row in rows:
+        start, end = row["start"], row["end"]
+        if start is None:
+            bar = ""
+            timing = ""
+        else:
+            end = run.elapsed if end is None else end
+            offset = int(start / total * width)
+            length = max(1, int(round((end - start) / total * width)))
+            bar = " " * offset + ("·" if end == start else "█" * length)
+            timing = f"+{start:.1f} с, {end - start:.1f} с"
+        status = PipelineRun.STATUS_NAMES[row["status"]]
+        if row["error"]:
+            status += f" ({row['error']})"
+        print(
+            f"{row['name']:<{name_width}}  |{bar:<{width}}|  {timing:<18}  {status}",
+            file=sys.stderr,
+        )
+
+
+def command_pipeline(registry, args):
+    """Запуск конвейера из конфигурации; возвращает 0, если все шаги успешны."""
+    pipelines = registry.config_manager.config.get("pipelines", {})
+    if not args.name:
+        if not pipelines:
+            print("В конфигурации нет конвейеров (ключ pipelines).")
+        for name, steps in pipelines.items():
+            names = [str(step.get("name") or step.get("script")) for step in steps]
+            print(f"{name}: {', '.join(names)}")
+        return 0
+    if args.name not in pipelines:
+        print(f"Конвейер '{args.name}' не найден в конфигурации.", file=sys.stderr)
+        return 2
+    try:
+        pipeline = Pipeline.from_config(args.name, pipelines[args.name], registry.find)
+    except ValueError as ve:
+        print(ve, file=sys.stderr)
+        return 2
+
+    resolver = InterpreterResolver(
+        registry.config_manager.config.get("script_settings", {})
+    )
+
+    def prepare(step):
+        command = build_command(step.script_path, split_args(step.args), resolver)
+        limits = script_limits(registry, step.script_path, args)
+        # Вывод шагов сразу печатается, в памяти он не нужен
+        return command, {"max_lines": 1, "limits": limits}
+
+    colored = use_color(args.color)
+
+    def on_job(step, job):
+        job.on_output = OutputWriter(colored, prefix=f"[{step.name}] ").write
+
+    manager = JobManager(
+        args.jobs, log_store=open_log_store(registry), history=RunHistory()
+    )
+    run = manager.submit_pipeline(
+        pipeline, prepare, PipelineState(), args.force, on_job
+    )
+    try:
+        while manager.active:
+            _, changed = manager.poll()
+            for job in changed:
+                if not job.active:
+                    print(
+                        f"[{run.step_name(job)}] {job.status_name}: "
+                        f"код {job.exit_code}, {job.elapsed:.2f} с",
+                        file=sys.stderr,
+                    )
+            time.sleep(OUTPUT_FLUSH_INTERVAL_MS / 1000)
+    except KeyboardInterrupt:
+        manager.shutdown()
+        return 130
+
+    print_timeline(run)
+    print(run.summary(), file=sys.stderr)
+    return 0 if run.succeeded else 1
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Запуск зарегистрированных скриптов без GUI."
+    )
+    parser.add_argument(
+        "--config", default="config.json", help="Путь к файлу конфигурации."
+    )
+    parser.add_argument(
+        "--color",
+        choices=("auto", "always", "never"),
+        default="auto",
+        help="Сохранять ANSI цвета в выводе (auto — только для терминала).",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="Список зарегистрированных скриптов.")
+
+    run_parser = subparsers.add_parser(
+        "run",
+        help="Запуск скрипта.",
+        usage="%(prog)s [--timeout СЕКУНДЫ] SCRIPT [АРГУМЕНТЫ...]",
+        epilog=(
+            "Параметры запуска указываются до SCRIPT: все аргументы после него, "
+            "включая --timeout, передаются скрипту."
+        ),
+    )
+    run_parser.add_argument(
+        "script", metavar="SCRIPT", help="Путь, номер или имя скрипта."
+    )
+    run_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        metavar="СЕКУНДЫ",
+        help="Ограничение времени выполнения в секундах.",
+    )
+    run_parser.add_argument(
+        "script_args",
+        nargs=argparse.REMAINDER,
+        metavar="АРГУМЕНТЫ",
+        help="Аргументы скрипта (всё после SCRIPT).",
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Запуск скрипта с каждой строкой аргументов из файла."
+    )
+    batch_parser.add_argument("script", help="Путь, номер или имя скрипта.")
+    batch_parser.add_argument(
+        "--file", default="-", help="Файл со строками аргументов (- для stdin)."
+    )
+    batch_parser.add_argument(
+        "--jobs", type=int, default=None, help="Число параллельных процессов."
+    )
+    batch_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Ограничение времени выполнения каждого запуска в секундах.",
+    )
+
+    history_parser = subparsers.add_parser(
+        "history", help="Сводка по истории запусков."
+    )
+    history_parser.add_argument(
+        "script", nargs="?", help="Путь, номер или имя скрипта (по умолчанию все)."
+    )
+
+    logs_parser = subparsers.add_parser(
+        "logs", help="Сохранённые логи запусков и поиск по ним."
+    )
+    logs_parser.add_argument(
+        "query", nargs="?", help="Искомый текст (без него — список запусков)."
+    )
+    logs_parser.add_argument(
+        "--regex", action="store_true", help="Запрос — регулярное выражение."
+    )
+    logs_parser.add_argument(
+        "--case-sensitive", action="store_true", help="Учитывать регистр."
+    )
+    logs_parser.add_argument("--script", help="Только запуски этого скрипта.")
+    logs_parser.add_argument("--show", metavar="ЗАПУСК", help="Вывести лог запуска.")
+
+    pipeline_parser = subparsers.add_parser(
+        "pipeline", help="Запуск конвейера скриптов из конфигурации."
+    )
+    pipeline_parser.add_argument(
+        "name", nargs="?", help="Название конвейера (без него — список конвейеров)."
+    )
+    pipeline_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Выполнить все шаги, даже если их входные данные не изменились.",
+    )
+    pipeline_parser.add_argument(
+        "--jobs", type=int, default=None, help="Число параллельных процессов."
+    )
+    pipeline_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Ограничение времени выполнения каждого шага в секундах.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    registry = ScriptRegistry(ConfigManager(args.config))
+    commands = {
+        "list": command_list,
+        "run": command_run,
+        "batch": command_batch,
+        "history": command_history,
+        "logs": command_logs,
+        "pipeline": command_pipeline,
+    }
+    try:
+        return commands[args.command](registry, args)
+    except LookupError as e:
+        print(e, file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
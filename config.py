@@ -1,13 +1,56 @@
 # config.py
 
+import atexit
+import itertools
 import json
 import os
+import threading
+import time
+
+from constants import CONFIG_SAVE_DELAY_MS
 
 
 class ConfigManager:
-    def __init__(self, config_file="config.json"):
+    """
+    Конфигурация приложения в JSON файле с отложенной записью.
+
+    update() меняет конфигурацию в памяти и откладывает запись: серия
+    изменений в течение save_delay секунд сохраняется одной записью из
+    фонового потока. Интерфейс меняет self.config на месте, поэтому
+    конфигурация сериализуется только в его потоке: с планировщиком
+    scheduler(ms, callback) (в GUI — root.after) один раз после паузы в
+    изменениях, без него — при каждом update(). Фоновый поток получает
+    готовую строку с номером снимка и не записывает снимок старше уже
+    записанного. Запись атомарная (временный файл, fsync, rename) и
+    пропускается, если содержимое файла не изменилось бы. flush() сохраняет
+    немедленно и вызывается также при выходе из программы.
+    """
+
+    def __init__(
+        self,
+        config_file="config.json",
+        save_delay=CONFIG_SAVE_DELAY_MS / 1000,
+        scheduler=None,
+    ):
         self.config_file = config_file
         self.config = self.load_config()
+        self.save_delay = save_delay
+        self.scheduler = scheduler
+        self._last_saved = self._serialize()
+        self._cond = threading.Condition()
+        # Момент, после которого отложенные изменения нужно записать
+        self._deadline = None
+        # (номер снимка, сериализованная конфигурация), ожидающие записи
+        self._pending = None
+        self._snapshots = itertools.count(1)
+        self._written_snapshot = 0
+        self._writer = None
+        # Время последнего изменения и взведённый таймер планировщика
+        self._changed = None
+        self._timer_armed = False
+        # Запись из фонового потока и из flush() не должна пересекаться
+        self._write_lock = threading.Lock()
+        atexit.register(self.flush)
 
     def load_config(self):
         """Загрузка конфигурации из JSON файла."""
@@ -18,11 +61,105 @@ class ConfigManager:
             return {}
 
     def save_config(self):
-        """Сохранение текущей конфигурации в JSON файл."""
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(self.config, f, indent=4, ensure_ascii=False)
+        """Немедленное сохранение текущей конфигурации в JSON файл."""
+        self.flush()
 
     def update(self, key, value):
-        """Обновление ключа конфигурации новым значением и сохранение."""
+        """Обновление ключа конфигурации новым значением и отложенное сохранение."""
         self.config[key] = value
-        self.save_config()
+        self.schedule_save()
+
+    def schedule_save(self):
+        """Перенос срока записи: сохранение произойдёт после паузы в изменениях."""
+        if self.scheduler is None:
+            self._submit(self._serialize(), self.save_delay)
+            return
+        self._changed = time.monotonic()
+        if not self._timer_armed:
+            self._timer_armed = True
+            self.scheduler(int(self.save_delay * 1000), self._on_timer)
+
+    def _on_timer(self):
+        """Таймер планировщика: сериализация, если изменения прекратились."""
+        quiet = time.monotonic() - self._changed
+        if quiet < self.save_delay:
+            delay_ms = int((self.save_delay - quiet) * 1000) + 1
+            self.scheduler(delay_ms, self._on_timer)
+            return
+        self._timer_armed = False
+        self._submit(self._serialize(), 0)
+
+    def _submit(self, data, delay):
+        """Передача снимка фоновому потоку с записью через delay секунд."""
+        with self._cond:
+            self._pending = (next(self._snapshots), data)
+            self._deadline = time.monotonic() + delay
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_behind, daemon=True
+                )
+                self._writer.start()
+            self._cond.notify()
+
+    def flush(self):
+        """Немедленная запись отложенных изменений."""
+        with self._cond:
+            self._deadline = None
+            self._pending = None
+            snapshot = next(self._snapshots)
+            data = self._serialize()
+        self._write(snapshot, data)
+
+    def _write_behind(self):
+        """Фоновый поток: запись после истечения срока без новых изменений."""
+        try:
+            while True:
+                with self._cond:
+                    while self._deadline is None:
+                        self._cond.wait()
+                    remaining = self._deadline - time.monotonic()
+                    while remaining > 0:
+                        self._cond.wait(remaining)
+                        if self._deadline is None:
+                            break
+                        remaining = self._deadline - time.monotonic()
+                    if self._deadline is None:
+                        # Изменения уже записаны через flush()
+                        continue
+                    self._deadline = None
+                    (snapshot, data), self._pending = self._pending, None
+                try:
+                    self._write(snapshot, data)
+                except Exception as e:
+                    # Одна неудачная запись не должна останавливать сохранение
+                    print(
+                        f"Ошибка при сохранении конфигурации в {self.config_file}: {e}"
+                    )
+        finally:
+            # Следующий schedule_save() запустит новый поток
+            with self._cond:
+                self._writer = None
+
+    def _serialize(self):
+        return json.dumps(self.config, indent=4, ensure_ascii=False)
+
+    def _write(self, snapshot, data):
+        """Атомарная запись, если снимок новее записанного и содержимое отличается."""
+        with self._write_lock:
+            # flush() мог записать более новый снимок, пока этот ждал блокировки
+            if snapshot <= self._written_snapshot:
+                return
+            self._written_snapshot = snapshot
+            if data == self._last_saved:
+                return
+            tmp_file = f"{self.config_file}.tmp"
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.config_file)
+            except OSError as e:
+                print(f"Ошибка при сохранении конфигурации в {self.config_file}: {e}")
+                return
+            self._last_saved = data
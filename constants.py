@@ -7,6 +7,7 @@ DEFAULT_HOTKEYS = {
     "add_script": "Control-w",
     "run_script": "Control-e",
     "delete_script": "Control-d",
+    "find_output": "Control-f",
 }
 DEFAULT_COLORED_OUTPUT = True
 
@@ -28,3 +29,66 @@ ANSI_COLOR_MAP = {
     "96": "#66FFFF",  # light cyan
     "97": "#FFFFFF",  # bright white
 }
+
+# Потоковый вывод скриптов
+OUTPUT_CHUNK_SIZE = 64 * 1024  # байт за одно чтение из pipe
+OUTPUT_QUEUE_MAX_CHUNKS = 256  # кусков в очереди до приостановки чтения
+OUTPUT_FLUSH_INTERVAL_MS = 40  # период переноса вывода в текстовое поле
+OUTPUT_MAX_CHARS_PER_FLUSH = 256 * 1024  # символов за один кадр
+
+# Консоль вывода
+DEFAULT_OUTPUT_MAX_LINES = 100000  # строк в кольцевом буфере
+DEFAULT_OUTPUT_LOG_DIR = "logs"  # каталог для полных логов запусков
+DEFAULT_LOG_COMPRESSION = "gz"  # сжатие кадров логов: "gz" или "zst"
+LOG_FRAME_SIZE = 256 * 1024  # символов вывода в одном сжатом кадре лога
+LOG_SEARCH_POLL_MS = 100  # период приёма результатов поиска по логам
+LOG_SEARCH_MAX_RESULTS = 5000  # совпадений, после которых поиск прекращается
+OUTPUT_RENDER_MARGIN = 300  # строк, отрисовываемых сверх видимой области
+OUTPUT_SEARCH_CHUNK_LINES = 20000  # строк, проверяемых поиском за один шаг
+OUTPUT_SEARCH_DELAY_MS = 150  # пауза после ввода запроса перед поиском
+# Фильтры строк консоли вывода: название -> выражение (None — все строки,
+# "" — строки с совпадениями текущего поиска)
+OUTPUT_FILTERS = {
+    "Все строки": None,
+    "ERROR и WARNING": r"\b(?:ERROR|WARNING|WARN|CRITICAL|FATAL)\b|^Traceback",
+    "Только ERROR": r"\b(?:ERROR|CRITICAL|FATAL)\b|^Traceback",
+    "Совпадения поиска": "",
+}
+ANSI_TAG_POOL_SIZE = 256  # максимум одновременно существующих тегов стилей
+# Сколько самых давних тегов проверяется при вытеснении одного тега
+ANSI_TAG_EVICTION_SCAN = 8
+
+# Задачи
+JOBS_TABLE_REFRESH_MS = 500  # период обновления времени выполнения в таблице
+DEFAULT_EXECUTION_MODE = "cold"  # "cold" — новый процесс, "warm" — пул воркеров
+DEFAULT_WARM_POOL_SIZE = 2  # простаивающих интерпретаторов в пуле
+RUN_HISTORY_FILE = "run_history.jsonl"  # время и ресурсы каждого запуска
+HISTORY_VIEW_MAX_RUNS = 1000  # запусков скрипта в таблице истории
+STOP_GRACE_PERIOD_MS = 3000  # от SIGTERM до SIGKILL при остановке скрипта
+
+# Конвейеры
+PIPELINE_STATE_FILE = "pipeline_state.json"  # отпечатки выполненных шагов
+PIPELINE_OUTPUT_DIR = "pipeline_outputs"  # вывод шагов для stdin_from
+
+# Интерпретаторы
+VENV_DIR_NAMES = (".venv", "venv")  # каталоги виртуальных окружений
+VENV_SEARCH_DEPTH = 3  # родительских каталогов для поиска окружения
+INTERPRETER_FLAG_PRESETS = ("-I", "-S", "-O", "-X frozen_modules=on")
+
+# Быстрый старт
+STARTUP_PROBE_ENV = "SCRIPT_RUNNER_STARTUP_PROBE"  # выход сразу после первого кадра
+STARTUP_PROBE_MARKER = "SCRIPT_RUNNER_FIRST_FRAME"
+
+# Список скриптов
+SCRIPT_VALIDATION_WORKERS = 16  # потоков для проверки файлов при запуске
+SCRIPT_VALIDATION_POLL_MS = 50  # период приёма результатов проверки
+METADATA_CACHE_FILE = "metadata_cache.json"  # docstring и аргументы скриптов
+METADATA_POLL_MS = 100  # период приёма метаданных из фонового потока
+LIBRARY_SKIPPED_DIRS = {"__pycache__", "venv", "site-packages", "node_modules"}
+LIBRARY_SEARCH_DELAY_MS = 150  # пауза в наборе перед поиском
+WATCHER_DEBOUNCE_MS = 300  # объединение серии событий файловой системы
+WATCHER_POLL_INTERVAL_MS = 2000  # период проверки файлов без inotify
+WATCHER_EVENTS_POLL_MS = 250  # период приёма изменений в GUI
+
+# Конфигурация
+CONFIG_SAVE_DELAY_MS = 500  # пауза в изменениях перед записью config.json
@@ -2,3 +2,9 @@
 
 from .hotkeys_dialog import HotkeysDialog
 from .output_settings_dialog import OutputSettingsDialog
+from .batch_dialog import BatchDialog
+from .script_settings_dialog import ScriptSettingsDialog
+from .history_dialog import HistoryDialog
+from .limits_dialog import LimitsDialog
+from .log_search_dialog import LogSearchDialog
+from .pipeline_dialog import PipelineDialog, PipelineTimelineDialog
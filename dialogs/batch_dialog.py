@@ -0,0 +1,128 @@
+# dialogs/batch_dialog.py
+
+import os
+import tkinter as tk
+from tkinter import filedialog, messagebox
+import ttkbootstrap as ttkb
+from ttkbootstrap.constants import *
+from utils import center_window
+
+
+class BatchDialog:
+    def __init__(self, parent, script_name, max_workers, save_callback):
+        self.top = tk.Toplevel(parent)
+        self.top.title("Пакетный запуск")
+        self.top.grab_set()  # Сделать окно модальным
+
+        self.save_callback = save_callback
+
+        # Заголовок
+        header = ttkb.Label(
+            self.top,
+            text=f"Пакетный запуск: {script_name}",
+            font=("TkDefaultFont", 14, "bold"),
+        )
+        header.pack(pady=10)
+
+        hint = ttkb.Label(
+            self.top,
+            text="Одна строка — один запуск скрипта с указанными аргументами.\n"
+            "Пустые строки и строки, начинающиеся с #, пропускаются.",
+            justify=tk.LEFT,
+        )
+        hint.pack(padx=10, anchor=tk.W)
+
+        # Поле для строк аргументов
+        text_frame = ttkb.Frame(self.top, padding="10")
+        text_frame.pack(fill=tk.BOTH, expand=True)
+
+        self.args_text = tk.Text(text_frame, width=70, height=15, wrap=tk.NONE)
+        self.args_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        args_scrollbar = ttkb.Scrollbar(
+            text_frame, orient=tk.VERTICAL, command=self.args_text.yview
+        )
+        args_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.args_text.config(yscrollcommand=args_scrollbar.set)
+
+        # Количество параллельных процессов
+        workers_row = ttkb.Frame(self.top, padding=(10, 0))
+        workers_row.pack(fill=tk.X)
+        workers_label = ttkb.Label(workers_row, text="Параллельных процессов:")
+        workers_label.pack(side=tk.LEFT)
+        self.workers_var = tk.IntVar(value=max_workers)
+        workers_spinbox = ttkb.Spinbox(
+            workers_row,
+            from_=1,
+            to=max(64, max_workers),
+            textvariable=self.workers_var,
+            width=5,
+        )
+        workers_spinbox.pack(side=tk.LEFT, padx=(5, 0))
+
+        # Кнопки
+        buttons_frame = ttkb.Frame(self.top, padding="10")
+        buttons_frame.pack(fill=tk.X)
+
+        load_button = ttkb.Button(
+            buttons_frame, text="Загрузить из файла", command=self.load_from_file
+        )
+        load_button.pack(side=tk.LEFT, padx=5)
+
+        run_button = ttkb.Button(buttons_frame, text="Запустить", command=self.save)
+        run_button.pack(side=tk.RIGHT, padx=5)
+
+        cancel_button = ttkb.Button(
+            buttons_frame, text="Отмена", command=self.top.destroy
+        )
+        cancel_button.pack(side=tk.RIGHT, padx=5)
+
+        # Центрирование окна
+        center_window(self.top, parent)
+
+    def load_from_file(self):
+        """Загрузка строк аргументов из текстового файла."""
+        file_path = filedialog.askopenfilename(
+            parent=self.top,
+            title="Выберите файл с аргументами",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+            initialdir=os.getcwd(),
+        )
+        if not file_path:
+            return
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except Exception as e:
+            messagebox.showerror(
+                "Ошибка", f"Не удалось прочитать файл: {e}", parent=self.top
+            )
+            return
+        self.args_text.delete("1.0", tk.END)
+        self.args_text.insert("1.0", content)
+
+    def save(self):
+        """Передача строк аргументов и числа процессов для запуска."""
+        lines = [
+            line.strip()
+            for line in self.args_text.get("1.0", tk.END).splitlines()
+            if line.strip() and not line.strip().startswith("#")
+        ]
+        if not lines:
+            messagebox.showerror(
+                "Ошибка", "Укажите хотя бы одну строку аргументов.", parent=self.top
+            )
+            return
+        try:
+            workers = int(self.workers_var.get())
+            if workers <= 0:
+                raise ValueError
+        except (ValueError, tk.TclError):
+            messagebox.showerror(
+                "Ошибка",
+                "Число процессов должно быть положительным целым числом.",
+                parent=self.top,
+            )
+            return
+        if self.save_callback(lines, workers):
+            self.top.destroy()
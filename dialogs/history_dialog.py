@@ -0,0 +1,175 @@
+# dialogs/history_dialog.py
+
+import os
+import time
+import tkinter as tk
+import ttkbootstrap as ttkb
+from ttkbootstrap.constants import *
+from constants import HISTORY_VIEW_MAX_RUNS
+from run_history import RunHistory, format_bytes
+from utils import center_window
+
+
+def format_seconds(value):
+    return "" if value is None else f"{value:.2f}"
+
+
+class SortableTable:
+    """Таблица Treeview со строками-словарями и сортировкой по щелчку на заголовке."""
+
+    def __init__(self, parent, columns, height=8):
+        """
+        Args:
+            parent: Родительский виджет.
+            columns: Кортежи (ключ, заголовок, ширина, форматирование значения).
+            height (int): Число видимых строк.
+        """
+        self.columns = columns
+        self.rows = []
+        self.sort_key = None
+        self.descending = False
+
+        frame = ttkb.Frame(parent)
+        frame.pack(fill=BOTH, expand=True, padx=10, pady=5)
+        self.table = ttkb.Treeview(
+            frame,
+            columns=[key for key, _, _, _ in columns],
+            show="headings",
+            selectmode="browse",
+            height=height,
+        )
+        for key, heading, width, _ in columns:
+            self.table.heading(key, text=heading, command=lambda k=key: self.sort(k))
+            self.table.column(key, width=width, stretch=key == columns[0][0])
+        self.table.pack(side=LEFT, fill=BOTH, expand=True)
+        scrollbar = ttkb.Scrollbar(
+            frame, orient=VERTICAL, command=self.table.yview, bootstyle="primary-round"
+        )
+        scrollbar.pack(side=RIGHT, fill=Y)
+        self.table.config(yscrollcommand=scrollbar.set)
+
+    def set_rows(self, rows):
+        self.rows = list(rows)
+        self.render()
+
+    def selected_row(self):
+        selection = self.table.selection()
+        return self.rows[int(selection[0])] if selection else None
+
+    def sort(self, key):
+        """Сортировка по столбцу; повторный щелчок меняет направление."""
+        self.descending = not self.descending if self.sort_key == key else False
+        self.sort_key = key
+        self.render()
+
+    def render(self):
+        if self.sort_key is not None:
+            key = self.sort_key
+            present = [row for row in self.rows if row.get(key) is not None]
+            missing = [row for row in self.rows if row.get(key) is None]
+            present.sort(key=lambda row: row[key], reverse=self.descending)
+            # Строки без значения всегда в конце
+            self.rows = present + missing
+        self.table.delete(*self.table.get_children())
+        for index, row in enumerate(self.rows):
+            values = [fmt(row.get(key)) for key, _, _, fmt in self.columns]
+            self.table.insert("", END, iid=str(index), values=values)
+
+
+class HistoryDialog:
+    SUMMARY_COLUMNS = (
+        ("script", "Скрипт", 180, os.path.basename),
+        ("runs", "Запусков", 70, str),
+        ("failed", "Ошибок", 60, str),
+        ("wall_p50", "p50, с", 70, format_seconds),
+        ("wall_p90", "p90, с", 70, format_seconds),
+        ("wall_p99", "p99, с", 70, format_seconds),
+        ("cpu_p50", "ЦП p50, с", 80, format_seconds),
+        ("cpu_p90", "ЦП p90, с", 80, format_seconds),
+        ("rss_p50", "Память p50", 90, format_bytes),
+        ("rss_max", "Память макс.", 90, format_bytes),
+    )
+    RUN_COLUMNS = (
+        (
+            "start",
+            "Начало",
+            150,
+            lambda t: time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t)),
+        ),
+        ("wall", "Время, с", 80, format_seconds),
+        ("user", "user, с", 70, format_seconds),
+        ("sys", "sys, с", 70, format_seconds),
+        ("rss", "Память", 90, format_bytes),
+        ("disk_read", "С диска", 90, format_bytes),
+        ("disk_write", "На диск", 90, format_bytes),
+        ("code", "Код", 50, lambda code: "" if code is None else str(code)),
+    )
+
+    def __init__(self, parent, history, script_path=None):
+        """
+        Диалог истории запусков: сводка по скриптам и запуски выбранного скрипта.
+
+        Args:
+            parent: Родительское окно.
+            history (run_history.RunHistory): История запусков.
+            script_path (str, optional): Скрипт, выбранный при открытии.
+        """
+        self.top = tk.Toplevel(parent)
+        self.top.title("История Запусков")
+
+        self.records = history.load()
+
+        # Заголовок
+        header = ttkb.Label(
+            self.top,
+            text="История Запусков",
+            font=("TkDefaultFont", 14, "bold"),
+        )
+        header.pack(pady=10)
+
+        ttkb.Label(
+            self.top,
+            text=f"Всего запусков: {len(self.records)}. "
+            "Щелчок по заголовку столбца сортирует таблицу.",
+            anchor=tk.W,
+        ).pack(fill=X, padx=10)
+
+        self.summary = SortableTable(self.top, self.SUMMARY_COLUMNS)
+        self.summary.table.bind("<<TreeviewSelect>>", self.show_runs)
+
+        self.runs_label = ttkb.Label(self.top, text="", anchor=tk.W)
+        self.runs_label.pack(fill=X, padx=10)
+        self.runs = SortableTable(self.top, self.RUN_COLUMNS, height=12)
+
+        # Кнопка "Закрыть"
+        buttons_frame = ttkb.Frame(self.top, padding="10")
+        buttons_frame.pack(fill=X)
+        close_button = ttkb.Button(
+            buttons_frame, text="Закрыть", command=self.top.destroy
+        )
+        close_button.pack(side=RIGHT, padx=5)
+
+        self.summary.set_rows(RunHistory.summarize(self.records))
+        for index, row in enumerate(self.summary.rows):
+            if row["script"] == script_path:
+                self.summary.table.selection_set(str(index))
+                self.summary.table.see(str(index))
+                break
+
+        # Центрирование окна
+        center_window(self.top, parent)
+
+    def show_runs(self, event=None):
+        """Заполнение таблицы запусков скрипта, выбранного в сводке."""
+        row = self.summary.selected_row()
+        if row is None:
+            return
+        runs = [r for r in self.records if r["script"] == row["script"]]
+        # Последние запуски первыми; в таблицу попадают только самые свежие
+        runs = runs[::-1][:HISTORY_VIEW_MAX_RUNS]
+        shown = f"последние {len(runs)} из {row['runs']}"
+        self.runs_label.config(
+            text=f"Запуски {os.path.basename(row['script'])} ({shown}):"
+        )
+        self.runs.sort_key = None
+        self.runs.set_rows(runs)
@@ -69,6 +69,7 @@ class HotkeysDialog:
             "add_script": "Добавить Скрипт",
             "run_script": "Запустить Скрипт",
             "delete_script": "Удалить Скрипт",
+            "find_output": "Поиск в Выводе",
         }
         return names.get(action, action)
 
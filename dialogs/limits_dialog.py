@@ -0,0 +1,142 @@
+# dialogs/limits_dialog.py
+
+import tkinter as tk
+from tkinter import messagebox
+import ttkbootstrap as ttkb
+from ttkbootstrap.constants import *
+from utils import center_window
+
+
+class LimitsForm:
+    """Поля ограничений запуска (см. limits.Limits) внутри родительского окна."""
+
+    # Поле, подпись, преобразование введённого текста
+    FIELDS = (
+        ("timeout", "Время выполнения, с:", float),
+        ("cpu", "Процессорное время, с:", int),
+        ("memory", "Память (адресное пространство), МБ:", int),
+        ("nice", "Понижение приоритета nice (0–19):", int),
+    )
+    IONICE_CHOICES = ("", "idle", "low")
+
+    def __init__(self, parent, limits):
+        """
+        Args:
+            parent: Родительский виджет.
+            limits (dict): Текущие значения; отсутствующие поля остаются пустыми.
+        """
+        self.frame = ttkb.Frame(parent, padding=(10, 0))
+        self.entries = {}
+        for row, (field, label, _) in enumerate(self.FIELDS):
+            ttkb.Label(self.frame, text=label, anchor=tk.W).grid(
+                row=row, column=0, sticky=tk.W, pady=2
+            )
+            entry = ttkb.Entry(self.frame, width=12)
+            entry.grid(row=row, column=1, sticky=tk.W, padx=(5, 0), pady=2)
+            value = limits.get(field)
+            if value is not None:
+                entry.insert(0, str(value))
+            self.entries[field] = entry
+
+        ttkb.Label(self.frame, text="Класс ввода-вывода ionice:", anchor=tk.W).grid(
+            row=len(self.FIELDS), column=0, sticky=tk.W, pady=2
+        )
+        self.ionice_var = tk.StringVar(value=limits.get("ionice") or "")
+        ttkb.Combobox(
+            self.frame,
+            textvariable=self.ionice_var,
+            values=self.IONICE_CHOICES,
+            state="readonly",
+            width=10,
+        ).grid(row=len(self.FIELDS), column=1, sticky=tk.W, padx=(5, 0), pady=2)
+
+    def get(self):
+        """
+        Введённые ограничения.
+
+        Returns:
+            dict: Заданные поля (пустые поля не включаются).
+
+        Raises:
+            ValueError: С описанием ошибки, если значение некорректно.
+        """
+        limits = {}
+        for field, label, convert in self.FIELDS:
+            text = self.entries[field].get().strip()
+            if not text:
+                continue
+            try:
+                value = convert(text)
+            except ValueError:
+                raise ValueError(f"{label.rstrip(':')}: ожидается число.")
+            if field == "nice":
+                if not 0 <= value <= 19:
+                    raise ValueError("Приоритет nice должен быть от 0 до 19.")
+            elif value <= 0:
+                raise ValueError(f"{label.rstrip(':')}: ожидается число больше нуля.")
+            limits[field] = value
+        if self.ionice_var.get():
+            limits["ionice"] = self.ionice_var.get()
+        return limits
+
+
+class LimitsDialog:
+    def __init__(self, parent, limits, save_callback):
+        """
+        Диалог ограничений, действующих для всех скриптов по умолчанию.
+
+        Args:
+            parent: Родительское окно.
+            limits (dict): Текущие значения config["limits"].
+            save_callback: Вызывается со словарём новых ограничений.
+        """
+        self.top = tk.Toplevel(parent)
+        self.top.title("Ограничения Запуска")
+        self.top.grab_set()  # Сделать окно модальным
+
+        self.save_callback = save_callback
+
+        # Заголовок
+        header = ttkb.Label(
+            self.top,
+            text="Ограничения Запуска",
+            font=("TkDefaultFont", 14, "bold"),
+        )
+        header.pack(pady=10)
+
+        hint = ttkb.Label(
+            self.top,
+            text="Действуют для всех скриптов, если в настройках скрипта не заданы "
+            "свои. Пустое поле — без ограничения.",
+            wraplength=420,
+            anchor=tk.W,
+        )
+        hint.pack(fill=tk.X, padx=10, pady=(0, 5))
+
+        self.form = LimitsForm(self.top, limits)
+        self.form.frame.pack(fill=tk.X, pady=5)
+
+        # Кнопки "Сохранить" и "Отмена"
+        buttons_frame = ttkb.Frame(self.top, padding="10")
+        buttons_frame.pack(fill=tk.X)
+
+        save_button = ttkb.Button(buttons_frame, text="Сохранить", command=self.save)
+        save_button.pack(side=tk.RIGHT, padx=5)
+
+        cancel_button = ttkb.Button(
+            buttons_frame, text="Отмена", command=self.top.destroy
+        )
+        cancel_button.pack(side=tk.RIGHT, padx=5)
+
+        # Центрирование окна
+        center_window(self.top, parent)
+
+    def save(self):
+        """Проверка и сохранение ограничений."""
+        try:
+            limits = self.form.get()
+        except ValueError as ve:
+            messagebox.showerror("Ошибка", str(ve), parent=self.top)
+            return
+        self.save_callback(limits)
+        self.top.destroy()
@@ -0,0 +1,317 @@
+# dialogs/log_search_dialog.py
+
+import queue
+import re
+import threading
+import time
+import tkinter as tk
+from tkinter import messagebox
+import ttkbootstrap as ttkb
+from ttkbootstrap.constants import *
+from constants import LOG_SEARCH_MAX_RESULTS, LOG_SEARCH_POLL_MS
+from utils import center_window
+
+ALL_SCRIPTS = "Все скрипты"
+
+
+def format_start(timestamp):
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
+
+
+class LogViewer:
+    def __init__(self, parent, store, info, line=0):
+        """
+        Просмотр сохранённого лога запуска по фрагментам.
+
+        Распаковывается только кадр хранилища, содержащий нужную строку;
+        соседние кадры открываются кнопками.
+
+        Args:
+            parent: Родительское окно.
+            store (log_store.LogStore): Хранилище логов.
+            info (log_store.RunInfo): Запуск.
+            line (int): Номер строки (с 0), которую нужно показать.
+        """
+        self.store = store
+        self.info = info
+        self.top = tk.Toplevel(parent)
+        self.top.title(f"Лог: {info.name} ({format_start(info.start_time)})")
+
+        toolbar = ttkb.Frame(self.top, padding=(10, 10, 10, 0))
+        toolbar.pack(fill=X)
+        self.prev_button = ttkb.Button(
+            toolbar,
+            text="← Предыдущий фрагмент",
+            command=lambda: self.show_frame(self.frame - 1),
+            bootstyle=(SECONDARY, OUTLINE),
+        )
+        self.prev_button.pack(side=LEFT)
+        self.next_button = ttkb.Button(
+            toolbar,
+            text="Следующий фрагмент →",
+            command=lambda: self.show_frame(self.frame + 1),
+            bootstyle=(SECONDARY, OUTLINE),
+        )
+        self.next_button.pack(side=LEFT, padx=5)
+        self.position_label = ttkb.Label(toolbar, text="")
+        self.position_label.pack(side=LEFT, padx=5)
+
+        text_frame = ttkb.Frame(self.top, padding=10)
+        text_frame.pack(fill=BOTH, expand=True)
+        self.text = tk.Text(text_frame, wrap=NONE, width=110, height=35)
+        self.text.pack(side=LEFT, fill=BOTH, expand=True)
+        scrollbar = ttkb.Scrollbar(
+            text_frame, orient=VERTICAL, command=self.text.yview
+        )
+        scrollbar.pack(side=RIGHT, fill=Y)
+        self.text.config(yscrollcommand=scrollbar.set)
+        self.text.tag_configure("match", background="#665c00")
+
+        self.frame = None
+        if not info.frames:
+            self.position_label.config(text="Лог пуст.")
+            self.prev_button.config(state="disabled")
+            self.next_button.config(state="disabled")
+            return
+        self.show_frame(info.frame_for_line(line), line)
+
+    def show_frame(self, index, line=None):
+        """Показ кадра index с подсветкой строки line (абсолютный номер)."""
+        info = self.info
+        try:
+            content = self.store.read_frame(info, index)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Ошибка", f"Не удалось прочитать лог: {e}")
+            return
+        self.frame = index
+        first = info.frame_lines[index]
+        self.text.config(state="normal")
+        self.text.delete("1.0", END)
+        self.text.insert(END, content)
+        if line is not None:
+            row = line - first + 1
+            self.text.tag_add("match", f"{row}.0", f"{row}.end")
+            self.text.see(f"{row}.0")
+        self.text.config(state="disabled")
+        last = first + content.count("\n")
+        self.position_label.config(
+            text=f"Фрагмент {index + 1} из {len(info.frames)}, "
+            f"строки {first + 1}–{last} из {info.lines}"
+        )
+        self.prev_button.config(state="normal" if index > 0 else "disabled")
+        last_frame = index == len(info.frames) - 1
+        self.next_button.config(state="disabled" if last_frame else "normal")
+
+
+class LogSearchDialog:
+    def __init__(self, parent, store):
+        """
+        Поиск по сохранённым логам всех запусков.
+
+        Поиск выполняется в фоновом потоке и распаковывает кадры по одному,
+        поэтому результаты появляются по мере нахождения. Пустой запрос
+        показывает список запусков.
+
+        Args:
+            parent: Родительское окно.
+            store (log_store.LogStore): Хранилище логов.
+        """
+        self.parent = parent
+        self.store = store
+        self.top = tk.Toplevel(parent)
+        self.top.title("Логи Запусков")
+        self.top.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.results = queue.Queue()
+        self.cancel = None
+        self.rows = []
+        self.found = 0
+
+        # Заголовок
+        header = ttkb.Label(
+            self.top,
+            text="Поиск по Логам Запусков",
+            font=("TkDefaultFont", 14, "bold"),
+        )
+        header.pack(pady=10)
+
+        search_row = ttkb.Frame(self.top, padding=(10, 0))
+        search_row.pack(fill=X, pady=5)
+        self.query_entry = ttkb.Entry(search_row)
+        self.query_entry.pack(side=LEFT, fill=X, expand=True)
+        self.query_entry.bind("<Return>", lambda e: self.start_search())
+        self.query_entry.focus_set()
+
+        self.script_var = tk.StringVar(value=ALL_SCRIPTS)
+        self.scripts = {}
+        for info in store.runs():
+            self.scripts.setdefault(info.name, set()).add(info.script_path)
+        ttkb.Combobox(
+            search_row,
+            textvariable=self.script_var,
+            values=[ALL_SCRIPTS] + sorted(self.scripts),
+            state="readonly",
+            width=25,
+        ).pack(side=LEFT, padx=5)
+        ttkb.Button(search_row, text="Найти", command=self.start_search).pack(
+            side=LEFT
+        )
+
+        options_row = ttkb.Frame(self.top, padding=(10, 0))
+        options_row.pack(fill=X)
+        self.regex_var = tk.BooleanVar(value=False)
+        ttkb.Checkbutton(
+            options_row, text="Регулярное выражение", variable=self.regex_var
+        ).pack(side=LEFT)
+        self.case_var = tk.BooleanVar(value=False)
+        ttkb.Checkbutton(
+            options_row, text="Учитывать регистр", variable=self.case_var
+        ).pack(side=LEFT, padx=10)
+        self.status_label = ttkb.Label(options_row, text="")
+        self.status_label.pack(side=RIGHT)
+
+        table_frame = ttkb.Frame(self.top, padding=10)
+        table_frame.pack(fill=BOTH, expand=True)
+        columns = ("start", "script", "line", "text")
+        headings = ("Запуск", "Скрипт", "Строка", "Текст")
+        widths = (140, 160, 70, 500)
+        self.table = ttkb.Treeview(
+            table_frame, columns=columns, show="headings", selectmode="browse"
+        )
+        for column, heading, width in zip(columns, headings, widths):
+            self.table.heading(column, text=heading)
+            self.table.column(column, width=width, stretch=column == "text")
+        self.table.pack(side=LEFT, fill=BOTH, expand=True)
+        self.table.bind("<Double-1>", lambda e: self.open_selected())
+        scrollbar = ttkb.Scrollbar(
+            table_frame,
+            orient=VERTICAL,
+            command=self.table.yview,
+            bootstyle="primary-round",
+        )
+        scrollbar.pack(side=RIGHT, fill=Y)
+        self.table.config(yscrollcommand=scrollbar.set)
+
+        # Кнопки "Открыть лог" и "Закрыть"
+        buttons_frame = ttkb.Frame(self.top, padding="10")
+        buttons_frame.pack(fill=X)
+        ttkb.Button(buttons_frame, text="Закрыть", command=self.close).pack(
+            side=RIGHT, padx=5
+        )
+        ttkb.Button(
+            buttons_frame, text="Открыть лог", command=self.open_selected
+        ).pack(side=RIGHT, padx=5)
+
+        self.start_search()
+
+        # Центрирование окна
+        center_window(self.top, parent)
+
+    def selected_runs(self):
+        """Запуски для поиска с учётом выбранного скрипта."""
+        runs = self.store.runs()
+        name = self.script_var.get()
+        if name != ALL_SCRIPTS:
+            paths = self.scripts.get(name, set())
+            runs = [info for info in runs if info.script_path in paths]
+        return runs
+
+    def start_search(self):
+        """Запуск поиска (или показ списка запусков при пустом запросе)."""
+        self.stop_search()
+        self.table.delete(*self.table.get_children())
+        self.rows = []
+        self.found = 0
+        runs = self.selected_runs()
+        query = self.query_entry.get()
+        if not query:
+            for info in runs:
+                summary = f"{info.lines} строк"
+                if info.exit_code is not None:
+                    summary += f", код {info.exit_code}"
+                self.add_row(info, None, f"{info.args}  [{summary}]")
+            self.status_label.config(text=f"Запусков: {len(runs)}")
+            return
+        try:
+            pattern = self.store.compile(
+                query,
+                regex=self.regex_var.get(),
+                ignore_case=not self.case_var.get(),
+            )
+        except re.error as e:
+            messagebox.showerror(
+                "Ошибка", f"Некорректное выражение: {e}", parent=self.top
+            )
+            return
+        self.cancel = threading.Event()
+        self.results = queue.Queue()
+        threading.Thread(
+            target=self._search,
+            args=(pattern, runs, self.cancel, self.results),
+            daemon=True,
+        ).start()
+        self.status_label.config(text="Поиск...")
+        self.top.after(LOG_SEARCH_POLL_MS, self.poll_results, self.results)
+
+    def _search(self, pattern, runs, cancel, results):
+        """Поиск в фоновом потоке; результаты передаются через очередь."""
+        found = 0
+        for match in self.store.search(pattern, runs, cancel):
+            results.put(match)
+            found += 1
+            if found >= LOG_SEARCH_MAX_RESULTS:
+                break
+        results.put(None)
+
+    def poll_results(self, results):
+        """Перенос найденных строк в таблицу."""
+        if results is not self.results or not self.top.winfo_exists():
+            # Результаты прерванного поиска
+            return
+        while True:
+            try:
+                match = results.get_nowait()
+            except queue.Empty:
+                self.status_label.config(text=f"Поиск... найдено {self.found}")
+                self.top.after(LOG_SEARCH_POLL_MS, self.poll_results, results)
+                return
+            if match is None:
+                break
+            info, line, text = match
+            self.add_row(info, line, text)
+            self.found += 1
+        status = f"Найдено: {self.found}"
+        if self.found >= LOG_SEARCH_MAX_RESULTS:
+            status += " (показаны первые)"
+        self.status_label.config(text=status)
+
+    def add_row(self, info, line, text):
+        self.table.insert(
+            "",
+            END,
+            iid=str(len(self.rows)),
+            values=(
+                format_start(info.start_time),
+                info.name,
+                "" if line is None else line + 1,
+                text,
+            ),
+        )
+        self.rows.append((info, line))
+
+    def open_selected(self):
+        """Открытие лога выбранного запуска на найденной строке."""
+        selection = self.table.selection()
+        if not selection:
+            return
+        info, line = self.rows[int(selection[0])]
+        LogViewer(self.top, self.store, info, line or 0)
+
+    def stop_search(self):
+        if self.cancel is not None:
+            self.cancel.set()
+            self.cancel = None
+
+    def close(self):
+        self.stop_search()
+        self.top.destroy()
@@ -8,13 +8,14 @@ from utils import center_window
 
 
 class OutputSettingsDialog:
-    def __init__(self, parent, colored_output, save_callback):
+    def __init__(self, parent, colored_output, max_lines, save_callback):
         self.top = tk.Toplevel(parent)
         self.top.title("Настройки Вывода Логов")
         self.top.grab_set()  # Сделать окно модальным
 
         self.save_callback = save_callback
         self.colored_output = colored_output
+        self.max_lines = max_lines
 
         # Заголовок
         header = ttkb.Label(
@@ -33,6 +34,17 @@ class OutputSettingsDialog:
         )
         colored_checkbox.pack(pady=5, padx=10)
 
+        # Ограничение количества строк в консоли вывода
+        max_lines_row = ttkb.Frame(self.top, padding=(10, 0))
+        max_lines_row.pack(fill=tk.X, pady=5)
+        max_lines_label = ttkb.Label(
+            max_lines_row, text="Максимум строк в окне вывода:", anchor=tk.W
+        )
+        max_lines_label.pack(side=tk.LEFT)
+        self.max_lines_entry = ttkb.Entry(max_lines_row, width=10)
+        self.max_lines_entry.pack(side=tk.LEFT, padx=(5, 0))
+        self.max_lines_entry.insert(0, str(self.max_lines))
+
         # Кнопки "Сохранить" и "Отмена"
         buttons_frame = ttkb.Frame(self.top, padding="10")
         buttons_frame.pack(fill=tk.X)
@@ -51,5 +63,14 @@ class OutputSettingsDialog:
     def save(self):
         """Сохранение настроек вывода логов."""
         new_colored_output = self.colored_var.get()
-        self.save_callback(new_colored_output)
+        try:
+            new_max_lines = int(self.max_lines_entry.get().strip())
+            if new_max_lines <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror(
+                "Ошибка", "Максимум строк должен быть положительным целым числом."
+            )
+            return
+        self.save_callback(new_colored_output, new_max_lines)
         self.top.destroy()
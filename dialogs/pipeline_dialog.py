@@ -0,0 +1,225 @@
+# dialogs/pipeline_dialog.py
+
+import os
+import tkinter as tk
+from tkinter import messagebox
+import ttkbootstrap as ttkb
+from ttkbootstrap.constants import *
+from constants import JOBS_TABLE_REFRESH_MS
+from pipeline import PipelineRun
+from utils import center_window
+
+
+class PipelineDialog:
+    def __init__(self, parent, pipelines, run_callback):
+        """
+        Список конвейеров из конфигурации и запуск выбранного.
+
+        Args:
+            parent: Родительское окно.
+            pipelines (dict): config["pipelines"]: название -> список шагов.
+            run_callback: Вызывается с (название, force); возвращает True,
+                если конвейер запущен.
+        """
+        self.top = tk.Toplevel(parent)
+        self.top.title("Конвейеры")
+        self.pipelines = pipelines
+        self.run_callback = run_callback
+
+        # Заголовок
+        header = ttkb.Label(
+            self.top,
+            text="Конвейеры Скриптов",
+            font=("TkDefaultFont", 14, "bold"),
+        )
+        header.pack(pady=10)
+
+        hint = ttkb.Label(
+            self.top,
+            text="Конвейеры описываются в config.json (ключ pipelines). "
+            "Независимые шаги выполняются параллельно; шаги с inputs "
+            "пропускаются, если их входные данные не изменились.",
+            wraplength=640,
+            anchor=tk.W,
+        )
+        hint.pack(fill=X, padx=10, pady=(0, 5))
+
+        content = ttkb.Frame(self.top, padding=10)
+        content.pack(fill=BOTH, expand=True)
+
+        self.names = tk.Listbox(content, width=24, exportselection=False)
+        self.names.pack(side=LEFT, fill=Y, padx=(0, 10))
+        for name in pipelines:
+            self.names.insert(END, name)
+        self.names.bind("<<ListboxSelect>>", lambda e: self.show_steps())
+
+        columns = ("step", "script", "args", "after", "inputs")
+        headings = ("Шаг", "Скрипт", "Аргументы", "После", "Входные данные")
+        widths = (110, 150, 150, 130, 150)
+        self.steps_table = ttkb.Treeview(
+            content, columns=columns, show="headings", height=10
+        )
+        for column, heading, width in zip(columns, headings, widths):
+            self.steps_table.heading(column, text=heading)
+            self.steps_table.column(column, width=width)
+        self.steps_table.pack(side=LEFT, fill=BOTH, expand=True)
+
+        # Кнопки запуска и "Закрыть"
+        buttons_frame = ttkb.Frame(self.top, padding="10")
+        buttons_frame.pack(fill=X)
+        ttkb.Button(buttons_frame, text="Закрыть", command=self.top.destroy).pack(
+            side=RIGHT, padx=5
+        )
+        ttkb.Button(
+            buttons_frame,
+            text="Выполнить все шаги",
+            command=lambda: self.run(force=True),
+            bootstyle=(SECONDARY, OUTLINE),
+        ).pack(side=RIGHT, padx=5)
+        ttkb.Button(buttons_frame, text="Запустить", command=self.run).pack(
+            side=RIGHT, padx=5
+        )
+
+        if pipelines:
+            self.names.selection_set(0)
+            self.show_steps()
+
+        # Центрирование окна
+        center_window(self.top, parent)
+
+    def selected_name(self):
+        selection = self.names.curselection()
+        return self.names.get(selection[0]) if selection else None
+
+    def show_steps(self):
+        """Шаги выбранного конвейера в том виде, в каком они описаны."""
+        self.steps_table.delete(*self.steps_table.get_children())
+        name = self.selected_name()
+        steps = self.pipelines.get(name) if name is not None else None
+        if not isinstance(steps, list):
+            return
+        for step in steps:
+            if not isinstance(step, dict):
+                continue
+            after = step.get("after", [])
+            after = [after] if isinstance(after, str) else list(after)
+            if step.get("stdin_from"):
+                after.append(f"stdin ← {step['stdin_from']}")
+            inputs = step.get("inputs")
+            inputs = [inputs] if isinstance(inputs, str) else inputs
+            self.steps_table.insert(
+                "",
+                END,
+                values=(
+                    step.get("name")
+                    or os.path.splitext(os.path.basename(str(step.get("script"))))[0],
+                    step.get("script", ""),
+                    step.get("args", ""),
+                    ", ".join(after),
+                    "всегда выполняется" if inputs is None else ", ".join(inputs),
+                ),
+            )
+
+    def run(self, force=False):
+        name = self.selected_name()
+        if name is None:
+            messagebox.showwarning(
+                "Предупреждение", "Выберите конвейер.", parent=self.top
+            )
+            return
+        if self.run_callback(name, force):
+            self.top.destroy()
+
+
+class PipelineTimelineDialog:
+    """Ход выполнения конвейера: полоса времени каждого шага."""
+
+    ROW_HEIGHT = 26
+    NAME_WIDTH = 140
+    BAR_WIDTH = 480
+
+    def __init__(self, parent, run, stop_callback):
+        """
+        Args:
+            parent: Родительское окно.
+            run (pipeline.PipelineRun): Запуск конвейера.
+            stop_callback: Вызывается для остановки конвейера.
+        """
+        self.run = run
+        self.top = tk.Toplevel(parent)
+        self.top.title(f"Конвейер «{run.name}» #{run.id}")
+
+        self.colors = {
+            PipelineRun.WAITING: "#6c757d",
+            PipelineRun.RUNNING: "#17a2b8",
+            PipelineRun.DONE: "#28a745",
+            PipelineRun.SKIPPED: "#adb5bd",
+            PipelineRun.FAILED: "#dc3545",
+            PipelineRun.CANCELLED: "#6c757d",
+        }
+        height = self.ROW_HEIGHT * (len(run.status) + 1) + 10
+        width = self.NAME_WIDTH + self.BAR_WIDTH + 220
+        self.canvas = tk.Canvas(
+            self.top, width=width, height=height, highlightthickness=0
+        )
+        self.canvas.pack(fill=BOTH, expand=True, padx=10, pady=10)
+
+        bottom = ttkb.Frame(self.top, padding=(10, 0, 10, 10))
+        bottom.pack(fill=X)
+        self.summary_label = ttkb.Label(bottom, text="")
+        self.summary_label.pack(side=LEFT)
+        ttkb.Button(bottom, text="Закрыть", command=self.top.destroy).pack(
+            side=RIGHT, padx=5
+        )
+        self.stop_button = ttkb.Button(
+            bottom,
+            text="Остановить",
+            command=stop_callback,
+            bootstyle=(DANGER, OUTLINE),
+        )
+        self.stop_button.pack(side=RIGHT, padx=5)
+
+        self.refresh()
+        center_window(self.top, parent)
+
+    def refresh(self):
+        """Перерисовка полос; повторяется, пока конвейер выполняется."""
+        if not self.top.winfo_exists():
+            return
+        run = self.run
+        rows = run.timeline()
+        total = max([row["end"] or 0 for row in rows] + [run.elapsed, 0.001])
+        scale = self.BAR_WIDTH / total
+        fg = ttkb.Style().lookup("TLabel", "foreground")
+
+        canvas = self.canvas
+        canvas.delete("all")
+        left = self.NAME_WIDTH
+        canvas.create_text(left, 8, text="0 с", anchor=W, fill=fg)
+        canvas.create_text(
+            left + self.BAR_WIDTH, 8, text=f"{total:.1f} с", anchor=E, fill=fg
+        )
+        for index, row in enumerate(rows, start=1):
+            y = index * self.ROW_HEIGHT
+            canvas.create_text(5, y + 8, text=row["name"], anchor=W, fill=fg)
+            color = self.colors[row["status"]]
+            if row["start"] is not None:
+                end = run.elapsed if row["end"] is None else row["end"]
+                x0 = left + row["start"] * scale
+                x1 = max(x0 + 3, left + end * scale)
+                canvas.create_rectangle(x0, y, x1, y + 16, fill=color, outline="")
+            status = PipelineRun.STATUS_NAMES[row["status"]]
+            if row["start"] is not None and row["status"] != PipelineRun.SKIPPED:
+                end = run.elapsed if row["end"] is None else row["end"]
+                status += f", {end - row['start']:.1f} с"
+            if row["error"]:
+                status += f" ({row['error']})"
+            canvas.create_text(
+                left + self.BAR_WIDTH + 10, y + 8, text=status, anchor=W, fill=color
+            )
+
+        self.summary_label.config(text=run.summary())
+        if run.done:
+            self.stop_button.config(state="disabled")
+        else:
+            self.top.after(JOBS_TABLE_REFRESH_MS, self.refresh)
@@ -0,0 +1,172 @@
+# dialogs/script_settings_dialog.py
+
+import os
+import shutil
+import tkinter as tk
+from tkinter import filedialog, messagebox
+import ttkbootstrap as ttkb
+from ttkbootstrap.constants import *
+from constants import INTERPRETER_FLAG_PRESETS
+from runner import split_args
+from utils import center_window
+from .limits_dialog import LimitsForm
+
+
+class ScriptSettingsDialog:
+    def __init__(self, parent, script_name, settings, detected, save_callback):
+        """
+        Диалог выбора интерпретатора, его флагов и ограничений одного скрипта.
+
+        Args:
+            parent: Родительское окно.
+            script_name (str): Имя скрипта для заголовка.
+            settings (dict): Текущие настройки
+                {"interpreter": ..., "flags": ..., "limits": {...}}.
+            detected (str): Описание интерпретатора, выбранного автоматически.
+            save_callback: Вызывается с (интерпретатор, флаги, ограничения);
+                пустой интерпретатор означает автоматический выбор, пустые
+                ограничения — общие ограничения из настроек.
+        """
+        self.top = tk.Toplevel(parent)
+        self.top.title("Интерпретатор Скрипта")
+        self.top.grab_set()  # Сделать окно модальным
+
+        self.save_callback = save_callback
+
+        # Заголовок
+        header = ttkb.Label(
+            self.top,
+            text=f"Интерпретатор: {script_name}",
+            font=("TkDefaultFont", 14, "bold"),
+        )
+        header.pack(pady=10)
+
+        # Интерпретатор, выбранный без настройки
+        detected_label = ttkb.Label(
+            self.top,
+            text=f"Автоматически: {detected}",
+            wraplength=500,
+            anchor=tk.W,
+        )
+        detected_label.pack(fill=tk.X, padx=10, pady=(0, 5))
+
+        # Явно заданный интерпретатор
+        interpreter_row = ttkb.Frame(self.top, padding=(10, 0))
+        interpreter_row.pack(fill=tk.X, pady=5)
+        ttkb.Label(interpreter_row, text="Интерпретатор:", anchor=tk.W).pack(
+            side=tk.LEFT
+        )
+        self.interpreter_entry = ttkb.Entry(interpreter_row, width=45)
+        self.interpreter_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        self.interpreter_entry.insert(0, settings.get("interpreter", ""))
+        ttkb.Button(
+            interpreter_row,
+            text="Обзор...",
+            command=self.browse_interpreter,
+            bootstyle=(SECONDARY, OUTLINE),
+        ).pack(side=tk.LEFT)
+
+        hint = ttkb.Label(
+            self.top,
+            text="Оставьте поле пустым для автоматического выбора.",
+            anchor=tk.W,
+        )
+        hint.pack(fill=tk.X, padx=10)
+
+        # Флаги интерпретатора
+        flags_row = ttkb.Frame(self.top, padding=(10, 0))
+        flags_row.pack(fill=tk.X, pady=5)
+        ttkb.Label(flags_row, text="Флаги:", anchor=tk.W).pack(side=tk.LEFT)
+        self.flags_entry = ttkb.Entry(flags_row, width=45)
+        self.flags_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        self.flags_entry.insert(0, settings.get("flags", ""))
+
+        # Кнопки для частых флагов: добавляют флаг или убирают уже заданный
+        presets_row = ttkb.Frame(self.top, padding=(10, 0))
+        presets_row.pack(fill=tk.X, pady=(0, 5))
+        for preset in INTERPRETER_FLAG_PRESETS:
+            ttkb.Button(
+                presets_row,
+                text=preset,
+                command=lambda flag=preset: self.toggle_flag(flag),
+                bootstyle=(INFO, OUTLINE),
+            ).pack(side=tk.LEFT, padx=(0, 5))
+
+        # Ограничения скрипта поверх общих
+        ttkb.Label(
+            self.top,
+            text="Ограничения (пустое поле — общее значение из настроек):",
+            anchor=tk.W,
+        ).pack(fill=tk.X, padx=10, pady=(10, 0))
+        self.limits_form = LimitsForm(self.top, settings.get("limits", {}))
+        self.limits_form.frame.pack(fill=tk.X, pady=5)
+
+        # Кнопки "Сохранить" и "Отмена"
+        buttons_frame = ttkb.Frame(self.top, padding="10")
+        buttons_frame.pack(fill=tk.X)
+
+        save_button = ttkb.Button(buttons_frame, text="Сохранить", command=self.save)
+        save_button.pack(side=tk.RIGHT, padx=5)
+
+        cancel_button = ttkb.Button(
+            buttons_frame, text="Отмена", command=self.top.destroy
+        )
+        cancel_button.pack(side=tk.RIGHT, padx=5)
+
+        # Центрирование окна
+        center_window(self.top, parent)
+
+    def browse_interpreter(self):
+        """Выбор файла интерпретатора."""
+        path = filedialog.askopenfilename(
+            parent=self.top, title="Выберите интерпретатор Python"
+        )
+        if path:
+            self.interpreter_entry.delete(0, tk.END)
+            self.interpreter_entry.insert(0, path)
+
+    def toggle_flag(self, flag):
+        """Добавление флага в строку флагов или удаление, если он уже есть."""
+        current = self.flags_entry.get().split()
+        tokens = flag.split()
+        for start in range(len(current) - len(tokens) + 1):
+            if current[start : start + len(tokens)] == tokens:
+                del current[start : start + len(tokens)]
+                break
+        else:
+            current.extend(tokens)
+        self.flags_entry.delete(0, tk.END)
+        self.flags_entry.insert(0, " ".join(current))
+
+    def save(self):
+        """Проверка и сохранение настроек скрипта."""
+        interpreter = self.interpreter_entry.get().strip()
+        flags = self.flags_entry.get().strip()
+        if interpreter and not (
+            os.path.isfile(interpreter) or shutil.which(interpreter)
+        ):
+            messagebox.showerror(
+                "Ошибка", f"Интерпретатор не найден: {interpreter}", parent=self.top
+            )
+            return
+        try:
+            parsed_flags = split_args(flags)
+        except ValueError as ve:
+            messagebox.showerror(
+                "Ошибка", f"Не удалось разобрать флаги: {ve}", parent=self.top
+            )
+            return
+        if parsed_flags and not parsed_flags[0].startswith("-"):
+            messagebox.showerror(
+                "Ошибка",
+                "Флаги интерпретатора должны начинаться с «-».",
+                parent=self.top,
+            )
+            return
+        try:
+            limits = self.limits_form.get()
+        except ValueError as ve:
+            messagebox.showerror("Ошибка", str(ve), parent=self.top)
+            return
+        self.save_callback(interpreter, flags, limits)
+        self.top.destroy()
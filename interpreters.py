@@ -0,0 +1,216 @@
+# interpreters.py
+
+import os
+import re
+import shutil
+import sys
+
+from constants import VENV_DIR_NAMES, VENV_SEARCH_DEPTH
+from runner import split_args
+
+# Источники выбранного интерпретатора
+SOURCE_OVERRIDE = "override"
+SOURCE_SHEBANG = "shebang"
+SOURCE_VENV = "venv"
+SOURCE_DEFAULT = "default"
+
+# Имена без версии в "#!/usr/bin/env python3" не выбирают конкретный
+# интерпретатор: в PATH первым может оказаться любой python
+GENERIC_PYTHON_PATTERN = re.compile(r"^python3?$", re.IGNORECASE)
+
+SOURCE_NAMES = {
+    SOURCE_OVERRIDE: "задан в настройках скрипта",
+    SOURCE_SHEBANG: "из строки #!",
+    SOURCE_VENV: "виртуальное окружение рядом со скриптом",
+    SOURCE_DEFAULT: "интерпретатор приложения",
+}
+
+
+def default_interpreter():
+    """Интерпретатор, в котором запущено приложение."""
+    return sys.executable or "python"
+
+
+def venv_python(venv_dir):
+    """Путь к python внутри виртуального окружения или None."""
+    if os.name == "nt":
+        candidate = os.path.join(venv_dir, "Scripts", "python.exe")
+    else:
+        candidate = os.path.join(venv_dir, "bin", "python")
+    return candidate if os.path.isfile(candidate) else None
+
+
+def shebang_interpreter(script_path):
+    """
+    Интерпретатор Python из строки #! скрипта.
+
+    Поддерживаются абсолютный путь (#!/opt/tool/bin/python3) и запуск через
+    env (#!/usr/bin/env python3.11, в том числе с env -S). Имя без пути ищется
+    в PATH один раз — результат кэшируется вызывающим кодом.
+
+    Returns:
+        tuple: (путь к существующему интерпретатору или None, True, если это
+        env с именем без версии — python или python3).
+    """
+    try:
+        with open(script_path, "rb") as f:
+            line = f.readline(256)
+    except OSError:
+        return None, False
+    if not line.startswith(b"#!"):
+        return None, False
+    parts = line[2:].decode("utf-8", "replace").split()
+    if parts and os.path.basename(parts[0]) == "env":
+        parts = [part for part in parts[1:] if part != "-S"]
+    if not parts or "python" not in os.path.basename(parts[0]).lower():
+        return None, False
+    interpreter = parts[0]
+    if os.path.isabs(interpreter):
+        return (interpreter if os.path.isfile(interpreter) else None), False
+    generic = GENERIC_PYTHON_PATTERN.match(interpreter) is not None
+    return shutil.which(interpreter), generic
+
+
+def nearby_venv(script_path, depth=VENV_SEARCH_DEPTH):
+    """
+    Интерпретатор виртуального окружения в каталоге скрипта или выше.
+
+    Проверяются каталоги VENV_DIR_NAMES в каталоге скрипта и в depth
+    родительских каталогах.
+    """
+    directory = os.path.dirname(os.path.abspath(script_path))
+    for _ in range(depth + 1):
+        for name in VENV_DIR_NAMES:
+            python = venv_python(os.path.join(directory, name))
+            if python is not None:
+                return python
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
+    return None
+
+
+class InterpreterResolver:
+    """
+    Выбор интерпретатора и флагов для запуска каждого скрипта.
+
+    Порядок: интерпретатор из настроек скрипта, строка #! с путём или
+    версией (#!/opt/tool/bin/python, #!/usr/bin/env python3.11), виртуальное
+    окружение рядом со скриптом, интерпретатор приложения. Строка
+    #!/usr/bin/env python3 без версии ничего не говорит о нужном окружении
+    и используется, только если приложение не знает своего интерпретатора
+    (sys.executable пуст). Результат
+    автоматического выбора кэшируется и остаётся действительным, пока не
+    изменились файл скрипта, его каталог и родительские каталоги, в которых
+    ищется окружение (st_mtime_ns), а найденный интерпретатор существует.
+    Настройки скриптов — словарь
+    config["script_settings"]: путь -> {"interpreter": ..., "flags": ...}
+    (там же хранятся ограничения скрипта — см. limits.Limits).
+    """
+
+    def __init__(self, script_settings=None):
+        self.script_settings = script_settings if script_settings is not None else {}
+        self._cache = {}  # путь скрипта -> (ключ проверки, интерпретатор, источник)
+
+    def settings(self, script_path):
+        return self.script_settings.get(script_path, {})
+
+    def resolve(self, script_path):
+        """
+        Интерпретатор для скрипта.
+
+        Returns:
+            tuple: (путь к интерпретатору, источник — одна из констант SOURCE_*).
+        """
+        override = self.settings(script_path).get("interpreter")
+        if override:
+            return override, SOURCE_OVERRIDE
+        key = self._cache_key(script_path)
+        cached = self._cache.get(script_path)
+        if (
+            cached is not None
+            and cached[0] == key
+            and (cached[2] == SOURCE_DEFAULT or os.path.isfile(cached[1]))
+        ):
+            return cached[1], cached[2]
+        interpreter, source = self.detect(script_path)
+        self._cache[script_path] = (key, interpreter, source)
+        return interpreter, source
+
+    @staticmethod
+    def detect(script_path):
+        """Автоматический выбор интерпретатора без учёта настроек и кэша."""
+        shebang, generic = shebang_interpreter(script_path)
+        if shebang is not None and not generic:
+            return shebang, SOURCE_SHEBANG
+        interpreter = nearby_venv(script_path)
+        if interpreter is not None:
+            return interpreter, SOURCE_VENV
+        if not sys.executable and shebang is not None:
+            return shebang, SOURCE_SHEBANG
+        return default_interpreter(), SOURCE_DEFAULT
+
+    def flags(self, script_path):
+        """
+        Флаги интерпретатора из настроек скрипта (например, -X frozen_modules=on -S).
+
+        Raises:
+            ValueError: Если строку флагов не удалось разобрать.
+        """
+        return split_args(self.settings(script_path).get("flags", ""))
+
+    def command(self, script_path, args):
+        """Команда запуска: интерпретатор, его флаги, скрипт и аргументы."""
+        interpreter, _ = self.resolve(script_path)
+        return [interpreter] + self.flags(script_path) + [script_path] + list(args)
+
+    def update(self, script_path, **values):
+        """
+        Сохранение настроек скрипта (interpreter, flags, limits).
+
+        Пустые значения удаляются; скрипт без настроек удаляется из словаря.
+        """
+        settings = dict(self.settings(script_path))
+        for key, value in values.items():
+            if value:
+                settings[key] = value
+            else:
+                settings.pop(key, None)
+        if settings:
+            self.script_settings[script_path] = settings
+        else:
+            self.script_settings.pop(script_path, None)
+        self.invalidate(script_path)
+
+    def invalidate(self, script_path=None):
+        """Сброс кэша для скрипта или для всех скриптов."""
+        if script_path is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(script_path, None)
+
+    @staticmethod
+    def _cache_key(script_path, depth=VENV_SEARCH_DEPTH):
+        """
+        Ключ проверки кэша: файл скрипта и каталоги, где ищется окружение.
+
+        В ключ входит st_mtime_ns каталога скрипта и depth его родителей,
+        поэтому .venv, созданный в любом из них, сбрасывает кэш.
+        """
+        try:
+            script_stat = os.stat(script_path)
+        except OSError:
+            return None
+        key = [script_stat.st_mtime_ns, script_stat.st_size]
+        directory = os.path.dirname(os.path.abspath(script_path))
+        for _ in range(depth + 1):
+            try:
+                key.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                return None
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        return tuple(key)
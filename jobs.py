@@ -0,0 +1,456 @@
+# jobs.py
+
+import itertools
+import os
+import time
+from collections import OrderedDict, deque
+
+from constants import DEFAULT_OUTPUT_MAX_LINES, OUTPUT_MAX_CHARS_PER_FLUSH
+from output_buffer import OutputBuffer
+from run_history import make_record
+from runner import ScriptProcess
+
+
+class Job:
+    """Один запуск скрипта: процесс, буфер вывода и сведения о выполнении."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    STOPPED = "stopped"
+    TIMED_OUT = "timed_out"
+
+    STATUS_NAMES = {
+        QUEUED: "В очереди",
+        RUNNING: "Выполняется",
+        FINISHED: "Завершён",
+        FAILED: "Ошибка",
+        STOPPED: "Остановлен",
+        TIMED_OUT: "Превышено время",
+    }
+
+    def __init__(
+        self,
+        job_id,
+        script_path,
+        command,
+        max_lines=DEFAULT_OUTPUT_MAX_LINES,
+        log_store=None,
+        colored=True,
+        args="",
+        batch=None,
+        pool=None,
+        limits=None,
+        pipeline=None,
+        stdin=None,
+        stdout_file=None,
+    ):
+        self.id = job_id
+        self.script_path = script_path
+        self.command = command
+        # Пул тёплых интерпретаторов (None — обычный запуск процесса)
+        self.pool = pool
+        # Ограничения запуска (limits.Limits, None — без ограничений)
+        self.limits = limits
+        # Пользователь запросил остановку задачи
+        self.stop_requested = False
+        # Исходная строка аргументов и пакет, к которому относится задача
+        self.args = args
+        self.batch = batch
+        # Запуск конвейера (pipeline.PipelineRun), шагом которого является задача
+        self.pipeline = pipeline
+        # Файл, содержимое которого подаётся скрипту на stdin
+        self.stdin = stdin
+        # Файл, в который дополнительно пишется stdout скрипта (без stderr)
+        self.stdout_file = stdout_file
+        # Необязательный обработчик сырого вывода (с ANSI последовательностями)
+        self.on_output = None
+        self.status = Job.QUEUED
+        self.process = None
+        self.pid = None
+        # Время начала по часам (для отображения) и по монотонным часам
+        self.start_time = None
+        self._started = None
+        self._finished = None
+        self.exit_code = None
+        self.error = None
+        # Ресурсы, потреблённые процессом (см. runner.wait_with_usage)
+        self.usage = None
+        # Полный вывод в хранилище логов (log_store.RunLog)
+        self.log = log_store.open_run(script_path, args) if log_store else None
+        self.buffer = OutputBuffer(max_lines, self.log, colored)
+
+    @property
+    def name(self):
+        return os.path.basename(self.script_path)
+
+    @property
+    def status_name(self):
+        return Job.STATUS_NAMES[self.status]
+
+    @property
+    def active(self):
+        return self.status in (Job.QUEUED, Job.RUNNING)
+
+    @property
+    def elapsed(self):
+        """Время выполнения в секундах (None, если задача ещё не запущена)."""
+        if self._started is None:
+            return None
+        end = self._finished if self._finished is not None else time.monotonic()
+        return end - self._started
+
+    def start(self):
+        """
+        Запуск процесса задачи.
+
+        Returns:
+            list: Сегменты вывода, добавленные в буфер при запуске.
+        """
+        self.start_time = time.time()
+        self._started = time.monotonic()
+        header = f"Запуск скрипта: {' '.join(self.command)}\n"
+        if self.limits is not None and self.limits.describe():
+            header += f"Ограничения: {self.limits.describe()}\n"
+        runs = self.buffer.feed(header + "\n")
+        self.process = ScriptProcess(
+            self.command,
+            pool=self.pool,
+            limits=self.limits,
+            stdin=self.stdin,
+            stdout_file=self.stdout_file,
+        )
+        try:
+            self.process.start()
+        except Exception as e:
+            self.error = e
+            runs += self.buffer.feed(f"Ошибка при запуске скрипта: {e}\n")
+            self.finish(Job.FAILED)
+            return runs
+        self.pid = self.process.pid
+        self.status = Job.RUNNING
+        return runs
+
+    def stop(self):
+        """Остановка выполняющейся задачи (SIGTERM, затем SIGKILL группе процессов)."""
+        self.stop_requested = True
+        if self.process is not None:
+            self.process.stop()
+
+    def finish(self, status, exit_code=None, usage=None):
+        """Отметка о завершении задачи."""
+        self.status = status
+        self.exit_code = exit_code
+        self.usage = usage
+        self._finished = time.monotonic()
+        if self.log is not None:
+            self.log.exit_code = exit_code
+        self.buffer.close()
+
+    def history_record(self):
+        """Запись о завершённом запуске для run_history.RunHistory."""
+        return make_record(
+            self.script_path, self.start_time, self.elapsed, self.exit_code, self.usage
+        )
+
+
+class Batch:
+    """
+    Пакетный запуск одного скрипта с разными наборами аргументов.
+
+    Задачи пакета выполняются параллельно, но не более max_workers
+    одновременно. Пакет собирает коды завершения и время выполнения задач.
+    """
+
+    def __init__(self, batch_id, script_path, max_workers):
+        self.id = batch_id
+        self.script_path = script_path
+        self.max_workers = max(1, max_workers)
+        self.jobs = []
+        self._started = time.monotonic()
+
+    @property
+    def name(self):
+        return os.path.basename(self.script_path)
+
+    @property
+    def total(self):
+        return len(self.jobs)
+
+    @property
+    def running(self):
+        return sum(1 for job in self.jobs if job.status == Job.RUNNING)
+
+    @property
+    def completed(self):
+        return sum(1 for job in self.jobs if not job.active)
+
+    @property
+    def failed(self):
+        return sum(
+            1 for job in self.jobs if not job.active and job.status != Job.FINISHED
+        )
+
+    @property
+    def done(self):
+        return self.completed == self.total
+
+    @property
+    def elapsed(self):
+        """Время от создания пакета до завершения последней задачи."""
+        if not self.done:
+            return time.monotonic() - self._started
+        ends = [job._finished for job in self.jobs if job._finished is not None]
+        return (max(ends) if ends else self._started) - self._started
+
+    def exit_codes(self):
+        """Коды завершения задач в порядке строк аргументов."""
+        return [job.exit_code for job in self.jobs]
+
+    def timings(self):
+        """Время выполнения задач в секундах в порядке строк аргументов."""
+        return [job.elapsed for job in self.jobs]
+
+    def summary(self):
+        """Краткая сводка по пакету."""
+        timings = [t for t in self.timings() if t is not None]
+        average = sum(timings) / len(timings) if timings else 0.0
+        return (
+            f"Пакет #{self.id} ({self.name}): выполнено {self.completed}/{self.total}, "
+            f"ошибок {self.failed}, среднее время {average:.1f} с, "
+            f"общее время {self.elapsed:.1f} с"
+        )
+
+
+class JobManager:
+    """
+    Очередь запусков скриптов с ограничением числа одновременных процессов.
+
+    Не использует GUI: владелец периодически вызывает poll(), который
+    запускает задачи из очереди в свободные слоты, переносит накопленный
+    вывод процессов в их буферы и отмечает завершившиеся задачи. Сам poll()
+    не блокируется.
+    """
+
+    def __init__(
+        self, max_concurrent=None, log_store=None, pool=None, history=None
+    ):
+        self.max_concurrent = max(1, max_concurrent or os.cpu_count() or 1)
+        # Хранилище полных логов запусков (log_store.LogStore)
+        self.log_store = log_store
+        # Пул тёплых интерпретаторов для новых задач (см. warm_pool.WarmPool)
+        self.pool = pool
+        # История запусков (run_history.RunHistory), в которую пишутся
+        # время и ресурсы каждой завершившейся задачи
+        self.history = history
+        self.jobs = OrderedDict()
+        self._queue = deque()
+        self._ids = itertools.count(1)
+        self.batches = OrderedDict()
+        self._batch_ids = itertools.count(1)
+        self.pipelines = OrderedDict()
+        self._pipeline_ids = itertools.count(1)
+
+    def submit(self, script_path, command, **job_options):
+        """
+        Постановка запуска скрипта в очередь.
+
+        Args:
+            script_path (str): Путь к скрипту.
+            command (list): Команда запуска.
+            **job_options: Параметры Job (max_lines, colored).
+
+        Returns:
+            Job: Созданная задача.
+        """
+        job_options.setdefault("log_store", self.log_store)
+        job_options.setdefault("pool", self.pool)
+        job = Job(next(self._ids), script_path, command, **job_options)
+        self.jobs[job.id] = job
+        self._queue.append(job)
+        return job
+
+    def submit_batch(self, script_path, items, max_workers, **job_options):
+        """
+        Постановка пакетного запуска в очередь.
+
+        Args:
+            script_path (str): Путь к скрипту.
+            items (list): Пары (строка аргументов, команда запуска).
+            max_workers (int): Максимум одновременно выполняемых задач пакета.
+            **job_options: Параметры Job (max_lines, colored).
+
+        Returns:
+            Batch: Созданный пакет.
+        """
+        batch = Batch(next(self._batch_ids), script_path, max_workers)
+        self.batches[batch.id] = batch
+        for args, command in items:
+            job = self.submit(script_path, command, args=args, batch=batch, **job_options)
+            batch.jobs.append(job)
+        return batch
+
+    def submit_pipeline(self, pipeline, prepare, state, force=False, on_job=None):
+        """
+        Запуск конвейера: шаги ставятся в очередь по мере готовности зависимостей.
+
+        Args:
+            pipeline (pipeline.Pipeline): Описание конвейера.
+            prepare: Функция шаг -> (команда, параметры Job).
+            state (pipeline.PipelineState): Отпечатки успешных шагов.
+            force (bool): Выполнить все шаги, даже не изменившиеся.
+            on_job: Обработчик (шаг, задача), вызываемый для каждой новой задачи.
+
+        Returns:
+            pipeline.PipelineRun: Запуск конвейера.
+        """
+        from pipeline import PipelineRun
+
+        run = PipelineRun(
+            next(self._pipeline_ids), pipeline, prepare, state, force, on_job
+        )
+        self.pipelines[run.id] = run
+        run.advance(self)
+        return run
+
+    @property
+    def running(self):
+        return [job for job in self.jobs.values() if job.status == Job.RUNNING]
+
+    @property
+    def queued(self):
+        return list(self._queue)
+
+    @property
+    def active(self):
+        """Есть задачи в очереди, в процессе выполнения или невыполненные шаги."""
+        return (
+            bool(self._queue)
+            or any(job.active for job in self.jobs.values())
+            or any(not run.done for run in self.pipelines.values())
+        )
+
+    def poll(self, max_chars=OUTPUT_MAX_CHARS_PER_FLUSH):
+        """
+        Один шаг обслуживания задач.
+
+        Args:
+            max_chars (int): Ограничение объёма вывода, забираемого у одной задачи.
+
+        Returns:
+            tuple: (output, changed), где output — список пар (задача, сегменты)
+                с новым выводом, changed — список задач, сменивших статус.
+        """
+        output = []
+        changed = []
+        running = self.running
+        for job in self._startable(self.max_concurrent - len(running)):
+            output.append((job, job.start()))
+            changed.append(job)
+            if job.status == Job.RUNNING:
+                running.append(job)
+
+        for job in running:
+            process = job.process
+            text = process.read_available(max_chars)
+            if text:
+                if job.on_output is not None:
+                    job.on_output(text)
+                output.append((job, job.buffer.feed(text)))
+            if process.done:
+                if process.timed_out:
+                    status = Job.TIMED_OUT
+                    note = (
+                        "\nПревышено время выполнения "
+                        f"({job.limits.timeout} с), скрипт остановлен.\n"
+                    )
+                    output.append((job, job.buffer.feed(note)))
+                elif job.stop_requested:
+                    status = Job.STOPPED
+                    output.append((job, job.buffer.feed("\nСкрипт остановлен.\n")))
+                elif process.returncode == 0:
+                    status = Job.FINISHED
+                else:
+                    status = Job.FAILED
+                job.finish(status, process.returncode, process.usage)
+                if self.history is not None:
+                    self.history.append(job.history_record())
+                changed.append(job)
+
+        # Шаги конвейеров, зависимости которых только что завершились
+        for run in self.pipelines.values():
+            if not run.done:
+                run.advance(self)
+        return output, changed
+
+    def _startable(self, slots):
+        """Извлечение из очереди задач, которые можно запустить сейчас."""
+        started = []
+        if slots <= 0 or not self._queue:
+            return started
+        # Свободные слоты пакетов с учётом уже выполняющихся задач
+        batch_slots = {}
+        remaining = deque()
+        while self._queue:
+            job = self._queue.popleft()
+            if len(started) < slots:
+                batch = job.batch
+                if batch is None:
+                    started.append(job)
+                    continue
+                if batch.id not in batch_slots:
+                    batch_slots[batch.id] = batch.max_workers - batch.running
+                if batch_slots[batch.id] > 0:
+                    batch_slots[batch.id] -= 1
+                    started.append(job)
+                    continue
+            remaining.append(job)
+        self._queue = remaining
+        return started
+
+    def stop(self, job_id):
+        """
+        Остановка задачи: из очереди она снимается, выполняющаяся завершается.
+
+        Returns:
+            Job | None: Задача, если она была активна.
+        """
+        job = self.jobs.get(job_id)
+        if job is None or not job.active:
+            return None
+        if job.status == Job.QUEUED:
+            self._queue.remove(job)
+            job.stop_requested = True
+            job.finish(Job.STOPPED)
+        else:
+            job.stop()
+        return job
+
+    def remove(self, job_id):
+        """Удаление завершённой задачи из списка."""
+        job = self.jobs.get(job_id)
+        if job is not None and not job.active:
+            del self.jobs[job_id]
+            batch = job.batch
+            if batch is not None and not any(j.id in self.jobs for j in batch.jobs):
+                self.batches.pop(batch.id, None)
+            run = job.pipeline
+            if run is not None and run.done:
+                if not any(j.id in self.jobs for j in run.jobs.values()):
+                    self.pipelines.pop(run.id, None)
+
+    def shutdown(self):
+        """Снятие задач из очереди и завершение выполняющихся процессов."""
+        self._queue.clear()
+        for run in self.pipelines.values():
+            run.cancel()
+        for job in self.running:
+            job.process.terminate()
+        # Уже полученный вывод дописывается в лог, даже если poll() больше
+        # не будет вызван
+        for job in self.jobs.values():
+            if job.active:
+                job.buffer.close()
+        if self.pool is not None:
+            self.pool.shutdown()
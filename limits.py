@@ -0,0 +1,137 @@
+# limits.py
+
+import os
+import platform
+
+# Номера системного вызова ioprio_set (в модуле os его нет)
+IOPRIO_SET_SYSCALLS = {
+    "x86_64": 251,
+    "i386": 289,
+    "i686": 289,
+    "aarch64": 30,
+    "armv7l": 314,
+}
+IOPRIO_WHO_PROCESS = 1
+IOPRIO_CLASS_SHIFT = 13
+# Классы ввода-вывода: idle — только когда диск свободен, low — низший
+# приоритет в классе best-effort
+IONICE_CLASSES = {"idle": (3, 0), "low": (2, 7)}
+
+
+class Limits:
+    """
+    Ограничения одного запуска скрипта.
+
+    timeout — время выполнения в секундах (следит ScriptProcess), cpu —
+    процессорное время в секундах (RLIMIT_CPU), memory — адресное
+    пространство в МБ (RLIMIT_AS), nice — прибавка к приоритету
+    планировщика, ionice — класс ввода-вывода ("idle" или "low"). Лимиты
+    ядра задаются в дочернем процессе до exec и наследуются всеми
+    процессами, которые запустит скрипт. None — без ограничения.
+    """
+
+    FIELDS = ("timeout", "cpu", "memory", "nice", "ionice")
+
+    def __init__(self, timeout=None, cpu=None, memory=None, nice=None, ionice=None):
+        self.timeout = timeout
+        self.cpu = cpu
+        self.memory = memory
+        self.nice = nice
+        self.ionice = ionice
+
+    @classmethod
+    def from_settings(cls, defaults=None, overrides=None):
+        """
+        Ограничения из конфигурации: общие значения и значения скрипта.
+
+        Args:
+            defaults (dict, optional): config["limits"].
+            overrides (dict, optional): Ограничения из настроек скрипта;
+                заданные в них значения заменяют общие.
+        """
+        values = {}
+        for settings in (defaults or {}, overrides or {}):
+            for field in cls.FIELDS:
+                if settings.get(field) not in (None, ""):
+                    values[field] = settings[field]
+        return cls(**values)
+
+    @property
+    def kernel_limits(self):
+        """Есть ограничения, которые задаются в дочернем процессе до exec."""
+        values = (self.cpu, self.memory, self.nice, self.ionice)
+        return any(value is not None for value in values)
+
+    def describe(self):
+        """Описание ограничений для вывода задачи (пустая строка без ограничений)."""
+        parts = []
+        if self.timeout is not None:
+            parts.append(f"время {self.timeout} с")
+        if self.cpu is not None:
+            parts.append(f"ЦП {self.cpu} с")
+        if self.memory is not None:
+            parts.append(f"память {self.memory} МБ")
+        if self.nice is not None:
+            parts.append(f"nice {self.nice}")
+        if self.ionice is not None:
+            parts.append(f"ionice {self.ionice}")
+        return ", ".join(parts)
+
+    def preexec(self):
+        """
+        Функция для preexec_fn subprocess.Popen, задающая лимиты ядра.
+
+        Всё, что требует импорта или выделения памяти, подготавливается
+        здесь, в родительском процессе: между fork и exec дочерний процесс
+        только выполняет системные вызовы.
+
+        Returns:
+            callable | None: Функция или None, если задавать нечего или
+            платформа не поддерживает preexec_fn.
+        """
+        if os.name == "nt" or not self.kernel_limits:
+            return None
+        import resource
+
+        rlimits = []
+        if self.cpu is not None:
+            seconds = int(self.cpu)
+            # По мягкому лимиту процесс получает SIGXCPU, по жёсткому — SIGKILL
+            rlimits.append((resource.RLIMIT_CPU, seconds, seconds + 1))
+        if self.memory is not None:
+            size = int(self.memory) * 1024 * 1024
+            rlimits.append((resource.RLIMIT_AS, size, size))
+        # Жёсткий лимит нельзя поднять выше текущего без прав администратора
+        prepared = []
+        for kind, soft, hard in rlimits:
+            _, current_hard = resource.getrlimit(kind)
+            if current_hard != resource.RLIM_INFINITY:
+                soft = min(soft, current_hard)
+                hard = min(hard, current_hard)
+            prepared.append((kind, (soft, hard)))
+        nice = int(self.nice) if self.nice is not None else None
+        ioprio = self._ioprio_call()
+
+        def apply_limits():
+            for kind, values in prepared:
+                resource.setrlimit(kind, values)
+            if nice:
+                os.nice(nice)
+            if ioprio is not None:
+                ioprio()
+
+        return apply_limits
+
+    def _ioprio_call(self):
+        """Вызов ioprio_set для текущего процесса или None, если он недоступен."""
+        if self.ionice not in IONICE_CLASSES:
+            return None
+        number = IOPRIO_SET_SYSCALLS.get(platform.machine())
+        if number is None or platform.system() != "Linux":
+            return None
+        import ctypes
+
+        syscall = ctypes.CDLL(None, use_errno=True).syscall
+        io_class, level = IONICE_CLASSES[self.ionice]
+        priority = (io_class << IOPRIO_CLASS_SHIFT) | level
+        return lambda: syscall(number, IOPRIO_WHO_PROCESS, 0, priority)
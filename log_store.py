@@ -0,0 +1,358 @@
+# log_store.py
+
+import bisect
+import json
+import os
+import re
+import threading
+import time
+import zlib
+
+from constants import DEFAULT_OUTPUT_LOG_DIR, LOG_FRAME_SIZE
+
+DATA_FILE = "output.dat"
+INDEX_FILE = "index.jsonl"
+
+
+def gzip_compress(data):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def gzip_decompress(data):
+    return zlib.decompress(data, 31)
+
+
+def load_codec(name):
+    """
+    Функции сжатия и распаковки кадров.
+
+    Args:
+        name (str): "gz" или "zst" (нужен пакет zstandard).
+
+    Raises:
+        ValueError: Если кодек неизвестен или его модуль не установлен.
+    """
+    if name == "gz":
+        return gzip_compress, gzip_decompress
+    if name == "zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("Для сжатия zstd установите пакет zstandard.")
+        return (
+            zstandard.ZstdCompressor().compress,
+            zstandard.ZstdDecompressor().decompress,
+        )
+    raise ValueError(f"Неизвестный формат сжатия логов: {name}")
+
+
+class RunInfo:
+    """Сведения о запуске из индекса: скрипт, время, код завершения и кадры."""
+
+    def __init__(self, run_id, script_path, args, start_time):
+        self.run_id = run_id
+        self.script_path = script_path
+        self.args = args
+        self.start_time = start_time
+        self.end_time = None
+        self.exit_code = None
+        # Кадры (смещение, длина сжатых данных, кодек) и номер первой строки
+        # каждого кадра — для перехода к строке без распаковки всего лога
+        self.frames = []
+        self.frame_lines = []
+        self.lines = 0
+
+    @property
+    def name(self):
+        return os.path.basename(self.script_path)
+
+    @property
+    def finished(self):
+        return self.end_time is not None
+
+    def frame_for_line(self, number):
+        """Индекс кадра, содержащего строку с номером number (с 0)."""
+        return max(0, bisect.bisect_right(self.frame_lines, number) - 1)
+
+
+class RunLog:
+    """
+    Запись вывода одного запуска в хранилище.
+
+    Текст копится в памяти и записывается кадрами примерно по frame_size
+    символов, разрезанными по границе строк: каждый кадр сжимается
+    отдельно, поэтому его можно прочитать и искать в нём независимо
+    от остальных.
+    """
+
+    def __init__(self, store, info):
+        self.store = store
+        self.info = info
+        self.exit_code = None
+        self._parts = []
+        self._size = 0
+        self._closed = False
+
+    @property
+    def run_id(self):
+        return self.info.run_id
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.store.frame_size:
+            self._flush(final=False)
+
+    def _flush(self, final):
+        text = "".join(self._parts)
+        self._parts = []
+        self._size = 0
+        if not final:
+            # Незавершённая строка переходит в следующий кадр
+            cut = text.rfind("\n") + 1
+            if cut:
+                self._parts, self._size = [text[cut:]], len(text) - cut
+                text = text[:cut]
+            else:
+                self._parts, self._size = [text], len(text)
+                return
+        if text:
+            self.store.write_frame(self.info, text)
+
+    def close(self):
+        """Запись оставшегося текста и отметка о завершении запуска."""
+        if self._closed:
+            return
+        self._closed = True
+        self._flush(final=True)
+        self.store.finish_run(self.info, self.exit_code)
+
+
+class LogStore:
+    """
+    Хранилище логов запусков: сжатые кадры в одном файле данных и индекс.
+
+    Кадры всех запусков дописываются в log_dir/output.dat, а в
+    log_dir/index.jsonl дописываются строки о начале запуска, о каждом
+    кадре (смещение и длина в файле данных, число строк) и о завершении.
+    Оба файла только дописываются (O_APPEND), поэтому в хранилище могут
+    одновременно писать GUI и консольный режим, а сбой посреди запуска
+    теряет только последний незаписанный кадр. Индекс читается
+    инкрементально: при повторном вызове runs() разбираются только новые
+    строки.
+    """
+
+    def __init__(
+        self, log_dir=DEFAULT_OUTPUT_LOG_DIR, frame_size=LOG_FRAME_SIZE, codec="gz"
+    ):
+        self.log_dir = log_dir
+        self.frame_size = frame_size
+        self.codec = codec
+        self.compress, _ = load_codec(codec)
+        self.data_path = os.path.join(log_dir, DATA_FILE)
+        self.index_path = os.path.join(log_dir, INDEX_FILE)
+        self._lock = threading.Lock()
+        self._runs = {}
+        self._index_offset = 0
+        self._counter = 0
+
+    def open_run(self, script_path, args=""):
+        """
+        Начало записи вывода нового запуска.
+
+        Returns:
+            RunLog: Объект с методами write(text) и close().
+        """
+        with self._lock:
+            self._counter += 1
+            counter = self._counter
+        start_time = time.time()
+        stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(start_time))
+        run_id = f"{stamp}_{os.getpid()}_{counter}"
+        info = RunInfo(run_id, script_path, args, start_time)
+        self._append_index(
+            {
+                "e": "start",
+                "run": run_id,
+                "script": script_path,
+                "args": args,
+                "start": round(start_time, 3),
+            }
+        )
+        return RunLog(self, info)
+
+    def write_frame(self, info, text):
+        """Сжатие и запись кадра запуска с отметкой в индексе."""
+        data = self.compress(text.encode("utf-8"))
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+        with self._lock:
+            try:
+                os.makedirs(self.log_dir, exist_ok=True)
+                fd = os.open(self.data_path, flags, 0o644)
+                try:
+                    os.write(fd, data)
+                    # При O_APPEND позиция дескриптора после записи — конец
+                    # именно наших данных, даже если файл дописывают другие
+                    # процессы
+                    offset = os.lseek(fd, 0, os.SEEK_CUR) - len(data)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                print(f"Ошибка при записи лога запуска: {e}")
+                return
+        self._append_index(
+            {
+                "e": "frame",
+                "run": info.run_id,
+                "offset": offset,
+                "size": len(data),
+                "lines": text.count("\n"),
+                "codec": self.codec,
+            }
+        )
+
+    def finish_run(self, info, exit_code):
+        self._append_index(
+            {
+                "e": "end",
+                "run": info.run_id,
+                "end": round(time.time(), 3),
+                "code": exit_code,
+            }
+        )
+
+    def _append_index(self, record):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            try:
+                os.makedirs(self.log_dir, exist_ok=True)
+                with open(self.index_path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError as e:
+                print(f"Ошибка при записи индекса логов: {e}")
+
+    def runs(self):
+        """
+        Запуски из индекса, начиная с последнего.
+
+        Returns:
+            list: Объекты RunInfo.
+        """
+        with self._lock:
+            self._read_index()
+            runs = list(self._runs.values())
+        runs.sort(key=lambda info: info.start_time, reverse=True)
+        return runs
+
+    def get(self, run_id):
+        with self._lock:
+            self._read_index()
+            return self._runs.get(run_id)
+
+    def _read_index(self):
+        """Разбор строк индекса, добавленных с прошлого чтения."""
+        try:
+            with open(self.index_path, "rb") as f:
+                f.seek(self._index_offset)
+                data = f.read()
+        except OSError:
+            return
+        # Последняя строка может быть дописана не до конца
+        end = data.rfind(b"\n") + 1
+        self._index_offset += end
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+                event = record["e"]
+                run_id = record["run"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            if event == "start":
+                self._runs[run_id] = RunInfo(
+                    run_id, record["script"], record.get("args", ""), record["start"]
+                )
+                continue
+            info = self._runs.get(run_id)
+            if info is None:
+                continue
+            if event == "frame":
+                info.frames.append((record["offset"], record["size"], record["codec"]))
+                info.frame_lines.append(info.lines)
+                info.lines += record["lines"]
+            elif event == "end":
+                info.end_time = record["end"]
+                info.exit_code = record.get("code")
+
+    def read_frame(self, info, index):
+        """
+        Текст одного кадра запуска.
+
+        Raises:
+            OSError: Если файл данных недоступен.
+            ValueError: Если кадр повреждён или его кодек недоступен.
+        """
+        offset, size, codec = info.frames[index]
+        with open(self.data_path, "rb") as f:
+            f.seek(offset)
+            data = f.read(size)
+        _, decompress = load_codec(codec)
+        try:
+            return decompress(data).decode("utf-8", errors="replace")
+        except zlib.error as e:
+            raise ValueError(f"Повреждённый кадр лога: {e}")
+
+    def iter_text(self, info):
+        """Текст запуска по кадрам (распаковывается по одному кадру)."""
+        for index in range(len(info.frames)):
+            yield self.read_frame(info, index)
+
+    def search(self, pattern, runs=None, cancel=None):
+        """
+        Потоковый поиск строк по логам запусков.
+
+        Кадры распаковываются по одному; совпадения отдаются сразу, поэтому
+        первые результаты появляются до окончания поиска.
+
+        Args:
+            pattern (re.Pattern): Скомпилированное выражение.
+            runs (list, optional): Запуски для поиска (по умолчанию все).
+            cancel (threading.Event, optional): Прерывание поиска.
+
+        Yields:
+            tuple: (RunInfo, номер строки с 0, текст строки).
+        """
+        for info in runs if runs is not None else self.runs():
+            for index in range(len(info.frames)):
+                if cancel is not None and cancel.is_set():
+                    return
+                try:
+                    text = self.read_frame(info, index)
+                except (OSError, ValueError):
+                    break
+                line = info.frame_lines[index]
+                counted = 0
+                position = 0
+                while position <= len(text):
+                    match = pattern.search(text, position)
+                    if match is None:
+                        break
+                    start = text.rfind("\n", 0, match.start()) + 1
+                    end = text.find("\n", match.start())
+                    end = len(text) if end == -1 else end
+                    line += text.count("\n", counted, start)
+                    counted = start
+                    yield info, line, text[start:end]
+                    # Остальные совпадения в этой строке не нужны
+                    position = end + 1
+
+    @staticmethod
+    def compile(query, regex=False, ignore_case=True):
+        """
+        Выражение для search().
+
+        Raises:
+            re.error: Если регулярное выражение некорректно.
+        """
+        flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+        return re.compile(query if regex else re.escape(query), flags)
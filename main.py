@@ -1,34 +1,66 @@
 # main.py
 
+# Модули, не нужные для первого кадра окна (ast, subprocess, диалоги, менеджер
+# задач, поисковый индекс, консоль вывода), импортируются при первом
+# использовании; пакет widgets загружает виджеты лениво.
 import os
-import re
-import shlex
+import queue
 import threading
-import subprocess
-import ast
+import time
 import tkinter as tk
-from tkinter import filedialog, messagebox, simpledialog
+from tkinter import messagebox
 
 import ttkbootstrap as ttkb
 from ttkbootstrap.constants import *
 from tkinterdnd2 import DND_FILES, TkinterDnD
 
 from config import ConfigManager
-from dialogs import HotkeysDialog, OutputSettingsDialog
-from constants import ANSI_COLOR_MAP, DEFAULT_HOTKEYS
+from constants import (
+    DEFAULT_EXECUTION_MODE,
+    DEFAULT_HOTKEYS,
+    DEFAULT_LOG_COMPRESSION,
+    DEFAULT_OUTPUT_LOG_DIR,
+    DEFAULT_OUTPUT_MAX_LINES,
+    DEFAULT_WARM_POOL_SIZE,
+    JOBS_TABLE_REFRESH_MS,
+    LIBRARY_SEARCH_DELAY_MS,
+    METADATA_POLL_MS,
+    OUTPUT_FLUSH_INTERVAL_MS,
+    SCRIPT_VALIDATION_POLL_MS,
+    STARTUP_PROBE_ENV,
+    STARTUP_PROBE_MARKER,
+    WATCHER_EVENTS_POLL_MS,
+)
+from registry import ScriptRegistry
+from widgets import ScriptList
 
 
 class ScriptRunnerGUI:
-    ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[(?:\d+;?)*m")
-
     def __init__(self, master):
         self.master = master
         self.master.title("Python Script Runner")
 
-        # Инициализация менеджера конфигурации
-        self.config_manager = ConfigManager()
+        # Инициализация менеджера конфигурации (сериализация по таймеру Tk)
+        self.config_manager = ConfigManager(scheduler=self.master.after)
         self.config = self.config_manager.config
 
+        # Менеджер задач создаётся при первом запуске скрипта
+        self._job_manager = None
+        self._run_history = None
+        self._log_store = None
+        self._pipeline_state = None
+        # Интерпретаторы скриптов выбираются при первом запуске
+        self._interpreters = None
+        # Консоли открытых вкладок задач: id задачи -> OutputConsole
+        self.job_consoles = {}
+        self._job_poll_scheduled = False
+        self._jobs_table_refreshed = 0.0
+        # Кэш docstring и аргументов скриптов создаётся после первого кадра
+        self._metadata_cache = None
+        self._metadata_poll_scheduled = False
+        # Наблюдение за файлами скриптов запускается после первого кадра
+        self.watcher = None
+
         # Установка темы и стилей
         theme = self.config.get("theme", "darkly")
         self.style = ttkb.Style(theme)
@@ -42,18 +74,104 @@ class ScriptRunnerGUI:
         self.create_widgets()
 
         # Привязка событий и горячих клавиш
-        self.bind_mousewheel(self.listbox)
-        self.bind_mousewheel(self.output_text)
         self.bind_mousewheel(self.documentation_text)
         self.bind_fixed_hotkeys()
 
-        # Создание тегов для ANSI цветов, если цветной вывод включен
-        if self.config.get("colored_output", True):
-            self.create_ansi_tags()
-
         # Обработка события закрытия окна
         self.master.protocol("WM_DELETE_WINDOW", self.on_closing)
 
+        # Проверка и загрузка списка скриптов — после отрисовки окна
+        self.master.after_idle(self.finish_startup)
+
+    def finish_startup(self):
+        """Работа, отложенная до отрисовки первого кадра окна."""
+        self.master.update_idletasks()
+        if os.environ.get(STARTUP_PROBE_ENV):
+            # Замер времени до первого кадра (benchmarks/bench_startup.py)
+            print(STARTUP_PROBE_MARKER, flush=True)
+            self.master.destroy()
+            return
+        self.populate_listbox()
+        threading.Thread(target=self.registry.build_index, daemon=True).start()
+        self.metadata_cache.warm(list(self.scripts))
+        self.schedule_metadata_poll()
+
+        from watcher import ScriptWatcher
+
+        self.watcher = ScriptWatcher()
+        self.watcher.set_paths(self.scripts)
+        self.watcher.start()
+        self.master.after(WATCHER_EVENTS_POLL_MS, self.poll_watcher)
+
+    @property
+    def metadata_cache(self):
+        """Кэш метаданных скриптов (docstring и аргументы argparse)."""
+        if self._metadata_cache is None:
+            from metadata_cache import MetadataCache
+
+            self._metadata_cache = MetadataCache()
+        return self._metadata_cache
+
+    @property
+    def job_manager(self):
+        """Менеджер задач: каждый запуск скрипта — отдельная задача."""
+        if self._job_manager is None:
+            from jobs import JobManager
+
+            self._job_manager = JobManager(
+                self.config.get("max_concurrent_jobs"),
+                log_store=self.log_store,
+                pool=self.create_warm_pool(),
+                history=self.run_history,
+            )
+        return self._job_manager
+
+    @property
+    def log_store(self):
+        """Хранилище полных логов запусков."""
+        if self._log_store is None:
+            from log_store import LogStore
+
+            try:
+                self._log_store = LogStore(
+                    self.config.get("output_log_dir", DEFAULT_OUTPUT_LOG_DIR),
+                    codec=self.config.get("log_compression", DEFAULT_LOG_COMPRESSION),
+                )
+            except ValueError as ve:
+                messagebox.showerror("Ошибка", f"{ve} Логи будут сжиматься gzip.")
+                self._log_store = LogStore(
+                    self.config.get("output_log_dir", DEFAULT_OUTPUT_LOG_DIR)
+                )
+        return self._log_store
+
+    @property
+    def run_history(self):
+        """История запусков: время и ресурсы каждого завершившегося скрипта."""
+        if self._run_history is None:
+            from run_history import RunHistory
+
+            self._run_history = RunHistory()
+        return self._run_history
+
+    def create_warm_pool(self):
+        """Пул тёплых интерпретаторов, если он включён в конфигурации."""
+        if self.config.get("execution_mode", DEFAULT_EXECUTION_MODE) != "warm":
+            return None
+        from warm_pool import WarmPool
+
+        return WarmPool(self.config.get("warm_pool_size", DEFAULT_WARM_POOL_SIZE))
+
+    @property
+    def interpreters(self):
+        """Выбор интерпретатора и флагов для каждого скрипта."""
+        if self._interpreters is None:
+            from interpreters import InterpreterResolver
+
+            self._interpreters = InterpreterResolver(
+                self.config.setdefault("script_settings", {})
+            )
+        return self._interpreters
+
     def setup_styles(self):
         """Настройка пользовательских стилей."""
         # Стиль для заголовка
@@ -94,6 +212,15 @@ class ScriptRunnerGUI:
         )
         self.add_button.pack(side=LEFT, padx=5, pady=5)
 
+        self.import_button = ttkb.Button(
+            button_frame,
+            text="Добавить папку",
+            command=self.import_folder,
+            bootstyle=(PRIMARY, OUTLINE),
+            style="Custom.TButton",
+        )
+        self.import_button.pack(side=LEFT, padx=5, pady=5)
+
         self.run_button = ttkb.Button(
             button_frame,
             text="Запустить скрипт",
@@ -103,6 +230,24 @@ class ScriptRunnerGUI:
         )
         self.run_button.pack(side=LEFT, padx=5, pady=5)
 
+        self.batch_button = ttkb.Button(
+            button_frame,
+            text="Пакетный запуск",
+            command=self.run_batch,
+            bootstyle=INFO,
+            style="Custom.TButton",
+        )
+        self.batch_button.pack(side=LEFT, padx=5, pady=5)
+
+        self.pipeline_button = ttkb.Button(
+            button_frame,
+            text="Конвейеры",
+            command=self.open_pipeline_dialog,
+            bootstyle=INFO,
+            style="Custom.TButton",
+        )
+        self.pipeline_button.pack(side=LEFT, padx=5, pady=5)
+
         self.delete_button = ttkb.Button(
             button_frame,
             text="Удалить скрипт",
@@ -129,32 +274,56 @@ class ScriptRunnerGUI:
         )
         scripts_label.pack(anchor=W, pady=(0, 5))
 
-        self.scripts = self.config.get("scripts", [])
-
-        # Список скриптов
-        self.listbox = tk.Listbox(
+        self.registry = ScriptRegistry(self.config_manager)
+        self.scripts = self.registry.paths
+        # Скрипты, не прошедшие проверку существования
+        self.missing_scripts = set()
+        self._validation = None
+
+        # Поиск по имени скрипта
+        self.search_var = tk.StringVar()
+        self._search_after = None
+        search_entry = ttkb.Entry(left_content_frame, textvariable=self.search_var)
+        search_entry.pack(fill=X, pady=(0, 5))
+        self.search_var.trace_add("write", lambda *args: self.schedule_search())
+
+        # Список скриптов: отрисовываются только видимые строки
+        self.script_list = ScriptList(
             left_content_frame,
-            width=40,
-            height=20,
-            selectmode=SINGLE,
-            exportselection=False,
+            on_select=self.display_documentation,
+            marked=self.missing_scripts,
+            mark_color=self.style.colors.danger,
         )
-        self.listbox.pack(side=LEFT, fill=Y, expand=True)
-        self.listbox.bind("<<ListboxSelect>>", self.display_documentation)
+        self.script_list.pack(fill=BOTH, expand=True)
 
-        # Скроллбар для списка скриптов
-        listbox_scrollbar = ttkb.Scrollbar(
-            left_content_frame,
-            orient=VERTICAL,
-            command=self.listbox.yview,
-            bootstyle="primary-round",
-        )
-        listbox_scrollbar.pack(side=RIGHT, fill=Y)
-        self.listbox.config(yscrollcommand=listbox_scrollbar.set)
+        # Настройка Drag & Drop для списка (файлы и папки)
+        self.script_list.listbox.drop_target_register(DND_FILES)
+        self.script_list.listbox.dnd_bind("<<Drop>>", self.drop_scripts)
 
-        # Настройка Drag & Drop для listbox
-        self.listbox.drop_target_register(DND_FILES)
-        self.listbox.dnd_bind("<<Drop>>", self.drop_scripts)
+        # Сводка о ненайденных скриптах (показывается после проверки)
+        self.missing_panel = ttkb.Frame(left_content_frame, padding=(0, 5, 0, 0))
+        self.missing_label = ttkb.Label(
+            self.missing_panel, text="", bootstyle=DANGER, wraplength=280
+        )
+        self.missing_label.pack(anchor=W, pady=(0, 5))
+        ttkb.Button(
+            self.missing_panel,
+            text="Подробнее",
+            command=self.show_missing_scripts,
+            bootstyle=(DANGER, OUTLINE),
+        ).pack(side=LEFT, padx=(0, 5))
+        ttkb.Button(
+            self.missing_panel,
+            text="Удалить из списка",
+            command=self.remove_missing_scripts,
+            bootstyle=DANGER,
+        ).pack(side=LEFT, padx=(0, 5))
+        ttkb.Button(
+            self.missing_panel,
+            text="Скрыть",
+            command=self.missing_panel.pack_forget,
+            bootstyle=(SECONDARY, OUTLINE),
+        ).pack(side=LEFT)
 
         # Правая часть: вывод и документация
         right_content_frame = ttkb.Frame(content_frame)
@@ -166,26 +335,10 @@ class ScriptRunnerGUI:
         )
         output_frame.pack(fill=BOTH, expand=True, pady=(0, 10))
 
-        self.output_text = tk.Text(
-            output_frame,
-            state="disabled",
-            wrap=WORD,
-            bg=self.style.lookup("TFrame", "background"),
-            fg=self.style.lookup("TLabel", "foreground"),
-            bd=0,
-            highlightthickness=0,
-        )
-        self.output_text.pack(side=LEFT, fill=BOTH, expand=True)
-
-        # Скроллбар для вывода
-        output_scrollbar = ttkb.Scrollbar(
-            output_frame,
-            orient=VERTICAL,
-            command=self.output_text.yview,
-            bootstyle="primary-round",
-        )
-        output_scrollbar.pack(side=RIGHT, fill=Y)
-        self.output_text.config(yscrollcommand=output_scrollbar.set)
+        # Вкладки: таблица задач и вывод каждой задачи
+        self.output_notebook = ttkb.Notebook(output_frame)
+        self.output_notebook.pack(fill=BOTH, expand=True)
+        self.create_jobs_tab()
 
         # Фрейм документации
         documentation_frame = ttkb.Labelframe(
@@ -224,9 +377,6 @@ class ScriptRunnerGUI:
         )
         self.status.pack(side=BOTTOM, fill=X)
 
-        # Заполнение списка скриптов
-        self.populate_listbox()
-
     def create_menu(self):
         """Создание меню приложения."""
         self.menubar = ttkb.Menu(self.master)
@@ -239,13 +389,11 @@ class ScriptRunnerGUI:
             label="Выход", command=self.master.quit, accelerator="Ctrl+Q"
         )
 
-        # Меню "Темы"
-        themes_menu = ttkb.Menu(self.menubar, tearoff=0)
-        self.menubar.add_cascade(label="Темы", menu=themes_menu)
-        for theme in self.style.theme_names():
-            themes_menu.add_command(
-                label=theme.capitalize(), command=lambda t=theme: self.change_theme(t)
-            )
+        # Меню "Темы" заполняется при первом открытии
+        self.themes_menu = ttkb.Menu(
+            self.menubar, tearoff=0, postcommand=self.populate_themes_menu
+        )
+        self.menubar.add_cascade(label="Темы", menu=self.themes_menu)
 
         # Меню "Настройки"
         settings_menu = ttkb.Menu(self.menubar, tearoff=0)
@@ -256,39 +404,240 @@ class ScriptRunnerGUI:
         settings_menu.add_command(
             label="Настройки Вывода Логов", command=self.open_output_settings_dialog
         )
+        settings_menu.add_command(
+            label="Настройки Скрипта", command=self.open_script_settings_dialog
+        )
+        settings_menu.add_command(
+            label="Ограничения Запуска", command=self.open_limits_dialog
+        )
+        self.warm_mode_var = tk.BooleanVar(
+            value=self.config.get("execution_mode", DEFAULT_EXECUTION_MODE) == "warm"
+        )
+        settings_menu.add_checkbutton(
+            label="Быстрый запуск (тёплые интерпретаторы)",
+            variable=self.warm_mode_var,
+            command=self.toggle_warm_mode,
+        )
 
         # Меню "Помощь"
         help_menu = ttkb.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label="Помощь", menu=help_menu)
         help_menu.add_command(label="О программе", command=self.show_about)
 
-    def populate_listbox(self):
-        """Заполнение списка скриптов из конфигурации."""
-        self.listbox.delete(0, tk.END)
-        valid_scripts = []
-        for script_path in self.scripts[:]:
-            if os.path.isfile(script_path) and script_path.endswith(".py"):
-                script_name = os.path.basename(script_path)
-                display_name = (
-                    (script_name[:97] + "...")
-                    if len(script_name) > 100
-                    else script_name
-                )
-                self.listbox.insert(tk.END, display_name)
-                valid_scripts.append(script_path)
-            else:
-                messagebox.showwarning(
-                    "Предупреждение",
-                    f"Скрипт '{script_path}' не найден или имеет неподдерживаемый формат.",
-                )
-                self.scripts.remove(script_path)
-        self.config_manager.update("scripts", self.scripts)
+    def create_jobs_tab(self):
+        """Создание вкладки с таблицей задач."""
+        jobs_frame = ttkb.Frame(self.output_notebook, padding="5")
+        self.output_notebook.add(jobs_frame, text="Задачи")
+
+        toolbar = ttkb.Frame(jobs_frame)
+        toolbar.pack(fill=X, pady=(0, 5))
+        ttkb.Button(
+            toolbar,
+            text="Открыть вывод",
+            command=self.open_selected_job,
+            bootstyle=(INFO, OUTLINE),
+        ).pack(side=LEFT, padx=(0, 5))
+        ttkb.Button(
+            toolbar,
+            text="Остановить",
+            command=self.stop_selected_job,
+            bootstyle=(DANGER, OUTLINE),
+        ).pack(side=LEFT, padx=(0, 5))
+        ttkb.Button(
+            toolbar,
+            text="Закрыть вкладку",
+            command=self.close_job_tab,
+            bootstyle=(SECONDARY, OUTLINE),
+        ).pack(side=LEFT, padx=(0, 5))
+        ttkb.Button(
+            toolbar,
+            text="Убрать завершённые",
+            command=self.clear_finished_jobs,
+            bootstyle=(SECONDARY, OUTLINE),
+        ).pack(side=LEFT, padx=(0, 5))
+        ttkb.Button(
+            toolbar,
+            text="История запусков",
+            command=self.open_history_dialog,
+            bootstyle=(INFO, OUTLINE),
+        ).pack(side=LEFT, padx=(0, 5))
+        ttkb.Button(
+            toolbar,
+            text="Логи запусков",
+            command=self.open_log_search_dialog,
+            bootstyle=(INFO, OUTLINE),
+        ).pack(side=LEFT)
+
+        # Индикатор выполнения пакетного запуска
+        self.current_batch = None
+        self.batch_label = ttkb.Label(toolbar, text="")
+        self.batch_label.pack(side=RIGHT, padx=(5, 0))
+        self.batch_progress = ttkb.Progressbar(
+            toolbar, length=150, mode="determinate", bootstyle=SUCCESS
+        )
+        self.batch_progress.pack(side=RIGHT)
+
+        columns = (
+            "id",
+            "script",
+            "args",
+            "status",
+            "pid",
+            "start",
+            "elapsed",
+            "cpu",
+            "rss",
+            "exit_code",
+        )
+        headings = (
+            "№",
+            "Скрипт",
+            "Аргументы",
+            "Статус",
+            "PID",
+            "Начало",
+            "Время",
+            "ЦП",
+            "Память",
+            "Код",
+        )
+        widths = (40, 160, 200, 100, 70, 80, 80, 70, 90, 50)
+        self.jobs_table = ttkb.Treeview(
+            jobs_frame, columns=columns, show="headings", selectmode="browse"
+        )
+        for column, heading, width in zip(columns, headings, widths):
+            self.jobs_table.heading(column, text=heading)
+            self.jobs_table.column(column, width=width, stretch=column == "args")
+        self.jobs_table.pack(side=LEFT, fill=BOTH, expand=True)
+        self.jobs_table.bind("<Double-1>", lambda e: self.open_selected_job())
+
+        jobs_scrollbar = ttkb.Scrollbar(
+            jobs_frame,
+            orient=VERTICAL,
+            command=self.jobs_table.yview,
+            bootstyle="primary-round",
+        )
+        jobs_scrollbar.pack(side=RIGHT, fill=Y)
+        self.jobs_table.config(yscrollcommand=jobs_scrollbar.set)
 
-        if valid_scripts:
-            self.status.config(text=f"Загружено {len(valid_scripts)} скриптов.")
+    def populate_themes_menu(self):
+        """Заполнение меню тем при первом открытии."""
+        if self.themes_menu.index(END) is not None:
+            return
+        for theme in self.style.theme_names():
+            self.themes_menu.add_command(
+                label=theme.capitalize(), command=lambda t=theme: self.change_theme(t)
+            )
+
+    def populate_listbox(self):
+        """
+        Заполнение списка скриптов из конфигурации.
+
+        Список заполняется сразу, а существование файлов проверяется в
+        фоне: ненайденные скрипты отмечаются цветом по мере поступления
+        результатов и собираются в одну сводку под списком.
+        """
+        self.missing_scripts.clear()
+        self.missing_panel.pack_forget()
+        self.update_script_list()
+
+        if self.scripts:
+            self.status.config(
+                text=f"Загружено {len(self.scripts)} скриптов, идёт проверка..."
+            )
+            self._validation = self.registry.validate()
+            self.master.after(SCRIPT_VALIDATION_POLL_MS, self.poll_validation)
         else:
             self.status.config(text="Нет добавленных скриптов.")
 
+    def update_script_list(self):
+        """Отображение всех скриптов или результатов текущего поиска."""
+        query = self.search_var.get().strip()
+        if query:
+            self.script_list.set_items(self.registry.search(query))
+        else:
+            self.script_list.set_items(list(self.scripts))
+
+    def schedule_search(self):
+        """Поиск после паузы в наборе, чтобы не искать на каждое нажатие."""
+        if self._search_after is not None:
+            self.master.after_cancel(self._search_after)
+        self._search_after = self.master.after(
+            LIBRARY_SEARCH_DELAY_MS, self.apply_search
+        )
+
+    def apply_search(self):
+        self._search_after = None
+        self.update_script_list()
+        query = self.search_var.get().strip()
+        if query:
+            self.status.config(
+                text=f"Найдено скриптов: {len(self.script_list.items)} "
+                f"из {len(self.scripts)}."
+            )
+        else:
+            self.status.config(text=f"Всего скриптов: {len(self.scripts)}.")
+
+    def poll_validation(self):
+        """Приём результатов фоновой проверки скриптов."""
+        if self._validation is None:
+            return
+        marked = False
+        while True:
+            try:
+                result = self._validation.get_nowait()
+            except queue.Empty:
+                break
+            if result is None:
+                self._validation = None
+                break
+            script_path, valid = result
+            # Скрипт мог быть удалён из списка, пока шла проверка
+            if not valid and script_path in self.registry:
+                self.missing_scripts.add(script_path)
+                marked = True
+        if marked:
+            self.script_list.refresh()
+        if self._validation is not None:
+            self.master.after(SCRIPT_VALIDATION_POLL_MS, self.poll_validation)
+            return
+        self.update_missing_panel()
+        self.status.config(text=f"Загружено {len(self.scripts)} скриптов.")
+
+    def update_missing_panel(self):
+        """Показ или скрытие сводки о ненайденных скриптах."""
+        if not self.missing_scripts:
+            self.missing_panel.pack_forget()
+            return
+        self.missing_label.config(
+            text=f"Не найдено или имеют неподдерживаемый формат: "
+            f"{len(self.missing_scripts)} скриптов."
+        )
+        self.missing_panel.pack(side=BOTTOM, fill=X, before=self.script_list.frame)
+
+    def show_missing_scripts(self):
+        """Список ненайденных скриптов в одном окне."""
+        paths = [path for path in self.scripts if path in self.missing_scripts]
+        shown = paths[:30]
+        if len(paths) > len(shown):
+            shown.append(f"... и ещё {len(paths) - len(shown)}")
+        messagebox.showwarning(
+            "Ненайденные скрипты",
+            "Следующие скрипты не найдены или имеют неподдерживаемый формат:\n\n"
+            + "\n".join(shown),
+        )
+
+    def remove_missing_scripts(self):
+        """Удаление всех ненайденных скриптов из списка."""
+        removed = self.registry.remove(self.missing_scripts)
+        self.missing_scripts.clear()
+        self.update_missing_panel()
+        self.update_script_list()
+        self.clear_documentation()
+        self.registry.save()
+        self.sync_watcher()
+        self.status.config(text=f"Удалено ненайденных скриптов: {len(removed)}.")
+
     def bind_fixed_hotkeys(self):
         """Привязка фиксированных горячих клавиш на основе конфигурации."""
         hotkeys = self.config.get("hotkeys", DEFAULT_HOTKEYS)
@@ -310,10 +659,16 @@ class ScriptRunnerGUI:
             f"<{hotkeys.get('delete_script', 'Delete')}>",
             lambda e: self.remove_script(),
         )
+        self.master.bind_all(
+            f"<{hotkeys.get('find_output', 'Control-f')}>",
+            lambda e: self.find_in_output(),
+        )
 
     def change_theme(self, theme):
         """Изменение темы приложения и сохранение выбора в конфигурационном файле."""
         self.style.theme_use(theme)
+        self.script_list.mark_color = self.style.colors.danger
+        self.script_list.refresh()
         self.status.config(text=f"Тема изменена на: {theme.capitalize()}")
         self.config_manager.update("theme", theme)
 
@@ -326,6 +681,8 @@ class ScriptRunnerGUI:
 
     def add_script(self):
         """Добавление скриптов через диалоговое окно."""
+        from tkinter import filedialog
+
         file_paths = filedialog.askopenfilenames(
             title="Выберите скрипты",
             filetypes=[("Python files", "*.py")],
@@ -333,74 +690,133 @@ class ScriptRunnerGUI:
         )
         self._add_scripts(file_paths)
 
+    def import_folder(self):
+        """Рекурсивное добавление всех скриптов из папки."""
+        from tkinter import filedialog
+
+        folder = filedialog.askdirectory(
+            title="Выберите папку со скриптами", initialdir=os.getcwd()
+        )
+        if folder:
+            self.start_folder_import([folder])
+
+    def start_folder_import(self, folders):
+        """Обход папок в фоновом потоке; найденные скрипты добавляются по готовности."""
+        results = queue.Queue()
+
+        def scan():
+            for folder in folders:
+                results.put(self.registry.scan_folder(folder))
+            results.put(None)
+
+        threading.Thread(target=scan, daemon=True).start()
+        self.status.config(text="Поиск скриптов в папке...")
+        self.master.after(
+            SCRIPT_VALIDATION_POLL_MS, self.poll_folder_import, results, 0, 0
+        )
+
+    def poll_folder_import(self, results, found, added):
+        """Приём результатов обхода папок."""
+        while True:
+            try:
+                paths = results.get_nowait()
+            except queue.Empty:
+                self.master.after(
+                    SCRIPT_VALIDATION_POLL_MS,
+                    self.poll_folder_import,
+                    results,
+                    found,
+                    added,
+                )
+                return
+            if paths is None:
+                break
+            new_paths = self.registry.add(paths)
+            self.scripts_added(new_paths)
+            found += len(paths)
+            added += len(new_paths)
+        self.status.config(
+            text=f"Найдено скриптов в папке: {found}, добавлено новых: {added}."
+        )
+
     def drop_scripts(self, event):
-        """Добавление скриптов через Drag & Drop."""
-        file_paths = self.master.tk.splitlist(event.data)
-        self._add_scripts(file_paths)
+        """Добавление скриптов и папок через Drag & Drop."""
+        paths = [path.strip("{}") for path in self.master.tk.splitlist(event.data)]
+        folders = [path for path in paths if os.path.isdir(path)]
+        if folders:
+            self.start_folder_import(folders)
+        files = [path for path in paths if path not in folders]
+        if files:
+            self._add_scripts(files)
 
     def _add_scripts(self, file_paths):
         """Внутренняя функция для добавления скриптов."""
-        added = False
-        for path in file_paths:
-            path = path.strip("{}")
-            if (
-                path not in self.scripts
-                and path.endswith(".py")
-                and os.path.isfile(path)
-            ):
-                self.scripts.append(path)
-                script_name = os.path.basename(path)
-                display_name = (
-                    (script_name[:97] + "...")
-                    if len(script_name) > 100
-                    else script_name
-                )
-                self.listbox.insert(tk.END, display_name)
-                self.status.config(text=f"Добавлен скрипт: {display_name}")
-                added = True
-            else:
-                messagebox.showwarning(
-                    "Неподдерживаемый формат",
-                    f"Файл '{os.path.basename(path)}' не является Python-скриптом или уже добавлен.",
-                )
-        if not added and file_paths:
-            self.status.config(
-                text="Все выбранные скрипты уже добавлены или имеют неподдерживаемый формат."
+        paths = [path.strip("{}") for path in file_paths]
+        valid = [path for path in paths if self.registry.is_valid(path)]
+        added = self.registry.add(valid)
+        self.scripts_added(added)
+        skipped = len(paths) - len(added)
+        if len(added) == 1:
+            text = f"Добавлен скрипт: {ScriptList.display_name(added[0])}"
+        else:
+            text = f"Добавлено скриптов: {len(added)}"
+        if skipped:
+            text += f", пропущено (уже добавлены или не .py): {skipped}"
+        self.status.config(text=text + ".")
+        if not added and paths:
+            messagebox.showwarning(
+                "Неподдерживаемый формат",
+                "Выбранные файлы не являются Python-скриптами или уже добавлены.",
             )
-        self.config_manager.update("scripts", self.scripts)
+
+    def scripts_added(self, added):
+        """Обновление списка, наблюдения и кэша после добавления скриптов."""
+        if not added:
+            return
+        self.update_script_list()
+        self.script_list.select(added[-1])
+        self.registry.save()
+        self.sync_watcher()
+        self.metadata_cache.warm(added)
+        self.schedule_metadata_poll()
 
     def remove_script(self):
         """Удаление выбранного скрипта."""
-        selected_indices = self.listbox.curselection()
-        if not selected_indices:
+        script_path = self.script_list.selection()
+        if script_path is None:
             messagebox.showwarning(
                 "Предупреждение", "Пожалуйста, выберите скрипт для удаления."
             )
             return
-        index = selected_indices[0]
-        script_name = os.path.basename(self.scripts[index])
+        script_name = os.path.basename(script_path)
         confirm = messagebox.askyesno(
             "Подтверждение", f"Вы действительно хотите удалить скрипт '{script_name}'?"
         )
         if confirm:
-            self.listbox.delete(index)
-            del self.scripts[index]
+            self.registry.remove([script_path])
+            if script_path in self.missing_scripts:
+                self.missing_scripts.remove(script_path)
+                self.update_missing_panel()
+            self.update_script_list()
             self.status.config(text=f"Удален скрипт: {script_name}")
             self.clear_documentation()
-            self.config_manager.update("scripts", self.scripts)
+            self.registry.save()
+            self.sync_watcher()
 
     def run_script(self):
         """Запуск выбранного скрипта."""
-        selected_indices = self.listbox.curselection()
-        if not selected_indices:
+        script_path = self.script_list.selection()
+        if script_path is None:
             messagebox.showwarning(
                 "Предупреждение", "Пожалуйста, выберите скрипт для запуска."
             )
             return
-        index = selected_indices[0]
-        script_path = self.scripts[index]
         script_name = os.path.basename(script_path)
 
+        from tkinter import simpledialog
+
+        from runner import build_command, split_args
+
         # Запрос аргументов для скрипта
         args = simpledialog.askstring(
             "Аргументы",
@@ -411,10 +827,9 @@ class ScriptRunnerGUI:
             self.status.config(text="Запуск скрипта отменен.")
             return
 
-        # Разбор аргументов
+        # Разбор аргументов и флагов интерпретатора
         try:
-            posix = os.name != "nt"
-            parsed_args = shlex.split(args, posix=posix)
+            command = build_command(script_path, split_args(args), self.interpreters)
         except ValueError as ve:
             messagebox.showerror(
                 "Ошибка разбора аргументов",
@@ -423,106 +838,396 @@ class ScriptRunnerGUI:
             self.status.config(text="Ошибка разбора аргументов.")
             return
 
-        command = ["python", script_path] + parsed_args
+        job = self.job_manager.submit(
+            script_path,
+            command,
+            max_lines=self.config.get("output_max_lines", DEFAULT_OUTPUT_MAX_LINES),
+            colored=self.config.get("colored_output", True),
+            args=args,
+            limits=self.script_limits(script_path),
+        )
+        self.update_job_row(job)
+        self.open_job_tab(job)
+        self.status.config(text=f"Задача #{job.id} поставлена в очередь: {script_name}")
+        self.schedule_job_poll()
+
+    def run_batch(self):
+        """Пакетный запуск выбранного скрипта с несколькими наборами аргументов."""
+        script_path = self.script_list.selection()
+        if script_path is None:
+            messagebox.showwarning(
+                "Предупреждение", "Пожалуйста, выберите скрипт для запуска."
+            )
+            return
+        from dialogs import BatchDialog
+
+        BatchDialog(
+            self.master,
+            os.path.basename(script_path),
+            self.job_manager.max_concurrent,
+            lambda lines, workers: self.start_batch(script_path, lines, workers),
+        )
+
+    def start_batch(self, script_path, lines, workers):
+        """
+        Постановка пакета в очередь.
 
-        self.output_text.config(state="normal")
-        self.output_text.delete(1.0, tk.END)
-        self.output_text.insert(tk.END, f"Запуск скрипта: {' '.join(command)}\n\n")
-        self.output_text.config(state="disabled")
+        Returns:
+            bool: True, если все строки аргументов разобраны и пакет запущен.
+        """
+        from runner import build_command, split_args
+
+        items = []
+        for number, line in enumerate(lines, start=1):
+            try:
+                command = build_command(
+                    script_path, split_args(line), self.interpreters
+                )
+            except ValueError as ve:
+                messagebox.showerror(
+                    "Ошибка разбора аргументов",
+                    f"Не удалось разобрать строку {number}: {ve}",
+                )
+                return False
+            items.append((line, command))
+
+        batch = self.job_manager.submit_batch(
+            script_path,
+            items,
+            workers,
+            max_lines=self.config.get("output_max_lines", DEFAULT_OUTPUT_MAX_LINES),
+            colored=self.config.get("colored_output", True),
+            limits=self.script_limits(script_path),
+        )
+        for job in batch.jobs:
+            self.update_job_row(job)
+        self.current_batch = batch
+        self.update_batch_progress(batch)
+        self.output_notebook.select(0)
+        self.status.config(
+            text=f"Пакет #{batch.id}: {batch.total} запусков, до {batch.max_workers} параллельно"
+        )
+        self.schedule_job_poll()
+        return True
+
+    def open_pipeline_dialog(self):
+        """Открытие списка конвейеров из конфигурации."""
+        from dialogs import PipelineDialog
+
+        PipelineDialog(
+            self.master, self.config.get("pipelines", {}), self.start_pipeline
+        )
 
-        self.status.config(text=f"Запуск скрипта: {script_name}")
+    def start_pipeline(self, name, force=False):
+        """
+        Запуск конвейера и открытие окна с ходом его выполнения.
 
-        # Запуск скрипта в отдельном потоке
-        thread = threading.Thread(target=self.execute_script, args=(command,))
-        thread.start()
+        Returns:
+            bool: True, если описание конвейера корректно и он запущен.
+        """
+        from dialogs import PipelineTimelineDialog
+        from pipeline import Pipeline, PipelineState
 
-    def execute_script(self, command):
-        """Выполнение скрипта и захват вывода."""
         try:
-            process = subprocess.Popen(
-                command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            pipeline = Pipeline.from_config(
+                name, self.config.get("pipelines", {}).get(name), self.registry.find
+            )
+        except (ValueError, LookupError) as e:
+            messagebox.showerror("Ошибка в описании конвейера", str(e))
+            return False
+        if self._pipeline_state is None:
+            self._pipeline_state = PipelineState()
+        run = self.job_manager.submit_pipeline(
+            pipeline, self.prepare_pipeline_step, self._pipeline_state, force
+        )
+        PipelineTimelineDialog(self.master, run, lambda: run.stop(self.job_manager))
+        self.output_notebook.select(0)
+        self.status.config(text=f"Конвейер «{name}» #{run.id} запущен.")
+        self.schedule_job_poll()
+        return True
+
+    def prepare_pipeline_step(self, step):
+        """Команда и параметры задачи для шага конвейера."""
+        from runner import build_command, split_args
+
+        command = build_command(
+            step.script_path, split_args(step.args), self.interpreters
+        )
+        return command, {
+            "max_lines": self.config.get("output_max_lines", DEFAULT_OUTPUT_MAX_LINES),
+            "colored": self.config.get("colored_output", True),
+            "limits": self.script_limits(step.script_path),
+        }
+
+    def update_batch_progress(self, batch):
+        """Обновление индикатора выполнения текущего пакета."""
+        if batch is not self.current_batch:
+            return
+        self.batch_progress.config(maximum=batch.total, value=batch.completed)
+        if batch.done:
+            self.batch_label.config(text=batch.summary())
+        else:
+            self.batch_label.config(
+                text=f"Пакет #{batch.id}: {batch.completed}/{batch.total}, "
+                f"выполняется {batch.running}, ошибок {batch.failed}"
             )
-            stdout, stderr = process.communicate()
-            combined_output = stdout + stderr
-            self.master.after(0, self.update_output, combined_output)
-        except Exception as e:
-            self.master.after(0, self.update_output, f"Ошибка при запуске скрипта: {e}")
 
-    def update_output(self, output):
-        """Обновление вывода скрипта."""
-        self.output_text.config(state="normal")
-        if self.config.get("colored_output", True):
-            self.insert_colored_text(output)
+    def schedule_job_poll(self):
+        """Планирование обслуживания задач, если оно ещё не запланировано."""
+        if not self._job_poll_scheduled:
+            self._job_poll_scheduled = True
+            self.master.after(OUTPUT_FLUSH_INTERVAL_MS, self.poll_jobs)
+
+    def poll_jobs(self):
+        """Запуск задач из очереди, перенос их вывода и обновление таблицы."""
+        self._job_poll_scheduled = False
+        output, changed = self.job_manager.poll()
+        for job, runs in output:
+            console = self.job_consoles.get(job.id)
+            if console is not None and runs:
+                console.show(runs)
+
+        for job in changed:
+            self.update_job_row(job)
+            if job.batch is not None:
+                self.update_batch_progress(job.batch)
+                if job.batch.done and not job.active:
+                    self.status.config(text=job.batch.summary())
+            elif job.pipeline is not None:
+                if job.pipeline.done:
+                    self.status.config(text=job.pipeline.summary())
+            elif not job.active:
+                message = (
+                    f"Задача #{job.id} ({job.name}): {job.status_name.lower()}, "
+                    f"код завершения {job.exit_code}."
+                )
+                if job.log is not None:
+                    message += " Полный лог — в «Логах запусков»."
+                self.status.config(text=message)
+
+        # Время выполнения в таблице обновляется реже, чем вывод
+        now = time.monotonic()
+        if now - self._jobs_table_refreshed >= JOBS_TABLE_REFRESH_MS / 1000:
+            self._jobs_table_refreshed = now
+            for job in self.job_manager.running:
+                self.update_job_row(job)
+
+        if self.job_manager.active:
+            self.schedule_job_poll()
+
+    def update_job_row(self, job):
+        """Добавление или обновление строки задачи в таблице."""
+        from run_history import format_bytes
+
+        usage = job.usage or {}
+        values = (
+            job.id,
+            job.name,
+            job.args,
+            job.status_name,
+            job.pid or "",
+            time.strftime("%H:%M:%S", time.localtime(job.start_time))
+            if job.start_time
+            else "",
+            f"{job.elapsed:.1f} с" if job.elapsed is not None else "",
+            f"{usage['user'] + usage['system']:.1f} с" if "user" in usage else "",
+            format_bytes(usage.get("max_rss")),
+            "" if job.exit_code is None else job.exit_code,
+        )
+        item = str(job.id)
+        if self.jobs_table.exists(item):
+            self.jobs_table.item(item, values=values)
         else:
-            clean_output = self.ANSI_ESCAPE_PATTERN.sub("", output)
-            self.output_text.insert(tk.END, clean_output)
-        self.output_text.config(state="disabled")
-        self.status.config(text="Готово")
-
-    def insert_colored_text(self, text):
-        """Вставка текста с цветами на основе ANSI escape последовательностей."""
-        current_color = None
-        last_end = 0
-
-        for match in self.ANSI_ESCAPE_PATTERN.finditer(text):
-            start, end = match.span()
-            if start > last_end:
-                segment = text[last_end:start]
-                if current_color:
-                    self.output_text.insert(tk.END, segment, current_color)
-                else:
-                    self.output_text.insert(tk.END, segment)
-            ansi_codes = match.group()[2:-1].split(";")
-            for code in ansi_codes:
-                if code == "0":
-                    current_color = None
-                elif code in ANSI_COLOR_MAP:
-                    color = ANSI_COLOR_MAP[code]
-                    if color not in self.output_text.tag_names():
-                        try:
-                            self.output_text.tag_configure(color, foreground=color)
-                        except tk.TclError:
-                            continue
-                    current_color = color
-            last_end = end
-
-        # Вставка оставшегося текста
-        if last_end < len(text):
-            segment = text[last_end:]
-            if current_color:
-                self.output_text.insert(tk.END, segment, current_color)
-            else:
-                self.output_text.insert(tk.END, segment)
-
-    def display_documentation(self, event):
-        """Отображение документации выбранного скрипта."""
-        selected_indices = self.listbox.curselection()
-        if not selected_indices:
+            self.jobs_table.insert("", END, iid=item, values=values)
+
+    def open_selected_job(self):
+        """Открытие вкладки вывода задачи, выбранной в таблице."""
+        selection = self.jobs_table.selection()
+        if selection:
+            job = self.job_manager.jobs.get(int(selection[0]))
+            if job is not None:
+                self.open_job_tab(job)
+
+    def open_job_tab(self, job):
+        """Открытие (или выбор уже открытой) вкладки с выводом задачи."""
+        console = self.job_consoles.get(job.id)
+        if console is None:
+            from widgets import OutputConsole
+
+            console = OutputConsole(
+                self.output_notebook,
+                bg=self.style.lookup("TFrame", "background"),
+                fg=self.style.lookup("TLabel", "foreground"),
+            )
+            console.attach(job.buffer)
+            self.bind_mousewheel(console.text)
+            self.output_notebook.add(console.frame, text=f"#{job.id} {job.name}")
+            self.job_consoles[job.id] = console
+        self.output_notebook.select(console.frame)
+
+    def stop_selected_job(self):
+        """Остановка задачи, выбранной в таблице или открытой на текущей вкладке."""
+        job_id = None
+        selection = self.jobs_table.selection()
+        if selection:
+            job_id = int(selection[0])
+        else:
+            current = self.output_notebook.select()
+            for console_job_id, console in self.job_consoles.items():
+                if str(console.frame) == current:
+                    job_id = console_job_id
+                    break
+        if job_id is None:
+            messagebox.showwarning(
+                "Предупреждение", "Выберите задачу в таблице или откройте её вывод."
+            )
+            return
+        job = self.job_manager.stop(job_id)
+        if job is None:
+            self.status.config(text="Задача уже завершена.")
+            return
+        self.update_job_row(job)
+        self.status.config(text=f"Задача #{job.id} останавливается: {job.name}")
+        self.schedule_job_poll()
+
+    def find_in_output(self):
+        """Открытие поиска в выводе задачи на текущей вкладке."""
+        current = self.output_notebook.select()
+        for console in self.job_consoles.values():
+            if str(console.frame) == current:
+                console.open_find()
+                return
+        self.status.config(text="Откройте вкладку с выводом задачи для поиска.")
+
+    def close_job_tab(self):
+        """Закрытие текущей вкладки вывода задачи (задача продолжает работу)."""
+        current = self.output_notebook.select()
+        for job_id, console in list(self.job_consoles.items()):
+            if str(console.frame) == current:
+                self.output_notebook.forget(console.frame)
+                console.frame.destroy()
+                del self.job_consoles[job_id]
+                break
+
+    def clear_finished_jobs(self):
+        """Удаление завершённых задач из таблицы и закрытие их вкладок."""
+        for job in list(self.job_manager.jobs.values()):
+            if job.active:
+                continue
+            console = self.job_consoles.pop(job.id, None)
+            if console is not None:
+                self.output_notebook.forget(console.frame)
+                console.frame.destroy()
+            self.jobs_table.delete(str(job.id))
+            self.job_manager.remove(job.id)
+
+    def display_documentation(self, event=None):
+        """Отображение документации и аргументов выбранного скрипта."""
+        script_path = self.script_list.selection()
+        if script_path is None:
             self.clear_documentation()
             return
-        index = selected_indices[0]
-        script_path = self.scripts[index]
         doc = self.get_script_docstring(script_path)
+        arguments = self.metadata_cache.arguments(script_path)
+        if arguments is None:
+            # Полный разбор файла — в фоне; панель обновится по готовности
+            self.metadata_cache.warm([script_path], first=True)
+            self.schedule_metadata_poll()
         self.documentation_text.config(state="normal")
         self.documentation_text.delete(1.0, tk.END)
         if doc:
             self.documentation_text.insert(tk.END, doc)
         else:
             self.documentation_text.insert(tk.END, "Документация не найдена.")
+        if arguments:
+            from metadata_cache import describe_arguments
+
+            self.documentation_text.insert(
+                tk.END, "\n\nАргументы:\n" + describe_arguments(arguments)
+            )
         self.documentation_text.config(state="disabled")
         script_name = os.path.basename(script_path)
         self.status.config(text=f"Отображение документации для: {script_name}")
 
     def get_script_docstring(self, script_path):
-        """Извлечение docstring из скрипта."""
+        """Извлечение docstring из скрипта (через кэш метаданных)."""
         try:
-            with open(script_path, "r", encoding="utf-8") as f:
-                node = ast.parse(f.read())
-                return ast.get_docstring(node)
+            return self.metadata_cache.docstring(script_path)
         except Exception as e:
             print(f"Ошибка при чтении документации из {script_path}: {e}")
             return None
 
+    def schedule_metadata_poll(self):
+        if not self._metadata_poll_scheduled:
+            self._metadata_poll_scheduled = True
+            self.master.after(METADATA_POLL_MS, self.poll_metadata)
+
+    def poll_metadata(self):
+        """Обновление документации, когда метаданные выбранного скрипта готовы."""
+        self._metadata_poll_scheduled = False
+        updated = set()
+        while True:
+            try:
+                updated.add(self.metadata_cache.updated.get_nowait())
+            except queue.Empty:
+                break
+        if self.script_list.selection() in updated:
+            self.display_documentation()
+        if self.metadata_cache.busy:
+            self.schedule_metadata_poll()
+
+    def sync_watcher(self):
+        """Передача наблюдателю изменившегося списка скриптов."""
+        if self.watcher is not None:
+            self.watcher.set_paths(self.scripts)
+
+    def poll_watcher(self):
+        """Обновление строк списка по изменениям файлов скриптов."""
+        batches = []
+        while True:
+            try:
+                batches.append(self.watcher.events.get_nowait())
+            except queue.Empty:
+                break
+        if batches:
+            self.apply_script_changes(
+                [change for batch in batches for change in batch]
+            )
+        self.master.after(WATCHER_EVENTS_POLL_MS, self.poll_watcher)
+
+    def apply_script_changes(self, changes):
+        """
+        Учёт изменившихся скриптов: отметка отсутствующих и сброс кэша.
+
+        Args:
+            changes: Пары (путь, файл существует).
+        """
+        missing_changed = False
+        existing = []
+        selected = self.script_list.selection()
+        refresh = False
+        for script_path, exists in changes:
+            if script_path not in self.registry:
+                continue
+            self.metadata_cache.invalidate(script_path)
+            refresh |= script_path == selected
+            if not exists and script_path not in self.missing_scripts:
+                self.missing_scripts.add(script_path)
+                missing_changed = True
+            elif exists:
+                existing.append(script_path)
+                if script_path in self.missing_scripts:
+                    self.missing_scripts.remove(script_path)
+                    missing_changed = True
+        if missing_changed:
+            self.script_list.refresh()
+            self.update_missing_panel()
+        if existing:
+            self.metadata_cache.warm(existing)
+            self.schedule_metadata_poll()
+        if refresh:
+            self.display_documentation()
+
     def clear_documentation(self):
         """Очистка области документации."""
         self.documentation_text.config(state="normal")
@@ -536,8 +1241,21 @@ class ScriptRunnerGUI:
 
     def on_closing(self):
         """Обработка события закрытия окна."""
+        if self._job_manager is not None and self._job_manager.active:
+            confirm = messagebox.askyesno(
+                "Подтверждение",
+                "Есть выполняющиеся задачи. Прервать их и выйти?",
+            )
+            if not confirm:
+                return
+            self.job_manager.shutdown()
         window_size = self.master.geometry()
         self.config_manager.update("window_size", window_size)
+        self.config_manager.flush()
+        if self.watcher is not None:
+            self.watcher.stop()
+        if self._metadata_cache is not None:
+            self._metadata_cache.save()
         self.master.destroy()
 
     def bind_mousewheel(self, widget):
@@ -551,17 +1269,21 @@ class ScriptRunnerGUI:
 
     def open_hotkeys_dialog(self):
         """Открытие диалога настройки горячих клавиш."""
-        HotkeysDialog(
-            self.master,
-            self.config.get("hotkeys", DEFAULT_HOTKEYS),
-            self.update_hotkeys,
-        )
+        from dialogs import HotkeysDialog
+
+        # Действия, добавленные после сохранения конфигурации, — со значениями
+        # по умолчанию
+        hotkeys = dict(DEFAULT_HOTKEYS, **self.config.get("hotkeys", {}))
+        HotkeysDialog(self.master, hotkeys, self.update_hotkeys)
 
     def open_output_settings_dialog(self):
         """Открытие диалога настройки вывода логов."""
+        from dialogs import OutputSettingsDialog
+
         OutputSettingsDialog(
             self.master,
             self.config.get("colored_output", True),
+            self.config.get("output_max_lines", DEFAULT_OUTPUT_MAX_LINES),
             self.update_output_settings,
         )
 
@@ -571,25 +1293,90 @@ class ScriptRunnerGUI:
         self.bind_fixed_hotkeys()
         self.status.config(text="Горячие клавиши обновлены.")
 
-    def update_output_settings(self, new_colored_output):
+    def update_output_settings(self, new_colored_output, new_max_lines):
         """Обновление настроек вывода логов и сохранение конфигурации."""
         self.config_manager.update("colored_output", new_colored_output)
-        if new_colored_output:
-            self.create_ansi_tags()
-        else:
-            for tag in ANSI_COLOR_MAP.values():
-                if tag in self.output_text.tag_names():
-                    self.output_text.tag_delete(tag)
+        self.config_manager.update("output_max_lines", new_max_lines)
+        # Лимит строк применяется к задачам, запущенным после изменения
+        for console in self.job_consoles.values():
+            console.set_colored(new_colored_output)
         self.status.config(text="Настройки вывода логов обновлены.")
 
-    def create_ansi_tags(self):
-        """Создание тегов для ANSI цветов в текстовом поле вывода."""
-        for code, color in ANSI_COLOR_MAP.items():
-            if color not in self.output_text.tag_names():
-                try:
-                    self.output_text.tag_configure(color, foreground=color)
-                except tk.TclError:
-                    continue
+    def open_history_dialog(self):
+        """Открытие истории запусков (с выбранным в списке скриптом)."""
+        from dialogs import HistoryDialog
+
+        HistoryDialog(self.master, self.run_history, self.script_list.selection())
+
+    def open_log_search_dialog(self):
+        """Открытие поиска по сохранённым логам запусков."""
+        from dialogs import LogSearchDialog
+
+        LogSearchDialog(self.master, self.log_store)
+
+    def open_script_settings_dialog(self):
+        """Открытие диалога настроек выбранного скрипта."""
+        script_path = self.script_list.selection()
+        if script_path is None:
+            messagebox.showwarning("Предупреждение", "Пожалуйста, выберите скрипт.")
+            return
+        from dialogs import ScriptSettingsDialog
+        from interpreters import SOURCE_NAMES, InterpreterResolver
+
+        interpreter, source = InterpreterResolver.detect(script_path)
+        ScriptSettingsDialog(
+            self.master,
+            os.path.basename(script_path),
+            self.interpreters.settings(script_path),
+            f"{interpreter} ({SOURCE_NAMES[source]})",
+            lambda interpreter, flags, limits: self.update_script_settings(
+                script_path, interpreter, flags, limits
+            ),
+        )
+
+    def update_script_settings(self, script_path, interpreter, flags, limits):
+        """Сохранение интерпретатора, флагов и ограничений скрипта."""
+        self.interpreters.update(
+            script_path, interpreter=interpreter, flags=flags, limits=limits
+        )
+        self.config_manager.update("script_settings", self.interpreters.script_settings)
+        self.status.config(
+            text=f"Настройки скрипта обновлены: {os.path.basename(script_path)}"
+        )
+
+    def open_limits_dialog(self):
+        """Открытие диалога общих ограничений запуска."""
+        from dialogs import LimitsDialog
+
+        LimitsDialog(self.master, self.config.get("limits", {}), self.update_limits)
+
+    def update_limits(self, limits):
+        """Сохранение общих ограничений запуска."""
+        self.config_manager.update("limits", limits)
+        self.status.config(text="Ограничения запуска обновлены.")
+
+    def script_limits(self, script_path):
+        """Ограничения запуска скрипта: общие с поправками из настроек скрипта."""
+        from limits import Limits
+
+        return Limits.from_settings(
+            self.config.get("limits"),
+            self.interpreters.settings(script_path).get("limits"),
+        )
+
+    def toggle_warm_mode(self):
+        """Переключение между обычным запуском и пулом тёплых интерпретаторов."""
+        mode = "warm" if self.warm_mode_var.get() else "cold"
+        self.config_manager.update("execution_mode", mode)
+        if self._job_manager is not None:
+            # Задачи, уже запущенные в воркерах, доработают как обычно
+            if self._job_manager.pool is not None:
+                self._job_manager.pool.shutdown()
+            self._job_manager.pool = self.create_warm_pool()
+        if mode == "warm":
+            self.status.config(text="Скрипты запускаются в тёплых интерпретаторах.")
+        else:
+            self.status.config(text="Скрипты запускаются в новых процессах.")
 
 
 def main():
@@ -0,0 +1,292 @@
+# metadata_cache.py
+
+import ast
+import inspect
+import json
+import os
+import queue
+import threading
+import tokenize
+from collections import deque
+
+from constants import METADATA_CACHE_FILE
+
+CACHE_VERSION = 1
+
+
+def read_docstring(path):
+    """
+    Docstring модуля без разбора всего файла.
+
+    Токены читаются построчно только до первой инструкции модуля,
+    поэтому время не зависит от длины скрипта.
+
+    Returns:
+        str | None: Очищенный docstring или None, если его нет.
+    """
+    parts = []
+    with open(path, "rb") as f:
+        for token in tokenize.tokenize(f.readline):
+            if token.type in (tokenize.ENCODING, tokenize.COMMENT, tokenize.NL):
+                continue
+            if token.type == tokenize.STRING:
+                parts.append(token.string)
+                continue
+            if parts and (
+                token.type in (tokenize.NEWLINE, tokenize.ENDMARKER)
+                or token.string == ";"
+            ):
+                break
+            # Первая инструкция модуля — не строковый литерал
+            return None
+    if not parts:
+        return None
+    value = ast.literal_eval(" ".join(parts))
+    return inspect.cleandoc(value) if isinstance(value, str) else None
+
+
+def extract_arguments(tree):
+    """
+    Аргументы, объявленные через add_argument, в порядке их следования в файле.
+
+    Returns:
+        list[dict]: Словари с ключами names и, если заданы, help, required,
+        default, choices, nargs, action, type (значения — исходный код).
+    """
+    calls = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "add_argument"
+        ):
+            calls.append(node)
+    calls.sort(key=lambda node: (node.lineno, node.col_offset))
+
+    arguments = []
+    for call in calls:
+        names = [
+            arg.value
+            for arg in call.args
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+        ]
+        if not names:
+            continue
+        argument = {"names": names}
+        for keyword in call.keywords:
+            value = keyword.value
+            if keyword.arg == "help" and isinstance(value, ast.Constant):
+                argument["help"] = str(value.value)
+            elif keyword.arg == "required" and isinstance(value, ast.Constant):
+                argument["required"] = bool(value.value)
+            elif keyword.arg in ("default", "choices", "nargs", "action", "type"):
+                argument[keyword.arg] = ast.unparse(value)
+        arguments.append(argument)
+    return arguments
+
+
+def describe_arguments(arguments):
+    """Текстовое описание аргументов для панели документации."""
+    lines = []
+    for argument in arguments:
+        line = ", ".join(argument["names"])
+        details = []
+        if argument.get("required"):
+            details.append("обязательный")
+        for key, title in (
+            ("type", "тип"),
+            ("nargs", "количество"),
+            ("choices", "варианты"),
+            ("default", "по умолчанию"),
+        ):
+            if key in argument:
+                details.append(f"{title}: {argument[key]}")
+        if argument.get("action") in ("'store_true'", "'store_false'"):
+            details.append("флаг")
+        if details:
+            line += f" ({'; '.join(details)})"
+        if argument.get("help"):
+            line += f"\n    {argument['help']}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class MetadataCache:
+    """
+    Кэш метаданных скриптов: docstring и аргументы argparse.
+
+    Запись действительна, пока у файла не изменились (st_mtime_ns, st_size).
+    Кэш хранится в JSON файле между сессиями; заполнение (warm) идёт в
+    фоновом потоке, а пути с готовыми метаданными помещаются в очередь
+    updated. Запись без аргументов (arguments is None) означает, что
+    прочитан только заголовок модуля.
+    """
+
+    def __init__(self, cache_file=METADATA_CACHE_FILE):
+        self.cache_file = cache_file
+        self.entries = {}
+        self.updated = queue.Queue()
+        self._lock = threading.Lock()
+        # Сохранение из фонового потока и при выходе не должно пересекаться
+        self._save_lock = threading.Lock()
+        self._pending = deque()
+        self._worker = None
+        self._loaded = False
+        self._dirty = False
+
+    @property
+    def busy(self):
+        """Фоновое заполнение ещё выполняется."""
+        return self._worker is not None
+
+    def lookup(self, path):
+        """Актуальная запись для файла или None (без чтения самого файла)."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self.entries.get(path)
+        if (
+            entry is not None
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            return entry
+        return None
+
+    def docstring(self, path):
+        """Docstring скрипта; при промахе кэша читается только заголовок модуля."""
+        entry = self.lookup(path)
+        if entry is not None:
+            return entry["docstring"]
+        stat = os.stat(path)
+        try:
+            doc = read_docstring(path)
+        except (SyntaxError, ValueError, tokenize.TokenError):
+            doc = None
+        self._store(path, stat, doc, None)
+        return doc
+
+    def arguments(self, path):
+        """Аргументы скрипта из кэша или None, если они ещё не извлечены."""
+        entry = self.lookup(path)
+        return entry["arguments"] if entry is not None else None
+
+    def get(self, path):
+        """
+        Полные метаданные скрипта; при необходимости файл разбирается целиком.
+
+        Raises:
+            OSError: Если файл не удалось прочитать.
+        """
+        entry = self.lookup(path)
+        if entry is not None and entry["arguments"] is not None:
+            return entry
+        stat = os.stat(path)
+        with open(path, "rb") as f:
+            source = f.read()
+        try:
+            tree = ast.parse(source)
+        except (SyntaxError, ValueError):
+            # Аргументы недоступны, но docstring может читаться из заголовка
+            try:
+                doc = read_docstring(path)
+            except (SyntaxError, ValueError, tokenize.TokenError):
+                doc = None
+            return self._store(path, stat, doc, [])
+        doc = ast.get_docstring(tree)
+        return self._store(path, stat, doc, extract_arguments(tree))
+
+    def invalidate(self, path):
+        """Удаление записи скрипта из кэша."""
+        with self._lock:
+            if self.entries.pop(path, None) is not None:
+                self._dirty = True
+
+    def warm(self, paths, first=False):
+        """
+        Фоновое извлечение метаданных для списка скриптов.
+
+        Args:
+            paths: Пути скриптов.
+            first: Обработать эти пути раньше уже запланированных.
+        """
+        with self._lock:
+            if first:
+                self._pending.extendleft(reversed(list(paths)))
+            else:
+                self._pending.extend(paths)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._warm, daemon=True)
+                self._worker.start()
+
+    def _warm(self):
+        try:
+            if not self._loaded:
+                self.load()
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        self._worker = None
+                        break
+                    path = self._pending.popleft()
+                try:
+                    self.get(path)
+                except Exception:
+                    # Кроме OSError ast.parse может выбросить RecursionError
+                    # или MemoryError на патологическом файле
+                    continue
+                self.updated.put(path)
+        finally:
+            # Иначе после неожиданной ошибки busy навсегда остался бы True,
+            # а новые пути из warm() не обрабатывались бы
+            with self._lock:
+                if self._worker is threading.current_thread():
+                    self._worker = None
+        self.save()
+
+    def _store(self, path, stat, doc, arguments):
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "docstring": doc,
+            "arguments": arguments,
+        }
+        with self._lock:
+            self.entries[path] = entry
+            self._dirty = True
+        return entry
+
+    def load(self):
+        """Загрузка кэша с диска; записи, уже полученные в этой сессии, сохраняются."""
+        self._loaded = True
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return
+        with self._lock:
+            for path, entry in data.get("entries", {}).items():
+                self.entries.setdefault(path, entry)
+
+    def save(self):
+        """Атомарное сохранение кэша на диск, если он изменился."""
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                data = json.dumps(
+                    {"version": CACHE_VERSION, "entries": self.entries},
+                    ensure_ascii=False,
+                )
+                self._dirty = False
+            tmp_file = f"{self.cache_file}.tmp"
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(tmp_file, self.cache_file)
+            except OSError as e:
+                print(f"Ошибка при сохранении кэша метаданных в {self.cache_file}: {e}")
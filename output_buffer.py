@@ -0,0 +1,120 @@
+# output_buffer.py
+
+from collections import deque
+from itertools import islice
+
+from ansi import SGRParser
+from constants import DEFAULT_OUTPUT_MAX_LINES
+
+
+class OutputBuffer:
+    """
+    Ограниченный кольцевой буфер строк вывода.
+
+    Хранит не более max_lines последних строк; старые строки отбрасываются
+    сверху пачками. Полный вывод дублируется в лог запуска (log, обычно
+    log_store.RunLog), поэтому отброшенные строки не теряются.
+
+    Каждая строка — список сегментов [текст, стиль SGRStyle или None]. Строки нумеруются
+    абсолютными номерами: первая строка буфера имеет номер first_line,
+    который растёт по мере отбрасывания старых строк.
+
+    Сырой вывод с ANSI последовательностями подаётся через feed(): разбор
+    ведёт собственный SGRParser буфера, поэтому стиль сохраняется между кусками.
+    """
+
+    def __init__(self, max_lines=DEFAULT_OUTPUT_MAX_LINES, log=None, colored=True):
+        self.max_lines = max(1, int(max_lines))
+        # Отбрасываем строки пачками, а не по одной на каждую новую строку
+        self.trim_step = max(1, self.max_lines // 20)
+        self.lines = deque([[]])
+        self.first_line = 0
+        # Последняя строка ещё не завершена символом перевода строки
+        self.partial = False
+        self.parser = SGRParser(colored)
+        # Объект с методами write(text) и close() для полного вывода
+        self.log = log
+
+    def __len__(self):
+        return len(self.lines) if self.partial else len(self.lines) - 1
+
+    @property
+    def end_line(self):
+        """Абсолютный номер строки, следующей за последней."""
+        return self.first_line + len(self)
+
+    def line(self, number):
+        """Сегменты строки по абсолютному номеру."""
+        return self.lines[number - self.first_line]
+
+    def line_text(self, number):
+        """Текст строки без тегов."""
+        return "".join(text for text, _ in self.line(number))
+
+    def line_texts(self, start, stop):
+        """
+        Тексты строк [start, stop) по абсолютным номерам.
+
+        Строки перебираются последовательно: доступ к deque по индексу
+        в середине медленный, поэтому для многих строк это быстрее line_text().
+        """
+        first = self.first_line
+        lines = islice(self.lines, start - first, stop - first)
+        return ["".join([text for text, _ in line]) for line in lines]
+
+    def feed(self, text):
+        """
+        Разбор куска сырого вывода и добавление его в буфер.
+
+        Returns:
+            list: Добавленные сегменты (текст, стиль).
+        """
+        runs = self.parser.feed(text)
+        self.append(runs)
+        return runs
+
+    def append(self, runs):
+        """
+        Добавление сегментов вывода в конец буфера.
+
+        Args:
+            runs (iterable): Пары (текст, стиль); стиль может быть None.
+
+        Returns:
+            int: Количество строк, отброшенных сверху.
+        """
+        lines = self.lines
+        current = lines[-1]
+        for text, tag in runs:
+            if not text:
+                continue
+            if self.log is not None:
+                self.log.write(text)
+            pieces = text.split("\n")
+            for i, piece in enumerate(pieces):
+                if i:
+                    current = []
+                    lines.append(current)
+                if piece:
+                    if current and current[-1][1] == tag:
+                        current[-1][0] += piece
+                    else:
+                        current.append([piece, tag])
+            self.partial = bool(current)
+        return self._trim()
+
+    def _trim(self):
+        """Отбрасывание старых строк пачкой при переполнении."""
+        excess = len(self) - self.max_lines
+        if excess < self.trim_step:
+            return 0
+        for _ in range(excess):
+            self.lines.popleft()
+        self.first_line += excess
+        return excess
+
+    def close(self):
+        """Завершение записи полного лога."""
+        if self.log is not None:
+            self.log.close()
+            self.log = None
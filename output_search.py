@@ -0,0 +1,188 @@
+# output_search.py
+
+import bisect
+import re
+
+
+def compile_query(query, regex=False, ignore_case=True):
+    """
+    Выражение для поиска в выводе.
+
+    Raises:
+        re.error: Если регулярное выражение некорректно.
+    """
+    flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+    return re.compile(query if regex else re.escape(query), flags)
+
+
+class OutputSearch:
+    """
+    Индекс строк OutputBuffer, в которых есть совпадение с выражением.
+
+    Поиск идёт по тексту строк буфера, а не по виджету Tk. matches —
+    отсортированный список абсолютных номеров строк с совпадениями,
+    поэтому переход к следующему или предыдущему совпадению — двоичный
+    поиск. update() проверяет только строки, добавленные с прошлого
+    вызова, и может делать это порциями; строки, отброшенные буфером,
+    вычёркиваются из начала списка. Незавершённая последняя строка
+    проверяется, когда придёт её перевод строки.
+    """
+
+    def __init__(self, buffer, pattern):
+        self.buffer = buffer
+        self.pattern = pattern
+        self.matches = []
+        # Индекс первого совпадения, строка которого ещё есть в буфере
+        self.start = 0
+        # Сколько элементов удалено из начала matches: номер совпадения
+        # removed + индекс в списке не меняется при обрезке буфера
+        self.removed = 0
+        # Номер первой строки, которую update() ещё не проверял
+        self.scanned = buffer.first_line
+
+    def __len__(self):
+        return len(self.matches) - self.start
+
+    @property
+    def complete(self):
+        """Проверены все завершённые строки буфера."""
+        return self.scanned >= self._complete_end()
+
+    def _complete_end(self):
+        buffer = self.buffer
+        return buffer.end_line - 1 if buffer.partial else buffer.end_line
+
+    def _drop_trimmed(self):
+        """Пропуск совпадений в строках, которые буфер уже отбросил."""
+        matches = self.matches
+        first = self.buffer.first_line
+        if self.start < len(matches) and matches[self.start] < first:
+            self.start = bisect.bisect_left(matches, first, self.start)
+        if self.start > len(matches) // 2:
+            # Сжатие списка раз в несколько обрезок, а не при каждой
+            del matches[: self.start]
+            self.removed += self.start
+            self.start = 0
+
+    def update(self, limit=None):
+        """
+        Проверка строк, добавленных в буфер с прошлого вызова.
+
+        Args:
+            limit (int, optional): Наибольшее число строк за один вызов.
+
+        Returns:
+            int: Количество новых строк с совпадениями.
+        """
+        buffer = self.buffer
+        self._drop_trimmed()
+        start = max(self.scanned, buffer.first_line)
+        stop = self._complete_end()
+        if limit is not None:
+            stop = min(stop, start + limit)
+        if start >= stop:
+            return 0
+
+        # Строки проверяются одним проходом по склеенному тексту, а номер
+        # строки совпадения находится по смещениям начала строк
+        texts = buffer.line_texts(start, stop)
+        offsets = []
+        position = 0
+        for text in texts:
+            offsets.append(position)
+            position += len(text) + 1
+        text = "\n".join(texts)
+
+        found = 0
+        position = 0
+        search = self.pattern.search
+        while True:
+            match = search(text, position)
+            if match is None:
+                break
+            index = bisect.bisect_right(offsets, match.start()) - 1
+            self.matches.append(start + index)
+            found += 1
+            if index + 1 >= len(offsets):
+                break
+            # Остальные совпадения в этой строке не нужны
+            position = offsets[index + 1]
+        self.scanned = stop
+        return found
+
+    def next(self, number):
+        """Номер первой строки с совпадением после строки number или None."""
+        self._drop_trimmed()
+        index = bisect.bisect_right(self.matches, number, self.start)
+        return self.matches[index] if index < len(self.matches) else None
+
+    def previous(self, number):
+        """Номер последней строки с совпадением перед строкой number или None."""
+        self._drop_trimmed()
+        index = bisect.bisect_left(self.matches, number, self.start)
+        return self.matches[index - 1] if index > self.start else None
+
+    def contains(self, number):
+        index = bisect.bisect_left(self.matches, number, self.start)
+        return index < len(self.matches) and self.matches[index] == number
+
+    def position(self, number):
+        """Порядковый номер (с 0) совпадения в строке number среди оставшихся."""
+        return bisect.bisect_left(self.matches, number, self.start) - self.start
+
+    def spans(self, number):
+        """
+        Позиции совпадений в строке для подсветки.
+
+        Returns:
+            list: Пары (начало, конец) в символах строки.
+        """
+        return [
+            match.span()
+            for match in self.pattern.finditer(self.buffer.line_text(number))
+            if match.end() > match.start()
+        ]
+
+
+class FilteredView:
+    """
+    Представление буфера, в котором видны только строки из OutputSearch.
+
+    Повторяет часть интерфейса OutputBuffer, нужную OutputConsole
+    (first_line, end_line, partial, line()), но строки нумеруются
+    порядковыми номерами совпадений. Эти номера не меняются при обрезке
+    буфера, поэтому консоль прокручивает представление так же, как буфер.
+    """
+
+    partial = False
+
+    def __init__(self, search):
+        self.search = search
+
+    def __len__(self):
+        return len(self.search)
+
+    @property
+    def first_line(self):
+        self.search._drop_trimmed()
+        return self.search.removed + self.search.start
+
+    @property
+    def end_line(self):
+        return self.search.removed + len(self.search.matches)
+
+    def source_line(self, number):
+        """Абсолютный номер строки буфера для строки представления."""
+        return self.search.matches[number - self.search.removed]
+
+    def view_line(self, source):
+        """Номер строки представления для строки буфера (или следующей за ней)."""
+        search = self.search
+        index = bisect.bisect_left(search.matches, source, search.start)
+        return search.removed + index
+
+    def line(self, number):
+        return self.search.buffer.line(self.source_line(number))
+
+    def line_text(self, number):
+        return self.search.buffer.line_text(self.source_line(number))
@@ -0,0 +1,520 @@
+# pipeline.py
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from constants import PIPELINE_OUTPUT_DIR, PIPELINE_STATE_FILE
+from jobs import Job
+
+
+def path_signature(path):
+    """
+    Размер и время изменения файла или всех файлов каталога (рекурсивно).
+
+    Returns:
+        list | None: Сведения для отпечатка или None, если пути нет.
+    """
+    if os.path.isdir(path):
+        entries = []
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                full_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(full_path)
+                except OSError:
+                    continue
+                relative = os.path.relpath(full_path, path)
+                entries.append([relative, stat.st_size, stat.st_mtime_ns])
+        return entries
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def step_fingerprint(step, command, upstream):
+    """
+    Отпечаток всего, от чего зависит результат шага.
+
+    Args:
+        step (PipelineStep): Шаг.
+        command (list): Команда запуска (интерпретатор, флаги, аргументы).
+        upstream (list): Отпечатки шагов из step.after.
+
+    Returns:
+        str: SHA-256 в шестнадцатеричном виде.
+    """
+    data = {
+        "command": command,
+        "script": path_signature(step.script_path),
+        "inputs": {path: path_signature(path) for path in step.inputs or ()},
+        "after": upstream,
+    }
+    encoded = json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class PipelineStep:
+    """Шаг конвейера: запуск зарегистрированного скрипта с аргументами."""
+
+    def __init__(
+        self, name, script_path, args="", after=(), stdin_from=None, inputs=None
+    ):
+        self.name = name
+        self.script_path = script_path
+        self.args = args
+        # Шаги, которые должны успешно завершиться до запуска этого шага
+        self.after = list(after)
+        # Шаг, вывод которого подаётся этому шагу на stdin
+        self.stdin_from = stdin_from
+        # Файлы и каталоги, которые читает шаг. None — шаг выполняется
+        # всегда; список (даже пустой) разрешает пропустить шаг, если ни
+        # они, ни скрипт, ни аргументы, ни предыдущие шаги не изменились
+        self.inputs = inputs
+
+
+class Pipeline:
+    """
+    Конвейер из config["pipelines"]: шаги и зависимости между ними.
+
+    Шаги хранятся в порядке, согласованном с зависимостями (каждый шаг
+    после всех шагов из его after).
+    """
+
+    def __init__(self, name, steps):
+        self.name = name
+        self.steps = OrderedDict((step.name, step) for step in steps)
+
+    @classmethod
+    def from_config(cls, name, definition, find):
+        """
+        Конвейер из описания в конфигурации.
+
+        Args:
+            name (str): Название конвейера.
+            definition (list): Шаги — словари с ключами script, а также
+                необязательными name, args, after, stdin_from и inputs.
+            find: Поиск скрипта по пути, номеру или имени
+                (registry.ScriptRegistry.find).
+
+        Raises:
+            ValueError: Если описание некорректно или в зависимостях есть цикл.
+            LookupError: Если скрипт шага не зарегистрирован.
+        """
+        if not isinstance(definition, list) or not definition:
+            raise ValueError(f"Конвейер «{name}»: нужен непустой список шагов.")
+        steps = OrderedDict()
+        for number, item in enumerate(definition, start=1):
+            if not isinstance(item, dict) or not item.get("script"):
+                raise ValueError(f"Конвейер «{name}»: у шага {number} нет script.")
+            script_path = find(str(item["script"]))
+            step_name = str(
+                item.get("name")
+                or os.path.splitext(os.path.basename(script_path))[0]
+            )
+            if step_name in steps:
+                raise ValueError(
+                    f"Конвейер «{name}»: имя шага «{step_name}» повторяется."
+                )
+            after = item.get("after", [])
+            if isinstance(after, str):
+                after = [after]
+            stdin_from = item.get("stdin_from")
+            # Шаг, вывод которого читается, обязан завершиться раньше
+            if stdin_from and stdin_from not in after:
+                after = list(after) + [stdin_from]
+            inputs = item.get("inputs")
+            if isinstance(inputs, str):
+                inputs = [inputs]
+            steps[step_name] = PipelineStep(
+                step_name,
+                script_path,
+                str(item.get("args", "")),
+                after,
+                stdin_from,
+                inputs,
+            )
+
+        for step in steps.values():
+            for dependency in step.after:
+                if dependency not in steps:
+                    raise ValueError(
+                        f"Конвейер «{name}»: шаг «{step.name}» зависит "
+                        f"от неизвестного шага «{dependency}»."
+                    )
+        return cls(name, cls._ordered(name, steps))
+
+    @staticmethod
+    def _ordered(name, steps):
+        """Шаги в порядке зависимостей (при равенстве — в порядке описания)."""
+        ordered = []
+        placed = set()
+        remaining = list(steps.values())
+        while remaining:
+            ready = [s for s in remaining if all(d in placed for d in s.after)]
+            if not ready:
+                names = ", ".join(step.name for step in remaining)
+                raise ValueError(
+                    f"Конвейер «{name}»: циклическая зависимость между шагами "
+                    f"{names}."
+                )
+            for step in ready:
+                ordered.append(step)
+                placed.add(step.name)
+            remaining = [step for step in remaining if step.name not in placed]
+        return ordered
+
+    def consumers(self, step_name):
+        """Шаги, которым на stdin подаётся вывод шага step_name."""
+        return [s for s in self.steps.values() if s.stdin_from == step_name]
+
+
+class PipelineState:
+    """
+    Отпечатки успешно выполненных шагов конвейеров и сохранённый вывод шагов.
+
+    Отпечатки хранятся в JSON файле state_file. stdout шага, который читает
+    другой шаг (stdin_from), записывается в output_dir/<конвейер>/<шаг>.out
+    (без stderr и без изменений, как в канале "a | b") и остаётся там, пока
+    шаг не выполнится снова: пропущенный шаг по-прежнему может отдать его
+    следующему шагу.
+    """
+
+    def __init__(
+        self, state_file=PIPELINE_STATE_FILE, output_dir=PIPELINE_OUTPUT_DIR
+    ):
+        self.state_file = state_file
+        self.output_dir = output_dir
+        self._state = None
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._state is None:
+            try:
+                with open(self.state_file, "r", encoding="utf-8") as f:
+                    self._state = json.load(f)
+            except (OSError, ValueError):
+                self._state = {}
+        return self._state
+
+    def fingerprint(self, pipeline_name, step_name):
+        """Отпечаток последнего успешного выполнения шага или None."""
+        with self._lock:
+            return self._load().get(pipeline_name, {}).get(step_name)
+
+    def record(self, pipeline_name, step_name, fingerprint):
+        """Сохранение (или удаление при fingerprint=None) отпечатка шага."""
+        with self._lock:
+            steps = self._load().setdefault(pipeline_name, {})
+            if fingerprint is None:
+                if steps.pop(step_name, None) is None:
+                    return
+            else:
+                steps[step_name] = fingerprint
+            data = json.dumps(self._state, ensure_ascii=False, indent=2)
+            tmp_file = f"{self.state_file}.tmp"
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(tmp_file, self.state_file)
+            except OSError as e:
+                print(f"Ошибка при сохранении состояния конвейеров: {e}")
+
+    def output_path(self, pipeline_name, step_name):
+        """Файл с выводом шага для шагов, читающих его через stdin."""
+        directory = re.sub(r"[^\w.-]", "_", pipeline_name)
+        file_name = re.sub(r"[^\w.-]", "_", step_name) + ".out"
+        return os.path.join(self.output_dir, directory, file_name)
+
+
+class PipelineRun:
+    """
+    Выполнение конвейера поверх JobManager.
+
+    advance() вызывается менеджером задач при каждом опросе: отмечает
+    завершившиеся шаги и ставит в очередь шаги, все зависимости которых
+    выполнены. Независимые ветви выполняются параллельно в пределах
+    max_concurrent менеджера. Шаг с описанными inputs пропускается, если
+    его отпечаток совпадает с сохранённым и все его зависимости тоже были
+    пропущены. При ошибке шага зависящие от него шаги не выполняются,
+    остальные ветви продолжаются.
+
+    advance() вызывается и из потока GUI, поэтому отпечаток шага (с обходом
+    каталогов из inputs) вычисляется в фоновом потоке: шаг остаётся в
+    ожидании, и следующий вызов advance() после готовности отпечатка
+    пропускает шаг или ставит его задачу в очередь.
+    """
+
+    WAITING = "waiting"
+    RUNNING = "running"
+    DONE = "done"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    STATUS_NAMES = {
+        WAITING: "Ожидает",
+        RUNNING: "Выполняется",
+        DONE: "Выполнен",
+        SKIPPED: "Пропущен",
+        FAILED: "Ошибка",
+        CANCELLED: "Не выполнен",
+    }
+
+    def __init__(self, run_id, pipeline, prepare, state, force=False, on_job=None):
+        """
+        Args:
+            run_id (int): Номер запуска.
+            pipeline (Pipeline): Конвейер.
+            prepare: Функция шаг -> (команда, словарь параметров Job);
+                может вызвать ValueError.
+            state (PipelineState): Отпечатки шагов и их вывод.
+            force (bool): Выполнять шаги, даже если они не изменились.
+            on_job: Необязательный обработчик (шаг, задача) каждой новой задачи.
+        """
+        self.id = run_id
+        self.pipeline = pipeline
+        self.prepare = prepare
+        self.state = state
+        self.force = force
+        self.status = {name: PipelineRun.WAITING for name in pipeline.steps}
+        # Задачи выполнявшихся шагов: имя шага -> Job
+        self.jobs = OrderedDict()
+        self.fingerprints = {}
+        # Причины ошибок и невыполнения шагов
+        self.errors = {}
+        # Время пропуска или ошибки шагов без задачи (монотонные часы)
+        self._marked = {}
+        # Шаги, отпечаток которых вычисляется: имя -> (Future, команда,
+        # параметры Job, все зависимости пропущены)
+        self._fingerprinting = {}
+        self._started = time.monotonic()
+        self._finished = None
+        self.on_job = on_job
+
+    @property
+    def name(self):
+        return self.pipeline.name
+
+    @property
+    def done(self):
+        finished = (PipelineRun.WAITING, PipelineRun.RUNNING)
+        return all(status not in finished for status in self.status.values())
+
+    @property
+    def succeeded(self):
+        good = (PipelineRun.DONE, PipelineRun.SKIPPED)
+        return all(status in good for status in self.status.values())
+
+    @property
+    def elapsed(self):
+        end = self._finished if self._finished is not None else time.monotonic()
+        return end - self._started
+
+    def step_name(self, job):
+        """Имя шага, который выполняет задача."""
+        for name, step_job in self.jobs.items():
+            if step_job is job:
+                return name
+        return job.name
+
+    def count(self, status):
+        return sum(1 for value in self.status.values() if value == status)
+
+    def advance(self, manager):
+        """Отметка завершившихся шагов и постановка в очередь готовых."""
+        for name, job in self.jobs.items():
+            if self.status[name] == PipelineRun.RUNNING and not job.active:
+                self._finish_step(name, job)
+
+        # Пропущенный шаг сразу открывает следующие, поэтому проходов несколько
+        progress = True
+        while progress:
+            progress = False
+            for step in self.pipeline.steps.values():
+                if self.status[step.name] != PipelineRun.WAITING:
+                    continue
+                pending = self._fingerprinting.get(step.name)
+                if pending is not None:
+                    if pending[0].done():
+                        del self._fingerprinting[step.name]
+                        self._start_step(step, manager, *pending)
+                        progress = True
+                    continue
+                statuses = [self.status[name] for name in step.after]
+                failed = (PipelineRun.FAILED, PipelineRun.CANCELLED)
+                if any(status in failed for status in statuses):
+                    self._mark(
+                        step.name, PipelineRun.CANCELLED, "ошибка в зависимости"
+                    )
+                    progress = True
+                elif all(
+                    status in (PipelineRun.DONE, PipelineRun.SKIPPED)
+                    for status in statuses
+                ):
+                    skip = all(status == PipelineRun.SKIPPED for status in statuses)
+                    self._fingerprint_step(step, skip)
+                    progress = True
+
+        if self.done and self._finished is None:
+            self._finished = time.monotonic()
+
+    def _mark(self, name, status, error=None):
+        self.status[name] = status
+        self._marked[name] = time.monotonic()
+        if error:
+            self.errors[name] = error
+
+    def _fingerprint_step(self, step, upstream_skipped):
+        """Подготовка команды шага и вычисление его отпечатка в фоновом потоке."""
+        try:
+            command, job_options = self.prepare(step)
+        except ValueError as ve:
+            self._mark(step.name, PipelineRun.FAILED, str(ve))
+            return
+        upstream = [self.fingerprints[name] for name in step.after]
+        future = Future()
+
+        def compute():
+            try:
+                future.set_result(step_fingerprint(step, command, upstream))
+            except Exception as e:
+                future.set_exception(e)
+
+        self._fingerprinting[step.name] = (
+            future,
+            command,
+            job_options,
+            upstream_skipped,
+        )
+        threading.Thread(target=compute, daemon=True).start()
+
+    def _start_step(
+        self, step, manager, future, command, job_options, upstream_skipped
+    ):
+        """Пропуск шага или постановка его задачи в очередь."""
+        try:
+            fingerprint = future.result()
+        except Exception as e:
+            self._mark(step.name, PipelineRun.FAILED, f"отпечаток шага: {e}")
+            return
+        self.fingerprints[step.name] = fingerprint
+        output_path = self.state.output_path(self.name, step.name)
+        consumers = self.pipeline.consumers(step.name)
+
+        if (
+            not self.force
+            and step.inputs is not None
+            and upstream_skipped
+            and self.state.fingerprint(self.name, step.name) == fingerprint
+            and (not consumers or os.path.exists(output_path))
+        ):
+            self._mark(step.name, PipelineRun.SKIPPED)
+            return
+
+        stdout_file = None
+        if consumers:
+            try:
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            except OSError as e:
+                self._mark(step.name, PipelineRun.FAILED, str(e))
+                return
+            stdout_file = output_path
+        stdin = None
+        if step.stdin_from:
+            stdin = self.state.output_path(self.name, step.stdin_from)
+
+        job = manager.submit(
+            step.script_path,
+            command,
+            args=step.args,
+            pipeline=self,
+            stdin=stdin,
+            stdout_file=stdout_file,
+            **job_options,
+        )
+        self.jobs[step.name] = job
+        self.status[step.name] = PipelineRun.RUNNING
+        if self.on_job is not None:
+            self.on_job(step, job)
+
+    def _finish_step(self, name, job):
+        step = self.pipeline.steps[name]
+        if job.status == Job.FINISHED:
+            self.status[name] = PipelineRun.DONE
+            if step.inputs is not None:
+                self.state.record(self.name, name, self.fingerprints[name])
+        else:
+            self.status[name] = PipelineRun.FAILED
+            if job.status == Job.FAILED and job.exit_code is not None:
+                self.errors[name] = f"код {job.exit_code}"
+            else:
+                self.errors[name] = job.status_name.lower()
+            # После ошибки шаг выполнится заново, даже если ничего не изменилось
+            self.state.record(self.name, name, None)
+
+    def cancel(self):
+        """Отмена шагов, которые ещё не начались."""
+        # Отпечатки, которые ещё вычисляются, больше не нужны
+        self._fingerprinting.clear()
+        for name, status in self.status.items():
+            if status == PipelineRun.WAITING:
+                self._mark(name, PipelineRun.CANCELLED, "конвейер остановлен")
+
+    def stop(self, manager):
+        """Остановка: ожидающие шаги отменяются, выполняющиеся завершаются."""
+        self.cancel()
+        for name, job in self.jobs.items():
+            if self.status[name] == PipelineRun.RUNNING:
+                manager.stop(job.id)
+
+    def timeline(self):
+        """
+        Время выполнения шагов относительно начала конвейера.
+
+        Returns:
+            list: Словари с ключами name, status, start, end (секунды или None,
+            если шаг ещё не начался или не закончился) и error.
+        """
+        rows = []
+        for name, step_status in self.status.items():
+            start = end = None
+            job = self.jobs.get(name)
+            if job is not None:
+                if job._started is not None:
+                    start = job._started - self._started
+                if job._finished is not None:
+                    end = job._finished - self._started
+            elif name in self._marked:
+                start = end = self._marked[name] - self._started
+            rows.append(
+                {
+                    "name": name,
+                    "status": step_status,
+                    "start": start,
+                    "end": end,
+                    "error": self.errors.get(name),
+                }
+            )
+        return rows
+
+    def summary(self):
+        """Краткая сводка по запуску конвейера."""
+        text = (
+            f"Конвейер «{self.name}» #{self.id}: выполнено "
+            f"{self.count(PipelineRun.DONE)}, пропущено "
+            f"{self.count(PipelineRun.SKIPPED)}, ошибок "
+            f"{self.count(PipelineRun.FAILED)}"
+        )
+        cancelled = self.count(PipelineRun.CANCELLED)
+        if cancelled:
+            text += f", не выполнено {cancelled}"
+        return text + f", общее время {self.elapsed:.1f} с"
@@ -0,0 +1,177 @@
+# registry.py
+
+import os
+import queue
+import threading
+
+from constants import LIBRARY_SKIPPED_DIRS, SCRIPT_VALIDATION_WORKERS
+
+
+class ScriptRegistry:
+    """
+    Реестр зарегистрированных скриптов, хранящийся в конфигурации.
+
+    Не зависит от GUI. Список путей paths — тот же объект, что и
+    config["scripts"], поэтому изменения сразу видны в конфигурации.
+    Проверка наличия пути идёт по множеству, а поисковый индекс
+    строится один раз (build_index, обычно в фоне) и далее обновляется
+    инкрементально.
+    """
+
+    def __init__(self, config_manager):
+        self.config_manager = config_manager
+        self.paths = config_manager.config.setdefault("scripts", [])
+        self._known = set(self.paths)
+        self._index = None
+        self._index_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __iter__(self):
+        return iter(self.paths)
+
+    def __contains__(self, path):
+        return path in self._known
+
+    def add(self, paths):
+        """
+        Регистрация скриптов без повторов.
+
+        Returns:
+            list[str]: Действительно добавленные пути.
+        """
+        added = []
+        for path in paths:
+            if path not in self._known:
+                self._known.add(path)
+                self.paths.append(path)
+                added.append(path)
+        with self._index_lock:
+            if self._index is not None:
+                self._index.add(added)
+        return added
+
+    def remove(self, paths):
+        """
+        Удаление скриптов из реестра за один проход по списку.
+
+        Returns:
+            set[str]: Действительно удалённые пути.
+        """
+        removed = self._known.intersection(paths)
+        if removed:
+            # Срез сохраняет объект списка, общий с конфигурацией
+            self.paths[:] = [path for path in self.paths if path not in removed]
+            self._known -= removed
+            with self._index_lock:
+                if self._index is not None:
+                    self._index.remove(removed)
+        return removed
+
+    def build_index(self):
+        """Построение поискового индекса (можно вызывать из фонового потока)."""
+        with self._index_lock:
+            if self._index is None:
+                from search_index import SearchIndex
+
+                self._index = SearchIndex(list(self.paths))
+
+    def search(self, query):
+        """Нечёткий поиск скриптов по имени (см. SearchIndex)."""
+        self.build_index()
+        with self._index_lock:
+            return self._index.search(query)
+
+    @staticmethod
+    def scan_folder(folder):
+        """
+        Рекурсивный поиск Python-скриптов в папке.
+
+        Обход через os.scandir без перехода по символическим ссылкам на
+        каталоги; скрытые каталоги и LIBRARY_SKIPPED_DIRS пропускаются.
+
+        Returns:
+            list[str]: Отсортированные пути .py файлов.
+        """
+        found = []
+        stack = [folder]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not (
+                                entry.name.startswith(".")
+                                or entry.name in LIBRARY_SKIPPED_DIRS
+                            ):
+                                stack.append(entry.path)
+                        elif entry.name.endswith(".py") and entry.is_file():
+                            found.append(entry.path)
+            except OSError:
+                continue
+        found.sort()
+        return found
+
+    @staticmethod
+    def is_valid(path):
+        """Скрипт существует и является Python-файлом."""
+        return path.endswith(".py") and os.path.isfile(path)
+
+    def validate(self, max_workers=SCRIPT_VALIDATION_WORKERS):
+        """
+        Проверка существования всех скриптов в пуле потоков.
+
+        Медленные файловые системы (сетевые диски) не блокируют вызывающий
+        поток: результаты поступают в очередь по мере готовности.
+
+        Returns:
+            queue.Queue: Пары (путь, существует); после последней проверки — None.
+        """
+        results = queue.Queue()
+        paths = list(self.paths)
+        threading.Thread(
+            target=self._validate, args=(paths, max_workers, results), daemon=True
+        ).start()
+        return results
+
+    def _validate(self, paths, max_workers, results):
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        if paths:
+            workers = min(max_workers, len(paths))
+            with ThreadPoolExecutor(workers, thread_name_prefix="validate") as pool:
+                futures = {pool.submit(self.is_valid, path): path for path in paths}
+                for future in as_completed(futures):
+                    results.put((futures[future], future.result()))
+        results.put(None)
+
+    def find(self, key):
+        """
+        Поиск скрипта по пути, номеру в списке (с 1), имени файла или имени без .py.
+
+        Raises:
+            LookupError: Если скрипт не найден или имя неоднозначно.
+        """
+        if key in self._known:
+            return key
+        if key.isdigit():
+            index = int(key) - 1
+            if 0 <= index < len(self.paths):
+                return self.paths[index]
+            raise LookupError(f"Нет скрипта с номером {key}.")
+        matches = []
+        for path in self.paths:
+            name = os.path.basename(path)
+            if key in (name, os.path.splitext(name)[0]):
+                matches.append(path)
+        if len(matches) == 1:
+            return matches[0]
+        if matches:
+            raise LookupError(f"Имя '{key}' неоднозначно: " + ", ".join(matches))
+        raise LookupError(f"Скрипт '{key}' не зарегистрирован.")
+
+    def save(self):
+        """Сохранение списка скриптов в конфигурацию."""
+        self.config_manager.update("scripts", self.paths)
@@ -0,0 +1,141 @@
+# run_history.py
+
+import json
+import math
+import os
+import threading
+from collections import defaultdict
+
+from constants import RUN_HISTORY_FILE
+
+
+def make_record(script_path, start_time, wall, exit_code, usage=None):
+    """
+    Запись об одном запуске скрипта.
+
+    Args:
+        script_path (str): Путь к скрипту.
+        start_time (float): Время начала (time.time()).
+        wall (float): Время выполнения в секундах.
+        exit_code (int): Код завершения.
+        usage (dict, optional): Ресурсы из runner.wait_with_usage.
+
+    Returns:
+        dict: Запись с короткими ключами; отсутствующие значения не пишутся.
+    """
+    record = {
+        "script": script_path,
+        "start": round(start_time, 3),
+        "wall": round(wall, 4),
+        "code": exit_code,
+    }
+    usage = usage or {}
+    if "user" in usage:
+        record["cpu"] = round(usage["user"] + usage["system"], 4)
+        record["user"] = round(usage["user"], 4)
+        record["sys"] = round(usage["system"], 4)
+        record["rss"] = usage["max_rss"]
+    if "disk_read" in usage:
+        record["disk_read"] = usage["disk_read"]
+        record["disk_write"] = usage["disk_write"]
+    return record
+
+
+def percentile(values, q):
+    """Перцентиль q (0–100) отсортированного списка по методу ближайшего ранга."""
+    if not values:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(values)))
+    return values[rank - 1]
+
+
+def format_bytes(size):
+    """Размер в байтах в виде «12.3 МБ»."""
+    if size is None:
+        return ""
+    for unit in ("Б", "КБ", "МБ", "ГБ"):
+        if size < 1024 or unit == "ГБ":
+            return f"{size:.0f} {unit}" if unit == "Б" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class RunHistory:
+    """
+    История запусков скриптов в файле JSON Lines.
+
+    Каждый завершившийся запуск дописывается в конец файла одной строкой,
+    поэтому запись не зависит от размера истории и не переписывает уже
+    сохранённые данные. Повреждённые строки (например, после аварийного
+    завершения посреди записи) при чтении пропускаются.
+    """
+
+    def __init__(self, history_file=RUN_HISTORY_FILE):
+        self.history_file = history_file
+        self._lock = threading.Lock()
+
+    def append(self, record):
+        """Добавление записи о запуске."""
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            try:
+                with open(self.history_file, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                print(f"Ошибка при записи истории запусков: {e}")
+
+    def load(self):
+        """
+        Все записи истории в порядке запуска.
+
+        Returns:
+            list: Словари записей (см. make_record).
+        """
+        records = []
+        if not os.path.exists(self.history_file):
+            return records
+        with self._lock:
+            with open(self.history_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict) and "script" in record:
+                        records.append(record)
+        return records
+
+    @staticmethod
+    def summarize(records):
+        """
+        Сводка по скриптам: число запусков, ошибки и перцентили.
+
+        Returns:
+            list: Словари с ключами script, runs, failed, last, wall_p50,
+            wall_p90, wall_p99, cpu_p50, cpu_p90, rss_p50, rss_max, отсортированные
+            по пути скрипта. Метрики без данных равны None.
+        """
+        by_script = defaultdict(list)
+        for record in records:
+            by_script[record["script"]].append(record)
+        summary = []
+        for script_path in sorted(by_script):
+            runs = by_script[script_path]
+            wall = sorted(r["wall"] for r in runs)
+            cpu = sorted(r["cpu"] for r in runs if "cpu" in r)
+            rss = sorted(r["rss"] for r in runs if "rss" in r)
+            summary.append(
+                {
+                    "script": script_path,
+                    "runs": len(runs),
+                    "failed": sum(1 for r in runs if r.get("code") != 0),
+                    "last": max(r["start"] for r in runs),
+                    "wall_p50": percentile(wall, 50),
+                    "wall_p90": percentile(wall, 90),
+                    "wall_p99": percentile(wall, 99),
+                    "cpu_p50": percentile(cpu, 50),
+                    "cpu_p90": percentile(cpu, 90),
+                    "rss_p50": percentile(rss, 50),
+                    "rss_max": rss[-1] if rss else None,
+                }
+            )
+        return summary
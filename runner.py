@@ -0,0 +1,350 @@
+# runner.py
+
+import codecs
+import io
+import os
+import queue
+import shlex
+import signal
+import subprocess
+import sys
+import threading
+
+from constants import (
+    OUTPUT_CHUNK_SIZE,
+    OUTPUT_QUEUE_MAX_CHUNKS,
+    STOP_GRACE_PERIOD_MS,
+)
+
+
+def split_args(args):
+    """
+    Разбор строки аргументов скрипта с учётом кавычек.
+
+    Raises:
+        ValueError: Если строку не удалось разобрать (например, незакрытая кавычка).
+    """
+    return shlex.split(args, posix=os.name != "nt")
+
+
+def child_env():
+    """Окружение дочернего процесса скрипта."""
+    env = os.environ.copy()
+    # Без этого дочерний Python буферизует вывод в pipe блоками по 8 КБ
+    env["PYTHONUNBUFFERED"] = "1"
+    env["PYTHONIOENCODING"] = "utf-8"
+    return env
+
+
+def read_proc_io(pid):
+    """
+    Счётчики ввода-вывода процесса с накопителем из /proc/<pid>/io.
+
+    Берутся read_bytes и write_bytes, а не rchar и wchar: последние считают
+    каждый вызов read()/write(), включая pipe вывода и терминал, и у скрипта,
+    который много печатает, совпадали бы с объёмом вывода.
+
+    Returns:
+        dict | None: {"disk_read": read_bytes, "disk_write": write_bytes} в
+        байтах или None, если /proc недоступен.
+    """
+    try:
+        with open(f"/proc/{pid}/io", "r", encoding="ascii") as f:
+            counters = dict(line.split(": ", 1) for line in f.read().splitlines())
+        return {
+            "disk_read": int(counters["read_bytes"]),
+            "disk_write": int(counters["write_bytes"]),
+        }
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def wait_with_usage(process):
+    """
+    Ожидание завершения процесса со сбором потреблённых ресурсов.
+
+    Процесс сначала дожидается через waitid(WNOWAIT): он остаётся зомби, и
+    его /proc/<pid>/io ещё можно прочитать. Затем os.wait4 забирает процесс
+    и возвращает rusage. Где этих вызовов нет (Windows), ресурсы не
+    собираются.
+
+    Returns:
+        tuple: (код завершения, dict с ключами user, system (с), max_rss (байт),
+        disk_read, disk_write (байт) или None).
+    """
+    if not hasattr(os, "wait4"):
+        return process.wait(), None
+    usage = {}
+    try:
+        if hasattr(os, "waitid"):
+            os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOWAIT)
+            usage.update(read_proc_io(process.pid) or {})
+        _, status, rusage = os.wait4(process.pid, 0)
+    except ChildProcessError:
+        # Процесс уже забран другим вызовом (например, Popen.poll в terminate)
+        return process.wait(), usage or None
+    # ru_maxrss в Linux — в килобайтах, в macOS — в байтах
+    rss_unit = 1 if sys.platform == "darwin" else 1024
+    usage.update(
+        user=rusage.ru_utime,
+        system=rusage.ru_stime,
+        max_rss=rusage.ru_maxrss * rss_unit,
+    )
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, usage
+
+
+def build_command(script_path, args, resolver=None):
+    """
+    Команда запуска скрипта с уже разобранными аргументами.
+
+    Args:
+        script_path (str): Путь к скрипту.
+        args (list): Аргументы скрипта.
+        resolver (interpreters.InterpreterResolver, optional): Выбор
+            интерпретатора и его флагов для скрипта. Без него скрипт
+            запускается интерпретатором приложения.
+
+    Raises:
+        ValueError: Если не удалось разобрать флаги интерпретатора скрипта.
+    """
+    if resolver is not None:
+        return resolver.command(script_path, args)
+    return [sys.executable or "python", script_path] + list(args)
+
+
+class ScriptProcess:
+    """
+    Дочерний процесс скрипта с потоковым чтением вывода.
+
+    stdout и stderr объединяются на уровне ОС (stderr=STDOUT), поэтому порядок
+    сообщений из двух потоков сохраняется. Фоновый поток читает вывод кусками
+    и кладёт их в ограниченную очередь: если потребитель не успевает забирать
+    данные, чтение приостанавливается и память не растёт.
+
+    Если задан pool (warm_pool.WarmPool), скрипт по возможности выполняется
+    в заранее запущенном интерпретаторе; вывод и код завершения читаются
+    точно так же, как у обычного процесса.
+
+    Процесс запускается в новой сессии (своей группе процессов), поэтому
+    stop() завершает и все процессы, запущенные скриптом. Ограничения limits
+    (limits.Limits) задаются ядру до запуска интерпретатора; такие запуски
+    всегда выполняются новым процессом, а не в воркере пула. Так же
+    запускаются скрипты, которым stdin подаётся из файла (stdin — путь).
+
+    Если задан stdout_file, stdout и stderr читаются раздельно: байты stdout
+    без изменений записываются в этот файл (как в канал "a | b" — без
+    stderr), а в вывод процесса попадают оба потока. Порядок строк stdout и
+    stderr между собой в этом случае может отличаться от порядка их записи.
+    """
+
+    def __init__(
+        self,
+        command,
+        chunk_size=OUTPUT_CHUNK_SIZE,
+        max_pending=OUTPUT_QUEUE_MAX_CHUNKS,
+        pool=None,
+        limits=None,
+        stdin=None,
+        stdout_file=None,
+    ):
+        self.command = command
+        self.chunk_size = chunk_size
+        self.pool = pool
+        self.limits = limits
+        self.stdin = stdin
+        self.stdout_file = stdout_file
+        self._capture = None
+        # Процесс остановлен по истечении limits.timeout
+        self.timed_out = False
+        self._watchdog = None
+        # Скрипт выполняется в тёплом воркере пула
+        self.warm = False
+        self.process = None
+        self.returncode = None
+        # Ресурсы, потреблённые процессом (см. wait_with_usage)
+        self.usage = None
+        self._chunks = queue.Queue(maxsize=max_pending)
+        self._reader = None
+        self._finished = False
+
+    @property
+    def pid(self):
+        return self.process.pid if self.process else None
+
+    @property
+    def done(self):
+        """Процесс завершился и весь его вывод уже забран."""
+        return self._finished
+
+    def start(self):
+        """Запуск процесса и фонового потока чтения вывода."""
+        preexec = self.limits.preexec() if self.limits is not None else None
+        if (
+            self.pool is not None
+            and preexec is None
+            and self.stdin is None
+            and self.stdout_file is None
+        ):
+            self.process = self.pool.launch(self.command)
+            self.warm = self.process is not None
+        if self.process is None:
+            stdin = open(self.stdin, "rb") if self.stdin is not None else None
+            try:
+                if self.stdout_file is not None:
+                    self._capture = open(self.stdout_file, "wb")
+                self.process = subprocess.Popen(
+                    self.command,
+                    stdin=stdin,
+                    stdout=subprocess.PIPE,
+                    stderr=(
+                        subprocess.PIPE
+                        if self._capture is not None
+                        else subprocess.STDOUT
+                    ),
+                    bufsize=0,
+                    env=child_env(),
+                    start_new_session=True,
+                    preexec_fn=preexec,
+                )
+            except Exception:
+                if self._capture is not None:
+                    self._capture.close()
+                raise
+            finally:
+                # Дочерний процесс получил свою копию дескриптора
+                if stdin is not None:
+                    stdin.close()
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+        timeout = self.limits.timeout if self.limits is not None else None
+        if timeout:
+            self._watchdog = threading.Timer(float(timeout), self._on_timeout)
+            self._watchdog.daemon = True
+            self._watchdog.start()
+        return self.process
+
+    def _read_output(self):
+        """Чтение вывода процесса до EOF и ожидание его завершения (фоновый поток)."""
+        errors = None
+        try:
+            if self._capture is not None:
+                errors = threading.Thread(
+                    target=self._read_stream, args=(self.process.stderr,), daemon=True
+                )
+                errors.start()
+            self._read_stream(self.process.stdout, self._capture)
+        finally:
+            if self._capture is not None:
+                self._capture.close()
+            if errors is not None:
+                errors.join()
+            self.returncode, self.usage = wait_with_usage(self.process)
+            if self._watchdog is not None:
+                self._watchdog.cancel()
+            if self.pool is not None:
+                self.pool.finished(self.command)
+            self._chunks.put(None)
+
+    def _read_stream(self, stream, sink=None):
+        """Чтение одного потока кусками в очередь (и сырых байтов в sink)."""
+        # Инкрементальный декодер не разрывает многобайтовые символы UTF-8
+        # на границе кусков и переводит \r\n в \n, как это делал text=True.
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+        )
+        try:
+            while True:
+                data = stream.read(self.chunk_size)
+                if not data:
+                    break
+                if sink is not None:
+                    sink.write(data)
+                text = decoder.decode(data)
+                if text:
+                    self._chunks.put(text)
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                self._chunks.put(tail)
+        finally:
+            stream.close()
+
+    @property
+    def running(self):
+        return self.process is not None and self.returncode is None
+
+    def terminate(self):
+        """Запрос на завершение процесса и его группы, если он ещё выполняется."""
+        if self.running:
+            self._signal(force=False)
+
+    def stop(self, grace=STOP_GRACE_PERIOD_MS / 1000):
+        """
+        Остановка процесса: SIGTERM группе процессов, через grace секунд — SIGKILL.
+
+        Не блокируется: принудительное завершение выполняет фоновый таймер,
+        если процесс к тому времени ещё не завершился.
+        """
+        if not self.running:
+            return
+        self._signal(force=False)
+        timer = threading.Timer(grace, self.kill)
+        timer.daemon = True
+        timer.start()
+
+    def kill(self):
+        """Принудительное завершение процесса и его группы."""
+        if self.running:
+            self._signal(force=True)
+
+    def _on_timeout(self):
+        self.timed_out = True
+        self.stop()
+
+    def _signal(self, force):
+        if os.name == "nt":
+            if force:
+                self.process.kill()
+            else:
+                self.process.terminate()
+            return
+        # Процесс — лидер своей сессии, поэтому id группы совпадает с его pid.
+        # Группа существует, пока в ней есть процессы, даже после выхода лидера
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            pass
+
+    def iter_output(self):
+        """Блокирующий перебор кусков вывода до завершения процесса."""
+        while not self._finished:
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._finished = True
+                break
+            yield chunk
+
+    def read_available(self, max_chars=None):
+        """
+        Забрать накопленный вывод без блокировки.
+
+        Args:
+            max_chars (int, optional): Ограничение объёма за один вызов, чтобы
+                обработка одного кадра GUI не затягивалась.
+
+        Returns:
+            str: Склеенные куски вывода (может быть пустой строкой).
+        """
+        parts = []
+        size = 0
+        while max_chars is None or size < max_chars:
+            try:
+                chunk = self._chunks.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is None:
+                self._finished = True
+                break
+            parts.append(chunk)
+            size += len(chunk)
+        return "".join(parts)
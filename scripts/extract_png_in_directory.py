@@ -8,12 +8,13 @@
 1. Переименовывает папки в указанной директории по порядковому номеру.
 2. Удаляет папку 'TXT' и все файлы внутри каждой переименованной папки.
 3. Перемещает все .png файлы из всех папок с именем TARGET_FOLDER_NAME в новые папки с номерами.
-4. Удаляет подкаталоги на определенном уровне вложенности в каждой папке.
+4. Удаляет подкаталоги на определенном уровне вложенности в каждой папке (--delete-level).
 5. (Опционально) Группирует .png файлы по частям тела в папке Group_PNGs.
 6. Отслеживает уже обработанные папки по названиям их немедленных подкаталогов в SOURCE_FOLDER, чтобы избежать повторной обработки.
 
 Использование:
-    python script.py SOURCE_FOLDER TARGET_FOLDER_NAME [--group]
+    python script.py SOURCE_FOLDER TARGET_FOLDER_NAME [--group] [--jobs N] [--delete-level N]
+                      [--link-mode MODE]
 
 Аргументы:
     SOURCE_FOLDER       Папка, в которой будет работать скрипт (исходная папка).
@@ -21,18 +22,31 @@
 
 Опции:
     --group             Создает папку Group_PNGs для группировки .png файлов по частям тела.
+    --jobs N            Обрабатывает до N групп папок одновременно (по умолчанию 1).
+    --delete-level N    Уровень вложенности подкаталогов целевой папки, которые удаляются (по умолчанию 2).
+    --link-mode MODE    Как файлы попадают в Group_PNGs: copy, hardlink, reflink или symlink (по умолчанию copy).
 
 Пример:
     python script.py SOURCE_FOLDER "Vector Parts" --group
+    python script.py SOURCE_FOLDER "Vector Parts" --group --jobs 8
+    python script.py SOURCE_FOLDER "Vector Parts" --group --link-mode hardlink
 
 Зависимости:
+    - os: Для обхода дерева папок за один проход (os.scandir).
     - pathlib: Для удобной работы с путями.
     - shlex: Для безопасного разбиения аргументов (если необходимо).
+    - concurrent.futures: Для параллельной обработки групп папок (--jobs).
 """
 
+import errno
+import os
+import sys
 import shutil
 import argparse
-from typing import Dict, Optional, List
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, List, Set, Tuple
 from pathlib import Path
 import re
 import json
@@ -45,25 +59,77 @@ COLOR_WARNING = "\033[33m"  # Yellow
 COLOR_ERROR = "\033[31m"  # Red
 COLOR_CRITICAL = "\033[35m"  # Magenta
 
+# Папки, которые скрипт создает и удаляет
+ORGANIZED_FOLDER_NAME = "Organized_PNGs"
+GROUP_FOLDER_NAME = "Group_PNGs"
+TXT_FOLDER_NAME = "TXT"
+
+# Уровень вложенности подкаталогов целевой папки, которые удаляются целиком
+DEFAULT_DELETE_LEVEL = 2
+
+# shutil.rmtree(dir_fd=...) появился в Python 3.11 и работает только там, где
+# rmtree удаляет через дескрипторы папок (не на Windows)
+RMTREE_DIR_FD = sys.version_info >= (3, 11) and shutil.rmtree.avoids_symlink_attacks
+
+# Файл-индекс счетчиков частей тела внутри Group_PNGs
+GROUP_INDEX_FILE_NAME = ".group_index.json"
+GROUP_INDEX_VERSION = 2
+# Имена файлов в папках частей тела: '<часть>_<индекс>.png'
+GROUP_FILE_PATTERN = re.compile(r"(.+)_(\d+)\.png")
+
+# Способы помещения файла в Group_PNGs (--link-mode) и как они звучат в сообщениях
+LINK_MODES = {
+    "copy": "скопирован",
+    "hardlink": "связан жесткой ссылкой",
+    "reflink": "клонирован (reflink)",
+    "symlink": "связан символической ссылкой",
+}
+
+# ioctl FICLONE из linux/fs.h: файл-клон с общими блоками данных (btrfs, XFS и др.)
+FICLONE = 0x40049409
+
+# Ошибки, при которых копирование средствами ядра недоступно для этой пары файлов
+KERNEL_COPY_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EBADF,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EPERM,
+}
+
+# Размер блока для копирования через Python, если ядро копировать не умеет
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# При --jobs сообщения пишутся из нескольких потоков; блокировка не дает
+# строкам перемешаться
+output_lock = threading.Lock()
+
+
+def log(color: str, level: str, message: str) -> None:
+    with output_lock:
+        print(f"{color}{level}: {message}{COLOR_RESET}")
+
 
 def debug(message: str) -> None:
-    print(f"{COLOR_DEBUG}DEBUG: {message}{COLOR_RESET}")
+    log(COLOR_DEBUG, "DEBUG", message)
 
 
 def info(message: str) -> None:
-    print(f"{COLOR_INFO}INFO: {message}{COLOR_RESET}")
+    log(COLOR_INFO, "INFO", message)
 
 
 def warning(message: str) -> None:
-    print(f"{COLOR_WARNING}WARNING: {message}{COLOR_RESET}")
+    log(COLOR_WARNING, "WARNING", message)
 
 
 def error(message: str) -> None:
-    print(f"{COLOR_ERROR}ERROR: {message}{COLOR_RESET}")
+    log(COLOR_ERROR, "ERROR", message)
 
 
 def critical(message: str) -> None:
-    print(f"{COLOR_CRITICAL}CRITICAL: {message}{COLOR_RESET}")
+    log(COLOR_CRITICAL, "CRITICAL", message)
 
 
 def sanitize_name(name: str) -> str:
@@ -96,35 +162,152 @@ def extract_part_name(file_name: Path) -> str:
     return base_name
 
 
+def scan_group_folder(group_folder: str, sanitized_part_name: str) -> int:
+    """
+    Находит максимальный индекс файлов '<часть>_<индекс>.png' в папке части тела.
+
+    Args:
+        group_folder (str): Путь к папке части тела.
+        sanitized_part_name (str): Санитизированное название части.
+
+    Returns:
+        int: Максимальный индекс или 0, если таких файлов нет.
+    """
+    max_index = 0
+    with os.scandir(group_folder) as it:
+        for entry in it:
+            match = GROUP_FILE_PATTERN.fullmatch(entry.name)
+            if match and match.group(1) == sanitized_part_name:
+                max_index = max(max_index, int(match.group(2)))
+    return max_index
+
+
+def load_group_index(
+    group_destination_base: Path,
+) -> Tuple[Dict[str, int], Dict[str, int], int]:
+    """
+    Загружает индекс счетчиков Group_PNGs.
+
+    Args:
+        group_destination_base (Path): Базовая папка для группировки файлов по частям.
+
+    Returns:
+        Tuple[Dict[str, int], Dict[str, int], int]: Счетчики частей (часть ->
+            максимальный индекс), время изменения папок частей в нс и время
+            изменения самого файла индекса в нс; пустые словари и 0, если
+            индекса нет.
+    """
+    index_file = group_destination_base / GROUP_INDEX_FILE_NAME
+    if not index_file.exists():
+        return {}, {}, 0
+    try:
+        with index_file.open("r", encoding="utf-8") as f:
+            index_mtime = os.fstat(f.fileno()).st_mtime_ns
+            data = json.load(f)
+        if data.get("version") != GROUP_INDEX_VERSION:
+            return {}, {}, 0
+        return dict(data["parts"]), dict(data["mtimes"]), index_mtime
+    except Exception as e:
+        warning(
+            f"Не удалось загрузить индекс '{index_file}', папки будут просканированы: {e}"
+        )
+        return {}, {}, 0
+
+
+def save_group_index(
+    group_destination_base: Path,
+    group_info: Dict[str, int],
+    busy_parts: Optional[Set[str]] = None,
+) -> None:
+    """
+    Сохраняет счетчики частей тела и время изменения папок частей в индекс Group_PNGs.
+
+    Вызывается после каждой группы папок и в конце, когда все файлы
+    скопированы. Файл индекса заменяется целиком (os.replace), поэтому он не
+    бывает записан наполовину. Для частей из busy_parts копирование еще идет,
+    и время изменения их папок не записывается: при следующем запуске такие
+    папки будут просканированы заново.
+
+    Args:
+        group_destination_base (Path): Базовая папка для группировки файлов по частям.
+        group_info (Dict[str, int]): Максимальные индексы для каждой части тела.
+        busy_parts (Set[str], optional): Санитизированные названия частей,
+            файлы которых еще копируются.
+    """
+    index_file = group_destination_base / GROUP_INDEX_FILE_NAME
+    temp_file = index_file.with_name(index_file.name + ".tmp")
+    try:
+        mtimes = {}
+        with os.scandir(group_destination_base) as it:
+            for entry in it:
+                if entry.is_dir() and sanitize_name(entry.name) not in (
+                    busy_parts or ()
+                ):
+                    mtimes[entry.name] = entry.stat().st_mtime_ns
+        data = {"version": GROUP_INDEX_VERSION, "parts": group_info, "mtimes": mtimes}
+        with temp_file.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_file, index_file)
+        debug(f"Сохранен индекс счетчиков в '{index_file}'")
+    except Exception as e:
+        error(f"Не удалось сохранить индекс '{index_file}': {e}")
+
+
 def initialize_group_info(group_destination_base: Path) -> Dict[str, int]:
     """
     Инициализирует словарь group_info, определяя текущие максимальные индексы для каждой части тела.
 
+    Счетчики берутся из индекса Group_PNGs, если время изменения папок части
+    совпадает с записанным в индексе; остальные папки сканируются заново.
+    Папка, время изменения которой не меньше времени изменения индекса, могла
+    измениться еще раз в пределах той же отметки времени (на FAT и SMB она
+    грубая), как "racy" записи в индексе git. Ее счетчику индекс доверяет,
+    только если файла '<часть>_<счетчик + 1>.png' в ней нет.
+
     Args:
         group_destination_base (Path): Базовая папка для группировки файлов по частям.
 
     Returns:
         Dict[str, int]: Словарь с максимальными индексами для каждой части тела.
     """
-    group_info = {}
+    group_info: Dict[str, int] = {}
     if not group_destination_base.exists():
         return group_info
 
-    for group_folder in group_destination_base.iterdir():
-        if group_folder.is_dir():
-            sanitized_part_name = sanitize_name(group_folder.name)
-            # Используем регулярное выражение для извлечения индекса
-            max_index = 0
-            for file in group_folder.glob("*.png"):
-                match = re.match(
-                    rf"^{re.escape(sanitized_part_name)}_(\d+)\.png$", file.name
+    parts, mtimes, index_mtime = load_group_index(group_destination_base)
+    # Несколько папок могут давать одно санитизированное название части
+    part_folders: Dict[str, List[os.DirEntry]] = {}
+    with os.scandir(group_destination_base) as it:
+        for entry in it:
+            if entry.is_dir():
+                part_folders.setdefault(sanitize_name(entry.name), []).append(entry)
+
+    for sanitized_part_name, folders in sorted(part_folders.items()):
+        cached = sanitized_part_name in parts
+        for folder in folders if cached else []:
+            mtime = folder.stat().st_mtime_ns
+            if mtimes.get(folder.name) != mtime:
+                cached = False
+            elif mtime >= index_mtime:
+                count = parts[sanitized_part_name]
+                next_file = os.path.join(
+                    folder.path, f"{sanitized_part_name}_{count + 1}.png"
                 )
-                if match:
-                    index = int(match.group(1))
-                    if index > max_index:
-                        max_index = index
-            group_info[sanitized_part_name] = max_index
-            debug(f"Инициализирован индекс для '{sanitized_part_name}': {max_index}")
+                cached = not os.path.lexists(next_file)
+            if not cached:
+                break
+        if cached:
+            max_index = parts[sanitized_part_name]
+        else:
+            max_index = max(
+                scan_group_folder(folder.path, sanitized_part_name)
+                for folder in folders
+            )
+        group_info[sanitized_part_name] = max_index
+        debug(
+            f"Инициализирован индекс для '{sanitized_part_name}': {max_index}"
+            + (" (из файла индекса)" if cached else "")
+        )
     return group_info
 
 
@@ -169,101 +352,523 @@ def save_processed_folders(record_file: Path, processed_folders: set) -> None:
         )
 
 
+class TargetFolder:
+    """
+    Целевая папка и содержимое, которое нужно обработать, собранные при обходе.
+
+    Attributes:
+        path (Path): Путь к целевой папке.
+        group_name (str): Название немедленного подкаталога SOURCE_FOLDER, в котором она лежит.
+        png_files (List[Path]): Файлы .png непосредственно в целевой папке.
+        other_files (List[Path]): Остальные файлы непосредственно в целевой папке.
+        txt_folder (Path, optional): Папка 'TXT' внутри целевой папки, если она есть.
+        nested_dirs (List[Path]): Подкаталоги на уровне удаления, которые удаляются целиком.
+    """
+
+    def __init__(self, path: Path, group_name: str) -> None:
+        self.path = path
+        self.group_name = group_name
+        self.png_files: List[Path] = []
+        self.other_files: List[Path] = []
+        self.txt_folder: Optional[Path] = None
+        self.nested_dirs: List[Path] = []
+
+
+def scan_source_folder(
+    start_path: Path,
+    target_folder_name: str,
+    skip_names: Set[str],
+    delete_level: int = DEFAULT_DELETE_LEVEL,
+) -> List[TargetFolder]:
+    """
+    Находит все целевые папки и собирает их содержимое за один обход дерева.
+
+    Обход идет через os.scandir: тип записи берется из DirEntry, поэтому отдельный
+    stat для каждого файла и папки не нужен. Записи каждой папки сортируются по имени,
+    так что порядок целевых папок (а значит, и номера новых папок) не зависит
+    от файловой системы. Символические ссылки на папки не обходятся.
+
+    Папки, которые будут удалены целиком ('TXT' и подкаталоги целевых папок
+    на уровне delete_level), запоминаются, но внутрь них обход не заходит.
+
+    Args:
+        start_path (Path): Исходная папка.
+        target_folder_name (str): Имя целевых папок.
+        skip_names (Set[str]): Имена немедленных подкаталогов start_path, которые не обходятся
+            (Organized_PNGs, Group_PNGs и уже обработанные папки).
+        delete_level (int, optional): Уровень вложенности (относительно целевой папки)
+            подкаталогов, которые удаляются. По умолчанию 2.
+
+    Returns:
+        List[TargetFolder]: Целевые папки в порядке обхода.
+    """
+    # Сравнение имен как у glob: без учета регистра там, где его не учитывает ФС
+    target_key = os.path.normcase(target_folder_name)
+    txt_key = os.path.normcase(TXT_FOLDER_NAME)
+    skip_keys = {os.path.normcase(name) for name in skip_names}
+
+    targets: List[TargetFolder] = []
+    # Элемент стека: путь к папке, название немедленного подкаталога, целевая папка
+    # (если это она) и пары (целевая папка, уровень этой папки внутри нее)
+    stack = [(str(start_path), None, None, ())]
+    while stack:
+        path, group_name, target, owners = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            error(f"Не удалось прочитать папку '{path}': {e}")
+            continue
+
+        # Уровни подкаталогов этой папки внутри целевых папок, в которых она лежит
+        child_owners = tuple((owner, level + 1) for owner, level in owners)
+        if target is not None:
+            child_owners += ((target, 1),)
+
+        children = []
+        for entry in entries:
+            key = os.path.normcase(entry.name)
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+
+            if not is_dir:
+                if is_file and target is not None:
+                    if key.endswith(".png"):
+                        target.png_files.append(Path(entry.path))
+                    else:
+                        target.other_files.append(Path(entry.path))
+                continue
+
+            if group_name is None and key in skip_keys:
+                continue
+            if target is not None and key == txt_key:
+                # Папка 'TXT' удаляется целиком
+                target.txt_folder = Path(entry.path)
+                continue
+            # Подкаталоги на уровне удаления удаляются целиком вместе со всем,
+            # что в них лежит (в том числе с вложенными целевыми папками)
+            owner = next(
+                (owner for owner, level in child_owners if level == delete_level), None
+            )
+            if owner is not None:
+                owner.nested_dirs.append(Path(entry.path))
+                continue
+
+            child_group = entry.name if group_name is None else group_name
+            child_target = None
+            if key == target_key:
+                child_target = TargetFolder(Path(entry.path), child_group)
+                targets.append(child_target)
+            children.append((entry.path, child_group, child_target, child_owners))
+
+        # В обратном порядке, чтобы папки обходились по алфавиту
+        stack.extend(reversed(children))
+    return targets
+
+
+def kernel_copy(source_fd: int, destination_fd: int, size: int) -> bool:
+    """
+    Копирует содержимое файла средствами ядра, без буфера в Python.
+
+    Сначала пробует os.copy_file_range (на NFS 4.2 и SMB копирование идет на стороне
+    сервера, на btrfs и XFS может обойтись без копирования блоков), затем os.sendfile.
+    Оба доступны только на Linux.
+
+    Args:
+        source_fd (int): Дескриптор исходного файла (позиция в начале).
+        destination_fd (int): Дескриптор пустого файла назначения.
+        size (int): Размер исходного файла.
+
+    Returns:
+        bool: False, если ни один способ не подошел и ничего не скопировано.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    for name in ("copy_file_range", "sendfile"):
+        if not hasattr(os, name):
+            continue
+        offset = 0
+        try:
+            while offset < size:
+                if name == "copy_file_range":
+                    sent = os.copy_file_range(source_fd, destination_fd, size - offset)
+                else:
+                    sent = os.sendfile(destination_fd, source_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as e:
+            if offset == 0 and e.errno in KERNEL_COPY_UNSUPPORTED:
+                continue
+            raise
+        # Некоторые файловые системы вместо ошибки сразу возвращают 0
+        if offset == 0 and size > 0:
+            continue
+        return True
+    return False
+
+
+def stream_copy(source: Path, destination: Path) -> None:
+    """
+    Копирует содержимое файла (без метаданных), по возможности средствами ядра.
+
+    Args:
+        source (Path): Исходный файл.
+        destination (Path): Файл назначения; перезаписывается.
+
+    Raises:
+        OSError: Если файл не удалось скопировать. Недописанный файл удаляется.
+    """
+    with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+        try:
+            size = os.fstat(fsrc.fileno()).st_size
+            if not kernel_copy(fsrc.fileno(), fdst.fileno(), size):
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+        except BaseException:
+            fdst.close()
+            destination.unlink(missing_ok=True)
+            raise
+
+
+def move_file(source: Path, destination: Path) -> None:
+    """
+    Перемещает файл: переименованием в пределах одного диска, иначе копированием.
+
+    os.rename не переносит данные и не требует лишних stat, как shutil.move.
+    Между дисками (EXDEV) содержимое копируется через stream_copy, переносятся
+    права и время изменения, после чего исходный файл удаляется.
+
+    Args:
+        source (Path): Исходный файл.
+        destination (Path): Новый путь файла; не должен существовать.
+
+    Raises:
+        OSError: Если файл не удалось переместить.
+    """
+    try:
+        os.rename(source, destination)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    stream_copy(source, destination)
+    shutil.copystat(source, destination)
+    os.unlink(source)
+
+
+def reflink(source: Path, destination: Path) -> bool:
+    """
+    Создает файл-клон с общими блоками данных (ioctl FICLONE, только Linux).
+
+    Returns:
+        bool: False, если файловая система или платформа клоны не поддерживает.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    with open(source, "rb") as fsrc, open(destination, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return True
+        except OSError:
+            return False
+
+
+def place_in_group(source: Path, destination: Path, link_mode: str) -> str:
+    """
+    Помещает файл в папку части тела способом link_mode.
+
+    Жесткая ссылка, reflink и символическая ссылка не копируют данные. Если способ
+    недоступен (другой диск, файловая система без поддержки, нет прав на создание
+    символических ссылок), файл копируется.
+
+    Args:
+        source (Path): Файл в Organized_PNGs.
+        destination (Path): Путь в Group_PNGs; существующий файл заменяется копией.
+        link_mode (str): Один из LINK_MODES.
+
+    Returns:
+        str: Способ, которым файл помещен на самом деле.
+
+    Raises:
+        OSError: Если файл не удалось даже скопировать.
+    """
+    try:
+        if link_mode == "hardlink":
+            os.link(source, destination)
+            return link_mode
+        if link_mode == "symlink":
+            # Относительная ссылка остается верной при переносе всей исходной папки
+            os.symlink(os.path.relpath(source, destination.parent), destination)
+            return link_mode
+        if link_mode == "reflink" and reflink(source, destination):
+            return link_mode
+    except OSError:
+        pass
+    stream_copy(source, destination)
+    shutil.copymode(source, destination)
+    return "copy"
+
+
 def move_png_files(
-    target_folder_path: Path,
-    destination_folder: Path,
-    group_info: Optional[Dict[str, int]] = None,
-    group_destination_base: Optional[Path] = None,
-) -> None:
+    target: TargetFolder, destination_folder: Path
+) -> Tuple[List[Path], List[Path]]:
     """
     Перемещает все .png файлы из указанной целевой папки в папку назначения.
-    Если group_info и group_destination_base предоставлены, также группирует файлы по частям тела.
 
     Args:
-        target_folder_path (Path): Полный путь к целевой папке для перемещения файлов.
+        target (TargetFolder): Целевая папка со списком ее .png файлов.
         destination_folder (Path): Путь к папке, куда будут перемещены файлы.
-        group_info (Dict[str, int], optional): Словарь для отслеживания количества файлов по частям.
-        group_destination_base (Path, optional): Базовая папка для группировки файлов по частям.
-    """
-    for file in target_folder_path.glob("*.png"):
-        if file.is_file():
-            target_file_path = destination_folder / file.name
-            if not target_file_path.exists():
-                try:
-                    shutil.move(str(file), str(target_file_path))
-                    info(
-                        f"Файл '{file.name}' перемещен из '{target_folder_path}' в '{destination_folder}'"
-                    )
-                    # Если требуется группировка
-                    if group_info is not None and group_destination_base is not None:
-                        part_name = extract_part_name(file)
-                        sanitized_part_name = sanitize_name(part_name)
-                        if not sanitized_part_name:
-                            warning(
-                                f"Не удалось санитизировать название части для файла '{file.name}'. Файл пропущен для группировки."
-                            )
-                            continue
-                        group_folder = (
-                            group_destination_base / sanitized_part_name.capitalize()
-                        )
-                        if not group_folder.exists():
-                            group_folder.mkdir(parents=True, exist_ok=True)
-                            info(f"Создана папка для части тела: '{group_folder}'")
-                        # Обновляем счетчик
-                        count = group_info.get(sanitized_part_name, 0) + 1
-                        group_info[sanitized_part_name] = count
-                        # Новое имя файла
-                        new_file_name = f"{sanitized_part_name}_{count}.png"
-                        group_file_path = group_folder / new_file_name
-                        try:
-                            shutil.copy(str(target_file_path), str(group_file_path))
-                            info(f"Файл '{file.name}' скопирован в '{group_file_path}'")
-                        except Exception as e:
-                            error(
-                                f"Не удалось скопировать файл '{file.name}' в '{group_file_path}': {e}"
-                            )
-                except Exception as e:
-                    error(
-                        f"Не удалось переместить файл '{file.name}' из '{target_folder_path}' в '{destination_folder}': {e}"
-                    )
-            else:
-                warning(
-                    f"Файл '{file.name}' уже существует в '{destination_folder}', перемещение отменено"
+
+    Returns:
+        Tuple[List[Path], List[Path]]: Новые пути перемещенных файлов в порядке перемещения
+            и файлы, которые не были перемещены и остались в целевой папке.
+    """
+    target_folder_path = target.path
+    moved: List[Path] = []
+    remaining: List[Path] = []
+    for file in target.png_files:
+        target_file_path = destination_folder / file.name
+        if not target_file_path.exists():
+            try:
+                move_file(file, target_file_path)
+                moved.append(target_file_path)
+                info(
+                    f"Файл '{file.name}' перемещен из '{target_folder_path}' в '{destination_folder}'"
+                )
+            except Exception as e:
+                remaining.append(file)
+                error(
+                    f"Не удалось переместить файл '{file.name}' из '{target_folder_path}' в '{destination_folder}': {e}"
                 )
+        else:
+            remaining.append(file)
+            warning(
+                f"Файл '{file.name}' уже существует в '{destination_folder}', перемещение отменено"
+            )
+    return moved, remaining
 
 
-def delete_directories_at_specific_level(start_path: Path) -> None:
+def group_png_files(
+    moved_files: List[Path], group_info: Dict[str, int], group_destination_base: Path
+) -> List[Tuple[Path, Path]]:
     """
-    Удаляет все подкаталоги на определенном уровне вложенности в заданной папке.
+    Назначает перемещенным .png файлам имена в папках частей тела внутри Group_PNGs.
+
+    Номера берутся из group_info по порядку файлов, поэтому функция вызывается
+    из одного потока и в порядке групп: так нумерация не зависит от --jobs.
 
     Args:
-        start_path (Path): Путь к начальной папке для удаления подкаталогов.
+        moved_files (List[Path]): Перемещенные файлы в порядке перемещения.
+        group_info (Dict[str, int]): Словарь для отслеживания количества файлов по частям.
+        group_destination_base (Path): Базовая папка для группировки файлов по частям.
+
+    Returns:
+        List[Tuple[Path, Path]]: Пары (файл, путь его копии в Group_PNGs).
     """
-    for dir_path in start_path.rglob("*"):
-        if dir_path.is_dir():
-            for sub_dir in dir_path.iterdir():
-                if sub_dir.is_dir():
-                    try:
-                        shutil.rmtree(sub_dir)
-                        info(f"Папка '{sub_dir}' удалена")
-                    except Exception as e:
-                        error(f"Не удалось удалить папку '{sub_dir}': {e}")
+    copies: List[Tuple[Path, Path]] = []
+    for file in moved_files:
+        part_name = extract_part_name(file)
+        sanitized_part_name = sanitize_name(part_name)
+        if not sanitized_part_name:
+            warning(
+                f"Не удалось санитизировать название части для файла '{file.name}'. Файл пропущен для группировки."
+            )
+            continue
+        group_folder = group_destination_base / sanitized_part_name.capitalize()
+        if not group_folder.exists():
+            try:
+                group_folder.mkdir(parents=True, exist_ok=True)
+                info(f"Создана папка для части тела: '{group_folder}'")
+            except Exception as e:
+                error(f"Не удалось создать папку '{group_folder}': {e}")
+                continue
+        # Обновляем счетчик
+        count = group_info.get(sanitized_part_name, 0) + 1
+        group_info[sanitized_part_name] = count
+        # Новое имя файла
+        new_file_name = f"{sanitized_part_name}_{count}.png"
+        copies.append((file, group_folder / new_file_name))
+    return copies
 
 
-def delete_files_in_folder(folder_path: Path) -> None:
+def copy_to_group(file: Path, group_file_path: Path, link_mode: str = "copy") -> bool:
     """
-    Удаляет все файлы в указанной папке.
+    Копирует файл в папку части тела (или создает на него ссылку, см. --link-mode).
 
     Args:
-        folder_path (Path): Путь к папке, из которой нужно удалить файлы.
+        file (Path): Исходный файл.
+        group_file_path (Path): Путь копии в Group_PNGs.
+        link_mode (str, optional): Один из LINK_MODES. По умолчанию "copy".
+
+    Returns:
+        bool: True, если файл скопирован.
     """
-    for file in folder_path.iterdir():
-        if file.is_file():
+    try:
+        method = place_in_group(file, group_file_path, link_mode)
+        info(f"Файл '{file.name}' {LINK_MODES[method]} в '{group_file_path}'")
+        return True
+    except Exception as e:
+        error(f"Не удалось скопировать файл '{file.name}' в '{group_file_path}': {e}")
+        return False
+
+
+def delete_children(parent: Path, names: List[str]) -> int:
+    """
+    Удаляет целиком подкаталоги одной папки.
+
+    Где это возможно, родительская папка открывается один раз, а shutil.rmtree
+    работает относительно ее дескриптора (dir_fd): путь от корня не разбирается
+    заново для каждого подкаталога, а содержимое удаляется снизу вверх через
+    дескрипторы (openat/unlinkat), без подмены путей символическими ссылками.
+
+    Args:
+        parent (Path): Папка, в которой лежат подкаталоги.
+        names (List[str]): Имена подкаталогов.
+
+    Returns:
+        int: Количество удаленных подкаталогов.
+    """
+    parent_fd = None
+    if RMTREE_DIR_FD:
+        try:
+            parent_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+        except FileNotFoundError:
+            # Уже удалена вместе с другой папкой
+            return 0
+        except OSError as e:
+            error(f"Не удалось открыть папку '{parent}': {e}")
+            return 0
+
+    deleted = 0
+    try:
+        for name in names:
+            sub_dir = parent / name
             try:
-                file.unlink()
-                info(f"Файл '{file.name}' удален")
+                if parent_fd is not None:
+                    shutil.rmtree(name, dir_fd=parent_fd)
+                else:
+                    shutil.rmtree(sub_dir)
+                deleted += 1
+                info(f"Папка '{sub_dir}' удалена")
+            except FileNotFoundError:
+                continue
             except Exception as e:
-                error(f"Не удалось удалить файл '{file.name}': {e}")
+                error(f"Не удалось удалить папку '{sub_dir}': {e}")
+    finally:
+        if parent_fd is not None:
+            os.close(parent_fd)
+    return deleted
+
+
+def delete_directories_at_specific_level(directories: List[Path], jobs: int = 1) -> int:
+    """
+    Удаляет подкаталоги на уровне удаления, найденные при обходе.
+
+    Обход уже остановился на этом уровне, поэтому каждый подкаталог удаляется
+    одним rmtree, а вложенные в него папки повторно не перебираются. Подкаталоги
+    группируются по родительской папке; при jobs > 1 родительские папки
+    обрабатываются в нескольких потоках.
+
+    Args:
+        directories (List[Path]): Подкаталоги, которые нужно удалить.
+        jobs (int, optional): Количество потоков. По умолчанию 1.
+
+    Returns:
+        int: Количество удаленных подкаталогов.
+    """
+    by_parent: Dict[Path, List[str]] = {}
+    for sub_dir in directories:
+        by_parent.setdefault(sub_dir.parent, []).append(sub_dir.name)
+    if jobs <= 1 or len(by_parent) <= 1:
+        return sum(map(delete_children, by_parent, by_parent.values()))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return sum(executor.map(delete_children, by_parent, by_parent.values()))
+
+
+def delete_files_in_folder(files: List[Path]) -> int:
+    """
+    Удаляет перечисленные файлы целевой папки.
+
+    Args:
+        files (List[Path]): Файлы, которые нужно удалить.
+
+    Returns:
+        int: Количество удаленных файлов.
+    """
+    deleted = 0
+    for file in files:
+        try:
+            file.unlink()
+            deleted += 1
+            info(f"Файл '{file.name}' удален")
+        except Exception as e:
+            error(f"Не удалось удалить файл '{file.name}': {e}")
+    return deleted
+
+
+def process_group(
+    group_name: str, folders: List[TargetFolder], organized_pngs: Path
+) -> Tuple[List[Path], int]:
+    """
+    Обрабатывает целевые папки одной группы: перемещает .png файлы в новые папки
+    с порядковыми номерами и удаляет из целевых папок файлы и папку 'TXT'.
+    Подкаталоги на уровне удаления удаляются позже, после всех групп.
+
+    Группы не пересекаются в файловой системе, поэтому при --jobs несколько групп
+    обрабатываются одновременно в разных потоках.
+
+    Args:
+        group_name (str): Название немедленного подкаталога SOURCE_FOLDER.
+        folders (List[TargetFolder]): Целевые папки группы в порядке обхода.
+        organized_pngs (Path): Папка Organized_PNGs.
+
+    Returns:
+        Tuple[List[Path], int]: Перемещенные .png файлы в порядке перемещения
+            и количество удаленных файлов.
+    """
+    debug(f"Обработка группы папок '{group_name}' с {len(folders)} целевыми папками.")
+    moved_files: List[Path] = []
+    deleted = 0
+
+    # Создание новой папки с порядковым номером для каждой целевой папки
+    for index, target in enumerate(folders, start=1):
+        target_folder_path = target.path
+        # Папка могла быть удалена при обработке объемлющей целевой папки
+        if not target_folder_path.is_dir():
+            warning(f"Папка '{target_folder_path}' больше не существует. Пропуск.")
+            continue
+
+        new_folder_name = f"{group_name}_{index}"
+        new_folder_path = organized_pngs / new_folder_name
+
+        # Создание новой папки с уникальным именем
+        try:
+            new_folder_path.mkdir(parents=True, exist_ok=True)
+            info(f"Создана папка '{new_folder_path}' для перемещения файлов.")
+        except Exception as e:
+            error(f"Не удалось создать папку '{new_folder_path}': {e}")
+            continue
+
+        # Перемещение .png файлов
+        moved, remaining_files = move_png_files(target, new_folder_path)
+        moved_files.extend(moved)
+
+        # Удаление папки 'TXT', если она существует внутри целевой папки
+        if target.txt_folder is not None:
+            try:
+                shutil.rmtree(target.txt_folder)
+                info(f"Папка 'TXT' удалена из '{target_folder_path}'")
+            except Exception as e:
+                error(f"Не удалось удалить папку 'TXT' из '{target_folder_path}': {e}")
+
+        # Удаление всех файлов в целевой папке
+        deleted += delete_files_in_folder(remaining_files + target.other_files)
+    return moved_files, deleted
 
 
 def rename_folders_and_clean_files(
@@ -271,6 +876,9 @@ def rename_folders_and_clean_files(
     target_folder_name: str,
     group: bool = False,
     record_file: Optional[Path] = None,
+    jobs: int = 1,
+    delete_level: int = DEFAULT_DELETE_LEVEL,
+    link_mode: str = "copy",
 ) -> None:
     """
     Переименовывает папки в заданной директории по порядковому номеру,
@@ -284,41 +892,46 @@ def rename_folders_and_clean_files(
         target_folder_name (str): Имя целевой папки для перемещения файлов.
         group (bool, optional): Флаг для группировки файлов по частям тела. По умолчанию False.
         record_file (Path, optional): Путь к файлу учёта обработанных папок. Если не указан, используется 'processed_folders.json' в start_path.
+        jobs (int, optional): Сколько групп папок обрабатывать одновременно. По умолчанию 1.
+        delete_level (int, optional): Уровень вложенности подкаталогов целевых папок,
+            которые удаляются целиком. По умолчанию 2.
+        link_mode (str, optional): Как файлы попадают в Group_PNGs: один из LINK_MODES.
+            По умолчанию "copy".
     """
+    started = time.perf_counter()
     if record_file is None:
         record_file = start_path / "processed_folders.json"
 
     # Загрузка уже обработанных папок
     processed_folders = load_processed_folders(record_file)
 
-    # Поиск всех целевых папок внутри start_path
-    target_folders = list(start_path.rglob(target_folder_name))
+    # Уже обработанные папки и папки самого скрипта не обходятся
+    for immediate_subfolder_name in sorted(processed_folders):
+        if (start_path / immediate_subfolder_name).is_dir():
+            info(
+                f"Группа папок с названием '{immediate_subfolder_name}' уже была обработана. Пропуск."
+            )
+    skip_names = processed_folders | {ORGANIZED_FOLDER_NAME, GROUP_FOLDER_NAME}
+
+    # Поиск всех целевых папок и их содержимого за один обход start_path
+    target_folders = scan_source_folder(
+        start_path, target_folder_name, skip_names, delete_level
+    )
     debug(f"Найдено {len(target_folders)} папок с именем '{target_folder_name}'")
 
     if not target_folders:
         warning(
-            f"Не найдено ни одной папки с именем '{target_folder_name}' внутри '{start_path}'."
+            f"Не найдено ни одной необработанной папки с именем '{target_folder_name}' внутри '{start_path}'."
         )
         return
 
     # Группировка целевых папок по названиям немедленных подкаталогов в SOURCE_FOLDER
-    groups: Dict[str, List[Path]] = {}
-    for target_folder_path in target_folders:
-        try:
-            relative_path = target_folder_path.relative_to(start_path)
-            # Извлечение названия немедленного подкаталога (первый уровень)
-            immediate_subfolder_name = relative_path.parts[0]
-            if immediate_subfolder_name not in groups:
-                groups[immediate_subfolder_name] = []
-            groups[immediate_subfolder_name].append(target_folder_path)
-        except ValueError:
-            error(
-                f"Папка '{target_folder_path}' не находится внутри '{start_path}'. Пропуск."
-            )
-            continue
+    groups: Dict[str, List[TargetFolder]] = {}
+    for target in target_folders:
+        groups.setdefault(target.group_name, []).append(target)
 
     # Создание папки 'Organized_PNGs' для перемещенных файлов
-    organized_pngs = start_path / "Organized_PNGs"
+    organized_pngs = start_path / ORGANIZED_FOLDER_NAME
     if not organized_pngs.exists():
         try:
             organized_pngs.mkdir(parents=True, exist_ok=True)
@@ -329,7 +942,7 @@ def rename_folders_and_clean_files(
 
     # Если group is True, создаём папку 'Group_PNGs'
     if group:
-        group_pngs = start_path / "Group_PNGs"
+        group_pngs = start_path / GROUP_FOLDER_NAME
         if not group_pngs.exists():
             try:
                 group_pngs.mkdir(parents=True, exist_ok=True)
@@ -343,57 +956,54 @@ def rename_folders_and_clean_files(
         group_pngs = None
         group_info = None
 
-    # Перемещение файлов и переименование папок по группам
-    for immediate_subfolder_name, folders in groups.items():
-        # Проверка, была ли уже обработана группа папок с этим именем
-        if immediate_subfolder_name in processed_folders:
-            info(
-                f"Группа папок с названием '{immediate_subfolder_name}' уже была обработана. Пропуск."
-            )
-            continue
-
-        debug(
-            f"Обработка группы папок '{immediate_subfolder_name}' с {len(folders)} целевыми папками."
+    # Перемещение файлов и переименование папок по группам. Группы обрабатываются
+    # в пуле потоков, а результаты забираются в порядке групп: номера в Group_PNGs
+    # и учет обработанных папок обновляются только здесь, в одном потоке
+    moved_count = deleted_count = 0
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(
+            lambda name: process_group(name, groups[name], organized_pngs), groups
         )
-
-        # Создание новой папки с порядковым номером для каждой целевой папки
-        for index, target_folder_path in enumerate(folders, start=1):
-            new_folder_name = f"{immediate_subfolder_name}_{index}"
-            new_folder_path = organized_pngs / new_folder_name
-
-            # Создание новой папки с уникальным именем
-            try:
-                new_folder_path.mkdir(parents=True, exist_ok=True)
-                info(f"Создана папка '{new_folder_path}' для перемещения файлов.")
-            except Exception as e:
-                error(f"Не удалось создать папку '{new_folder_path}': {e}")
-                continue
-
-            # Перемещение .png файлов
-            move_png_files(target_folder_path, new_folder_path, group_info, group_pngs)
-
-            # Удаление папки 'TXT', если она существует внутри целевой папки
-            txt_folder_path = target_folder_path / "TXT"
-            if txt_folder_path.exists() and txt_folder_path.is_dir():
-                try:
-                    shutil.rmtree(txt_folder_path)
-                    info(f"Папка 'TXT' удалена из '{target_folder_path}'")
-                except Exception as e:
-                    error(
-                        f"Не удалось удалить папку 'TXT' из '{target_folder_path}': {e}"
+        # Копирования в Group_PNGs: (санитизированное название части, future)
+        copies: List[Tuple[str, Future]] = []
+        for immediate_subfolder_name, (moved_files, deleted) in zip(groups, results):
+            moved_count += len(moved_files)
+            deleted_count += deleted
+            if group:
+                # Индекс обновляется после каждой группы; папки частей, в которые
+                # еще копируются файлы предыдущих групп, в него не попадают
+                save_group_index(
+                    group_pngs,
+                    group_info,
+                    {part for part, future in copies if not future.done()},
+                )
+                for file, group_file_path in group_png_files(
+                    moved_files, group_info, group_pngs
+                ):
+                    copies.append(
+                        (
+                            sanitize_name(group_file_path.parent.name),
+                            executor.submit(
+                                copy_to_group, file, group_file_path, link_mode
+                            ),
+                        )
                     )
 
-            # Удаление всех файлов в целевой папке
-            delete_files_in_folder(target_folder_path)
+            # После успешной обработки всех целевых папок в группе, добавляем название немедленного подкаталога в учёт
+            processed_folders.add(immediate_subfolder_name)
+            debug(
+                f"Группа папок '{immediate_subfolder_name}' добавлена в учёт обработанных папок."
+            )
+        copied_count = sum(future.result() for _, future in copies)
 
-            # Удаление подкаталогов на определенном уровне вложенности
-            delete_directories_at_specific_level(target_folder_path)
+    # Сохранение счетчиков частей тела после того, как все файлы скопированы
+    if group:
+        save_group_index(group_pngs, group_info)
 
-        # После успешной обработки всех целевых папок в группе, добавляем название немедленного подкаталога в учёт
-        processed_folders.add(immediate_subfolder_name)
-        debug(
-            f"Группа папок '{immediate_subfolder_name}' добавлена в учёт обработанных папок."
-        )
+    # Удаление подкаталогов на определенном уровне вложенности
+    deleted_dirs = delete_directories_at_specific_level(
+        [sub_dir for target in target_folders for sub_dir in target.nested_dirs], jobs
+    )
 
     # Сохранение обновлённого списка обработанных папок
     save_processed_folders(record_file, processed_folders)
@@ -402,6 +1012,14 @@ def rename_folders_and_clean_files(
     if group:
         info("Группировка PNG файлов завершена.")
 
+    elapsed = time.perf_counter() - started
+    total = moved_count + deleted_count + copied_count
+    info(
+        f"Перемещено файлов: {moved_count}, удалено: {deleted_count}, добавлено в '{GROUP_FOLDER_NAME}': {copied_count}, "
+        f"удалено папок: {deleted_dirs} "
+        f"за {elapsed:.2f} с ({total / max(elapsed, 1e-6):.0f} файлов/с, потоков: {jobs})"
+    )
+
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -428,6 +1046,28 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Создает папку Group_PNGs для группировки .png файлов по частям тела.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Сколько групп папок обрабатывать одновременно (по умолчанию 1).",
+    )
+    parser.add_argument(
+        "--delete-level",
+        type=int,
+        default=DEFAULT_DELETE_LEVEL,
+        help="Уровень вложенности подкаталогов целевой папки, которые удаляются "
+        f"целиком (по умолчанию {DEFAULT_DELETE_LEVEL}).",
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=list(LINK_MODES),
+        default="copy",
+        help="Как файлы попадают в Group_PNGs: copy — копия (по умолчанию), hardlink — "
+        "жесткая ссылка (файлы в Organized_PNGs и Group_PNGs становятся одним файлом), "
+        "reflink — клон с общими блоками данных (btrfs, XFS), symlink — символическая "
+        "ссылка. Если способ недоступен, файл копируется.",
+    )
     return parser.parse_args()
 
 
@@ -444,7 +1084,7 @@ def main() -> None:
         )  # Удаление лишних кавычек
 
         debug(
-            f"Parsed arguments: source_folder='{source_folder}', target_folder_name='{target_folder_name}', group={args.group}"
+            f"Parsed arguments: source_folder='{source_folder}', target_folder_name='{target_folder_name}', group={args.group}, jobs={args.jobs}, delete_level={args.delete_level}, link_mode={args.link_mode}"
         )
 
         # Проверка существования исходной папки
@@ -453,12 +1093,25 @@ def main() -> None:
                 f"Исходная папка '{source_folder}' не существует или не является директорией."
             )
             return
+        if args.jobs < 1:
+            error(f"Количество потоков должно быть не меньше 1, получено: {args.jobs}.")
+            return
+        if args.delete_level < 1:
+            error(
+                f"Уровень удаления должен быть не меньше 1, получено: {args.delete_level}."
+            )
+            return
 
         info(
             f"Начало обработки. Исходная папка: '{source_folder}', Целевая папка: '{target_folder_name}'"
         )
         rename_folders_and_clean_files(
-            source_folder, target_folder_name, group=args.group
+            source_folder,
+            target_folder_name,
+            group=args.group,
+            jobs=args.jobs,
+            delete_level=args.delete_level,
+            link_mode=args.link_mode,
         )
         info("Обработка завершена.")
     except Exception as e:
@@ -0,0 +1,108 @@
+# search_index.py
+
+import math
+import os
+from collections import Counter, defaultdict
+
+
+def search_key(path):
+    """Имя скрипта для поиска: без каталога и расширения, в нижнем регистре."""
+    return os.path.splitext(os.path.basename(path))[0].lower()
+
+
+def trigrams(text):
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """
+    Триграммный индекс имён скриптов для нечёткого поиска.
+
+    Индекс обновляется инкрементально при добавлении и удалении скриптов.
+    Запрос из трёх и более символов находит имена, содержащие не меньше
+    MIN_SHARED его триграмм, поэтому опечатки допустимы; точные вхождения
+    подстроки идут первыми. Более короткий запрос ищется как подстрока;
+    при наборе он уточняет результаты предыдущего короткого запроса.
+    """
+
+    MIN_SHARED = 0.5
+
+    def __init__(self, paths=()):
+        self.names = {}  # путь -> ключ поиска
+        self.postings = defaultdict(set)  # триграмма -> пути
+        # Последний короткий запрос и его результаты
+        self._last_query = None
+        self._last_matches = None
+        self.add(paths)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, paths):
+        self._last_query = None
+        for path in paths:
+            if path in self.names:
+                continue
+            name = search_key(path)
+            self.names[path] = name
+            for gram in trigrams(name):
+                self.postings[gram].add(path)
+
+    def remove(self, paths):
+        self._last_query = None
+        for path in paths:
+            name = self.names.pop(path, None)
+            if name is None:
+                continue
+            for gram in trigrams(name):
+                bucket = self.postings.get(gram)
+                if bucket is not None:
+                    bucket.discard(path)
+                    if not bucket:
+                        del self.postings[gram]
+
+    def search(self, query):
+        """
+        Поиск скриптов по имени.
+
+        Returns:
+            list[str]: Пути, отсортированные по релевантности.
+        """
+        query = query.strip().lower()
+        if query.endswith(".py"):
+            query = query[:-3]
+        if not query:
+            return []
+        grams = trigrams(query)
+        if not grams:
+            # Имена, содержащие query, содержат и любую его подстроку
+            if self._last_query is not None and self._last_query in query:
+                candidates = self._last_matches
+            else:
+                candidates = self.names
+            matches = [path for path in candidates if query in self.names[path]]
+            self._last_query = query
+            self._last_matches = matches
+            matches = sorted(
+                matches,
+                key=lambda path: (
+                    not self.names[path].startswith(query),
+                    self.names[path],
+                ),
+            )
+            return matches
+
+        hits = Counter()
+        for gram in grams:
+            hits.update(self.postings.get(gram, ()))
+        needed = max(1, math.ceil(len(grams) * self.MIN_SHARED))
+        ranked = []
+        for path, count in hits.items():
+            if count < needed:
+                continue
+            name = self.names[path]
+            ranked.append(
+                (query not in name, not name.startswith(query), -count, name, path)
+            )
+        ranked.sort()
+        return [item[-1] for item in ranked]
@@ -0,0 +1,130 @@
+# warm_pool.py
+
+import json
+import os
+import subprocess
+import threading
+from collections import deque
+
+from constants import DEFAULT_WARM_POOL_SIZE
+from runner import child_env
+
+WORKER_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "warm_worker.py"
+)
+
+
+class WarmPool:
+    """
+    Пул заранее запущенных интерпретаторов для быстрого старта скриптов.
+
+    Для каждого интерпретатора держится до size простаивающих процессов
+    warm_worker.py. launch() отдаёт готовый процесс, отправив ему задание,
+    поэтому время старта интерпретатора уходит из времени выполнения
+    скрипта. Воркеры одноразовые: состояние интерпретатора (модули,
+    глобальные переменные) не переходит от одного скрипта к другому.
+    Замена запускается после завершения скрипта (finished), чтобы старт
+    нового интерпретатора не отнимал процессор у выполняющегося скрипта.
+    """
+
+    def __init__(self, size=DEFAULT_WARM_POOL_SIZE):
+        self.size = max(1, size)
+        self._idle = {}  # интерпретатор -> очередь простаивающих процессов
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def parse_command(command):
+        """
+        Интерпретатор, скрипт и аргументы из команды вида [python, script.py, ...].
+
+        Returns:
+            tuple | None: (интерпретатор, argv скрипта) или None, если команду
+            нельзя выполнить в воркере (например, есть флаги интерпретатора).
+        """
+        if len(command) < 2 or not command[1].endswith(".py"):
+            return None
+        return command[0], list(command[1:])
+
+    def spawn(self, interpreter):
+        return subprocess.Popen(
+            [interpreter, WORKER_PATH],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+            env=child_env(),
+            # Своя группа процессов, как у обычного запуска (ScriptProcess.stop)
+            start_new_session=True,
+        )
+
+    def warm(self, interpreter):
+        """Дозапуск простаивающих воркеров интерпретатора до size."""
+        with self._lock:
+            if self._closed:
+                return
+            idle = self._idle.setdefault(interpreter, deque())
+            while len(idle) < self.size:
+                idle.append(self.spawn(interpreter))
+
+    def launch(self, command):
+        """
+        Запуск команды в тёплом воркере.
+
+        Первый запуск с новым интерпретатором выполняется обычным способом
+        (возвращается None), но уже прогревает для него пул.
+
+        Returns:
+            subprocess.Popen | None: Процесс, выполняющий скрипт, или None.
+        """
+        parsed = self.parse_command(command)
+        if parsed is None:
+            return None
+        interpreter, argv = parsed
+        worker = None
+        with self._lock:
+            idle = self._idle.get(interpreter)
+            while idle:
+                candidate = idle.popleft()
+                # Воркер мог завершиться сам (например, ошибка импорта)
+                if candidate.poll() is None:
+                    worker = candidate
+                    break
+                candidate.stdin.close()
+                candidate.stdout.close()
+        if worker is None:
+            self.finished(command)
+            return None
+        request = {"argv": argv, "cwd": os.getcwd()}
+        try:
+            worker.stdin.write(json.dumps(request).encode("utf-8") + b"\n")
+            worker.stdin.close()
+        except OSError:
+            worker.kill()
+            worker.wait()
+            worker.stdout.close()
+            return None
+        return worker
+
+    def finished(self, command):
+        """Пополнение пула после завершения скрипта, запущенного командой."""
+        parsed = self.parse_command(command)
+        if parsed is None:
+            return
+        try:
+            self.warm(parsed[0])
+        except OSError:
+            # Интерпретатор не найден: обычный запуск сообщит об ошибке сам
+            pass
+
+    def shutdown(self):
+        """Остановка всех простаивающих воркеров."""
+        with self._lock:
+            self._closed = True
+            workers = [worker for idle in self._idle.values() for worker in idle]
+            self._idle.clear()
+        for worker in workers:
+            worker.kill()
+            worker.wait()
+            worker.stdin.close()
+            worker.stdout.close()
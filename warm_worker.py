@@ -0,0 +1,55 @@
+# warm_worker.py
+
+"""
+Тёплый интерпретатор для пула warm_pool.WarmPool.
+
+Процесс запускается заранее и ждёт в stdin одну строку JSON вида
+{"argv": [путь_к_скрипту, аргументы...], "cwd": каталог}. После этого
+скрипт выполняется через runpy.run_path так же, как `python скрипт.py`:
+со своими sys.argv и sys.path[0], выводом в stdout/stderr процесса и
+кодом завершения процесса. Воркер одноразовый — после скрипта процесс
+завершается, и пул запускает новый.
+"""
+
+import json
+import os
+import runpy
+import sys
+
+# runpy.run_path импортирует pkgutil при первом вызове. Прочие модули
+# заранее не импортируются: их выгрузка при выходе стоила бы скриптам,
+# которые их не используют, больше, чем экономит импорт тем, кто использует
+import pkgutil  # noqa: F401
+
+
+def main():
+    line = sys.stdin.buffer.readline()
+    if not line:
+        # Пул закрыт без задания
+        return
+    request = json.loads(line)
+    argv = request["argv"]
+    os.chdir(request.get("cwd") or os.getcwd())
+    # Скрипт не должен читать протокол пула из stdin
+    sys.stdin.close()
+    sys.stdin = open(os.devnull, "r", encoding="utf-8")
+
+    script_path = argv[0]
+    sys.argv = list(argv)
+    sys.path[0] = os.path.dirname(os.path.abspath(script_path))
+    try:
+        runpy.run_path(script_path, run_name="__main__")
+    except Exception as e:
+        import traceback
+
+        # Кадры воркера и runpy в трассировке не нужны: она должна выглядеть
+        # так же, как при обычном запуске скрипта
+        tb = e.__traceback__
+        while tb is not None and tb.tb_frame.f_code.co_filename != script_path:
+            tb = tb.tb_next
+        traceback.print_exception(type(e), e, tb)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
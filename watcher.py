@@ -0,0 +1,294 @@
+# watcher.py
+
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+
+from constants import WATCHER_DEBOUNCE_MS, WATCHER_POLL_INTERVAL_MS
+
+# Флаги inotify (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def load_inotify():
+    """Функции inotify из libc или None, если inotify недоступен."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6")
+        functions = (
+            libc.inotify_init1,
+            libc.inotify_add_watch,
+            libc.inotify_rm_watch,
+        )
+    except (OSError, AttributeError):
+        return None
+    functions[1].argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+    functions[2].argtypes = (ctypes.c_int, ctypes.c_int)
+    return functions
+
+
+class ScriptWatcher:
+    """
+    Наблюдение за зарегистрированными скриптами в фоновом потоке.
+
+    Отслеживаются каталоги, содержащие скрипты (а не сами файлы), поэтому
+    сохранение редактором через временный файл и переименование не теряет
+    наблюдение. На Linux используется inotify, иначе — периодическая
+    проверка (st_mtime_ns, st_size). Каталоги, наблюдение за которыми
+    поставить не удалось (каталог удалён и ещё не создан заново, исчерпан
+    max_user_watches) или снято ядром, проверяются так же раз в
+    poll_interval, и наблюдение за ними ставится повторно. События за время
+    debounce объединяются: в очередь events помещаются пачки
+    [(путь, файл существует), ...] только для изменившихся скриптов.
+    """
+
+    def __init__(
+        self,
+        debounce=WATCHER_DEBOUNCE_MS / 1000,
+        poll_interval=WATCHER_POLL_INTERVAL_MS / 1000,
+    ):
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.events = queue.Queue()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        # Каталог -> {имя файла: путь скрипта в том виде, как он зарегистрирован}
+        self._dirs = {}
+        self._dirs_changed = False
+        self._inotify = load_inotify()
+        self._fd = None
+        self._watches = {}  # каталог -> дескриптор наблюдения
+        self._watch_dirs = {}  # дескриптор наблюдения -> каталог
+        # Каталоги без наблюдения и последнее состояние их скриптов
+        self._unwatched = set()
+        self._snapshots = {}
+        self._next_retry = 0.0
+
+    @property
+    def backend(self):
+        return "inotify" if self._inotify is not None else "polling"
+
+    def set_paths(self, paths):
+        """Замена набора отслеживаемых скриптов (применяется фоновым потоком)."""
+        dirs = {}
+        for path in paths:
+            directory, name = os.path.split(os.path.abspath(path))
+            dirs.setdefault(directory, {})[name] = path
+        with self._lock:
+            self._dirs = dirs
+            self._dirs_changed = True
+
+    def start(self):
+        if self._thread is not None:
+            return
+        if self._inotify is not None:
+            self._fd = self._inotify[0](IN_NONBLOCK | IN_CLOEXEC)
+            if self._fd < 0:
+                self._inotify = None
+                self._fd = None
+        if self._inotify is not None:
+            target = self._watch_inotify
+        else:
+            target = self._watch_poll
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _paths(self):
+        with self._lock:
+            return [path for names in self._dirs.values() for path in names.values()]
+
+    def _emit(self, paths):
+        if paths:
+            self.events.put([(path, os.path.isfile(path)) for path in sorted(paths)])
+
+    def _sync_watches(self):
+        """
+        Добавление и снятие наблюдений по изменившемуся набору каталогов.
+
+        Returns:
+            set: Скрипты в каталогах без наблюдения, изменившиеся с прошлой
+            проверки.
+        """
+        with self._lock:
+            dirs_changed = self._dirs_changed
+            self._dirs_changed = False
+            dirs = self._dirs
+        if dirs_changed:
+            _, _, rm_watch = self._inotify
+            for directory in set(self._watches) - set(dirs):
+                rm_watch(self._fd, self._watches.pop(directory))
+            for directory in self._unwatched - set(dirs):
+                self._forget_unwatched(directory)
+            for directory in set(dirs) - set(self._watches) - self._unwatched:
+                if not self._add_watch(directory):
+                    self._mark_unwatched(directory, dirs)
+        if self._unwatched and time.monotonic() >= self._next_retry:
+            return self._retry_unwatched(dirs)
+        return set()
+
+    def _add_watch(self, directory):
+        _, add_watch, _ = self._inotify
+        wd = add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            return False
+        self._watches[directory] = wd
+        self._watch_dirs[wd] = directory
+        return True
+
+    def _mark_unwatched(self, directory, dirs):
+        """Переход каталога на проверку по таймеру с запоминанием его скриптов."""
+        self._unwatched.add(directory)
+        for path in dirs.get(directory, {}).values():
+            self._snapshots[path] = self._stat(path)
+
+    def _forget_unwatched(self, directory):
+        self._unwatched.discard(directory)
+        for path in [p for p in self._snapshots if os.path.dirname(p) == directory]:
+            del self._snapshots[path]
+
+    def _retry_unwatched(self, dirs):
+        """Повторная постановка наблюдений и проверка скриптов без наблюдения."""
+        self._next_retry = time.monotonic() + self.poll_interval
+        retried = sorted(self._unwatched)
+        # Сначала наблюдение, потом проверка: изменение между ними не теряется
+        armed = [directory for directory in retried if self._add_watch(directory)]
+        changed = set()
+        for directory in retried:
+            for path in dirs.get(directory, {}).values():
+                stat = self._stat(path)
+                if self._snapshots.get(path) != stat:
+                    changed.add(path)
+                self._snapshots[path] = stat
+        for directory in armed:
+            self._forget_unwatched(directory)
+        return changed
+
+    @staticmethod
+    def _stat(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _changed_paths(self, data):
+        """Пути отслеживаемых скриптов, затронутых пачкой событий inotify."""
+        changed = set()
+        with self._lock:
+            dirs = self._dirs
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # Очередь ядра переполнена — проверяются все скрипты
+                return set(self._paths())
+            directory = self._watch_dirs.get(wd)
+            if directory is None:
+                continue
+            names = dirs.get(directory, {})
+            if mask & IN_IGNORED:
+                # Каталог удалён или перемещён: наблюдение снято ядром
+                del self._watch_dirs[wd]
+                if self._watches.get(directory) == wd:
+                    del self._watches[directory]
+                    if directory in dirs:
+                        # Каталог может появиться снова (git checkout, rsync)
+                        self._mark_unwatched(directory, dirs)
+                        self._next_retry = 0.0
+                changed.update(names.values())
+            elif mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                changed.update(names.values())
+            else:
+                path = names.get(os.fsdecode(name))
+                if path is not None:
+                    changed.add(path)
+        return changed
+
+    def _watch_inotify(self):
+        pending = set()
+        deadline = None
+        while not self._stopped.is_set():
+            changed = self._sync_watches()
+            timeout = 0.5
+            if deadline is not None:
+                timeout = max(0.0, min(timeout, deadline - time.monotonic()))
+            readable, _, _ = select.select([self._fd], [], [], timeout)
+            if readable:
+                try:
+                    data = os.read(self._fd, 64 * 1024)
+                except BlockingIOError:
+                    data = b""
+                changed |= self._changed_paths(data)
+            if changed:
+                pending |= changed
+                # Серия событий (временный файл, переименование, chmod)
+                # сдвигает срок и сообщается одной пачкой
+                deadline = time.monotonic() + self.debounce
+            if deadline is not None and time.monotonic() >= deadline:
+                self._emit(pending)
+                pending = set()
+                deadline = None
+
+    def _watch_poll(self):
+        snapshots = {}
+        while not self._stopped.wait(self.poll_interval):
+            changed = set()
+            current = {}
+            for path in self._paths():
+                try:
+                    stat = os.stat(path)
+                    current[path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    current[path] = None
+                # Новые пути только запоминаются
+                if path in snapshots and snapshots[path] != current[path]:
+                    changed.add(path)
+            snapshots = current
+            self._emit(changed)
@@ -0,0 +1,22 @@
+# widgets/__init__.py
+
+# Виджеты импортируются при первом обращении: "from widgets import ScriptList"
+# не должен загружать консоль вывода (ansi, output_buffer, output_search,
+# tag_pool) до первого запуска скрипта.
+import importlib
+
+__all__ = ["FindBar", "OutputConsole", "ScriptList"]
+
+_MODULES = {
+    "FindBar": ".find_bar",
+    "OutputConsole": ".output_console",
+    "ScriptList": ".script_list",
+}
+
+
+def __getattr__(name):
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,114 @@
+# widgets/find_bar.py
+
+import tkinter as tk
+import ttkbootstrap as ttkb
+from ttkbootstrap.constants import *
+
+from constants import OUTPUT_FILTERS
+
+
+class FindBar:
+    """
+    Панель поиска и фильтра над консолью вывода.
+
+    Сама панель ничего не ищет: изменения запроса, переходы и выбор
+    фильтра передаются обработчикам консоли.
+    """
+
+    def __init__(self, parent, on_change, on_next, on_previous, on_filter, on_close):
+        """
+        Args:
+            parent: Родительский виджет.
+            on_change: Вызывается при изменении запроса или его параметров.
+            on_next: Переход к следующему совпадению.
+            on_previous: Переход к предыдущему совпадению.
+            on_filter: Вызывается с названием фильтра из OUTPUT_FILTERS.
+            on_close: Закрытие панели.
+        """
+        self.frame = ttkb.Frame(parent, padding=(0, 0, 0, 5))
+
+        self.query_var = tk.StringVar()
+        self.query_var.trace_add("write", lambda *args: on_change())
+        self.entry = ttkb.Entry(self.frame, textvariable=self.query_var)
+        self.entry.pack(side=LEFT, fill=X, expand=True)
+        self.entry.bind("<Return>", lambda e: on_next())
+        self.entry.bind("<Shift-Return>", lambda e: on_previous())
+        self.entry.bind("<Escape>", lambda e: on_close())
+
+        ttkb.Button(
+            self.frame,
+            text="▲",
+            width=2,
+            command=on_previous,
+            bootstyle=(SECONDARY, OUTLINE),
+        ).pack(side=LEFT, padx=(5, 0))
+        ttkb.Button(
+            self.frame,
+            text="▼",
+            width=2,
+            command=on_next,
+            bootstyle=(SECONDARY, OUTLINE),
+        ).pack(side=LEFT, padx=(2, 0))
+
+        self.status_label = ttkb.Label(self.frame, text="", width=16, anchor=E)
+        self.status_label.pack(side=LEFT, padx=5)
+
+        self.regex_var = tk.BooleanVar(value=False)
+        ttkb.Checkbutton(
+            self.frame, text=".*", variable=self.regex_var, command=on_change
+        ).pack(side=LEFT, padx=(0, 5))
+        self.case_var = tk.BooleanVar(value=False)
+        ttkb.Checkbutton(
+            self.frame, text="Aa", variable=self.case_var, command=on_change
+        ).pack(side=LEFT, padx=(0, 5))
+
+        self.filter_var = tk.StringVar(value=next(iter(OUTPUT_FILTERS)))
+        filter_box = ttkb.Combobox(
+            self.frame,
+            textvariable=self.filter_var,
+            values=list(OUTPUT_FILTERS),
+            state="readonly",
+            width=18,
+        )
+        filter_box.pack(side=LEFT, padx=(0, 5))
+        filter_box.bind(
+            "<<ComboboxSelected>>", lambda e: on_filter(self.filter_var.get())
+        )
+
+        ttkb.Button(
+            self.frame,
+            text="✕",
+            width=2,
+            command=on_close,
+            bootstyle=(SECONDARY, OUTLINE),
+        ).pack(side=LEFT)
+
+    @property
+    def query(self):
+        return self.query_var.get()
+
+    @property
+    def regex(self):
+        return self.regex_var.get()
+
+    @property
+    def ignore_case(self):
+        return not self.case_var.get()
+
+    @property
+    def visible(self):
+        return bool(self.frame.winfo_manager())
+
+    def show(self, before):
+        """Показ панели над виджетом before и перевод фокуса в поле запроса."""
+        if not self.visible:
+            self.frame.pack(side=TOP, fill=X, before=before)
+        self.entry.focus_set()
+        self.entry.select_range(0, END)
+
+    def hide(self):
+        self.frame.pack_forget()
+        self.filter_var.set(next(iter(OUTPUT_FILTERS)))
+
+    def set_status(self, text):
+        self.status_label.config(text=text)
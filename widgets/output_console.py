@@ -0,0 +1,514 @@
+# widgets/output_console.py
+
+import re
+import tkinter as tk
+import ttkbootstrap as ttkb
+from ttkbootstrap.constants import *
+
+from constants import (
+    DEFAULT_OUTPUT_MAX_LINES,
+    OUTPUT_FILTERS,
+    OUTPUT_RENDER_MARGIN,
+    OUTPUT_SEARCH_CHUNK_LINES,
+    OUTPUT_SEARCH_DELAY_MS,
+)
+from output_buffer import OutputBuffer
+from output_search import FilteredView, OutputSearch, compile_query
+from .find_bar import FindBar
+from .tag_pool import TagPool
+
+
+class OutputConsole:
+    """
+    Консоль вывода поверх OutputBuffer с виртуализированной отрисовкой.
+
+    В tk.Text находится только видимая часть буфера плюс запас
+    OUTPUT_RENDER_MARGIN строк сверху и снизу. Пока пользователь находится
+    в конце вывода (режим слежения), новые строки дописываются в конец,
+    а лишние строки сверху удаляются одной операцией. При прокрутке назад
+    окно перерисовывается вокруг текущей позиции, а полоса прокрутки
+    отражает положение во всём буфере, а не в содержимом виджета.
+
+    Поиск (Ctrl+F) идёт по тексту буфера через OutputSearch, а совпадения
+    подсвечиваются только в видимых строках виджета. При выбранном фильтре
+    консоль показывает вместо буфера FilteredView — только строки,
+    прошедшие фильтр, — и дописывает новые строки по мере вывода.
+    """
+
+    def __init__(
+        self,
+        parent,
+        max_lines=DEFAULT_OUTPUT_MAX_LINES,
+        colored=True,
+        bg=None,
+        fg=None,
+    ):
+        self.max_lines = max_lines
+        self.colored = colored
+        self.buffer = OutputBuffer(max_lines, colored=colored)
+        # Отображаемые строки: буфер или отфильтрованное представление
+        self.view = self.buffer
+        self.margin = OUTPUT_RENDER_MARGIN
+        # Абсолютный номер первой строки буфера, отображённой в виджете
+        self.window_start = 0
+        self.follow = True
+
+        self.frame = ttkb.Frame(parent)
+
+        self.text = tk.Text(
+            self.frame,
+            state="disabled",
+            wrap=WORD,
+            bg=bg,
+            fg=fg,
+            bd=0,
+            highlightthickness=0,
+        )
+        self.text.pack(side=LEFT, fill=BOTH, expand=True)
+
+        self.scrollbar = ttkb.Scrollbar(
+            self.frame,
+            orient=VERTICAL,
+            command=self.on_scrollbar,
+            bootstyle="primary-round",
+        )
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+        self.text.config(yscrollcommand=self.on_text_scroll)
+        # Теги стилей ANSI создаются при первом использовании
+        self.tags = TagPool(self.text)
+        self.text.tag_configure("search", background="#665c00")
+        self.text.tag_configure("search_current", background="#d97706")
+
+        # Поиск и фильтр; панель поиска создаётся при первом открытии
+        self.find_bar = None
+        self.search = None
+        self.filter_search = None
+        self.filter_name = next(iter(OUTPUT_FILTERS))
+        # Абсолютный номер строки буфера с текущим совпадением
+        self.current = None
+        self._query_job = None
+        self._scan_job = None
+        # Отложенный поиск не должен срабатывать после закрытия вкладки
+        self.text.bind("<Destroy>", lambda e: self._cancel_jobs(), add="+")
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def reset(self, log=None):
+        """Очистка консоли и начало нового буфера (и лога запуска)."""
+        self.buffer.close()
+        self.buffer = OutputBuffer(self.max_lines, log, self.colored)
+        self.view = self.buffer
+        self.window_start = 0
+        self.follow = True
+        self.text.config(state="normal")
+        self.text.delete("1.0", END)
+        self.text.config(state="disabled")
+        self.scrollbar.set(0.0, 1.0)
+        self._restart_search()
+
+    def attach(self, buffer):
+        """Отображение существующего буфера, например буфера задачи."""
+        self.buffer = buffer
+        self.view = buffer
+        self.follow = True
+        self._restart_search()
+        self.scroll_to_line(self.view.end_line)
+
+    def close(self):
+        """Завершение записи полного лога текущего буфера."""
+        self.buffer.close()
+
+    def set_colored(self, colored):
+        """Включение или отключение цветного вывода для последующих данных."""
+        self.colored = colored
+        self.buffer.parser.colored = colored
+        if not colored:
+            self.tags.clear()
+
+    def feed(self, text):
+        """Добавление куска сырого вывода с ANSI последовательностями."""
+        runs = self.buffer.feed(text)
+        if runs:
+            self.show(runs)
+
+    def write(self, runs):
+        """
+        Добавление сегментов вывода.
+
+        Args:
+            runs (list): Пары (текст, стиль); стиль — SGRStyle или None.
+        """
+        runs = [(text, tag) for text, tag in runs if text]
+        if not runs:
+            return
+        self.buffer.append(runs)
+        self.show(runs)
+
+    def show(self, runs):
+        """Отображение сегментов, только что добавленных в буфер."""
+        added = self._update_searches()
+        if self.view is not self.buffer:
+            # Новые строки отфильтрованного вида появляются после проверки
+            if self.follow and added:
+                self.scroll_to_line(self.view.end_line)
+            else:
+                self.on_text_scroll(*self.text.yview())
+            return
+        if not self.follow:
+            # Виджет не трогаем, обновляем только положение полосы прокрутки
+            self.on_text_scroll(*self.text.yview())
+            return
+
+        # Все сегменты передаются в Tk одним вызовом insert
+        self.tags.start_batch()
+        tag_for = self.tags.tag_for
+        args = []
+        for text, style in runs:
+            args.append(text)
+            args.append(tag_for(style))
+        self.text.config(state="normal")
+        self.text.insert(END, *args)
+        if self.window_start < self.buffer.first_line:
+            # Буфер отбросил строки, которые ещё отображаются
+            self._delete_top(self.buffer.first_line - self.window_start)
+        excess = self._rendered_lines() - (self._visible_lines() + 2 * self.margin)
+        if excess > 0:
+            self._delete_top(excess + self.margin)
+        self.text.config(state="disabled")
+        self.text.see(END)
+
+    def _delete_top(self, count):
+        """Удаление count строк сверху виджета одной операцией."""
+        count = min(count, self._rendered_lines())
+        self.text.delete("1.0", f"{count + 1}.0")
+        self.window_start += count
+
+    def _rendered_lines(self):
+        return int(self.text.index("end-1c").split(".")[0])
+
+    def _visible_lines(self):
+        top = int(self.text.index("@0,0").split(".")[0])
+        bottom = int(self.text.index(f"@0,{self.text.winfo_height()}").split(".")[0])
+        return max(1, bottom - top + 1)
+
+    def _render(self, start, stop, top):
+        """Перерисовка окна строк [start, stop) с первой видимой строкой top."""
+        buffer = self.view
+        self.tags.start_batch()
+        tag_for = self.tags.tag_for
+        args = []
+        for number in range(start, stop):
+            for text, style in buffer.line(number):
+                args.append(text)
+                args.append(tag_for(style))
+            if number < buffer.end_line - 1 or not buffer.partial:
+                args.append("\n")
+                args.append(())
+        self.text.config(state="normal")
+        self.text.delete("1.0", END)
+        if args:
+            self.text.insert(END, *args)
+        self.text.config(state="disabled")
+        self.window_start = start
+        self.text.yview(f"{top - start + 1}.0")
+
+    def scroll_to_line(self, number):
+        """Показ окна буфера, начинающегося со строки с абсолютным номером number."""
+        buffer = self.view
+        visible = self._visible_lines()
+        number = max(buffer.first_line, min(number, buffer.end_line - visible))
+        self.follow = number + visible >= buffer.end_line
+        if self.follow:
+            start = max(buffer.first_line, buffer.end_line - visible - self.margin)
+            self._render(start, buffer.end_line, number)
+            self.text.see(END)
+        else:
+            start = max(buffer.first_line, number - self.margin)
+            stop = min(buffer.end_line, number + visible + self.margin)
+            self._render(start, stop, number)
+
+    def on_scrollbar(self, *args):
+        """Обработка команд полосы прокрутки в координатах всего буфера."""
+        buffer = self.view
+        if args[0] == "moveto":
+            total = len(buffer)
+            self.scroll_to_line(buffer.first_line + int(float(args[1]) * total))
+        else:
+            self.text.yview(*args)
+
+    def on_text_scroll(self, first, last):
+        """Синхронизация полосы прокрутки и подгрузка строк у краёв окна."""
+        buffer = self.view
+        total = len(buffer)
+        if not total:
+            self.scrollbar.set(0.0, 1.0)
+            return
+
+        top = self._top_line()
+        visible = self._visible_lines()
+        window_stop = self.window_start + self._rendered_lines()
+        at_end = float(last) >= 1.0 and window_stop >= buffer.end_line
+        if at_end:
+            self.follow = True
+        else:
+            self.follow = False
+            # У краёв отрисованного окна подгружаем соседние строки буфера
+            near_top = top - self.window_start < self.margin // 4
+            near_bottom = window_stop - (top + visible) < self.margin // 4
+            if (near_top and self.window_start > buffer.first_line) or (
+                near_bottom and window_stop < buffer.end_line
+            ):
+                self.scroll_to_line(top)
+                return
+
+        start = (top - buffer.first_line) / total
+        self.scrollbar.set(max(0.0, start), min(1.0, start + visible / total))
+        if self.search is not None:
+            self._highlight_visible()
+
+    def _top_line(self):
+        """Номер (в отображаемых строках) первой видимой строки."""
+        return self.window_start + int(self.text.index("@0,0").split(".")[0]) - 1
+
+    def _top_source(self):
+        """Абсолютный номер строки буфера в начале видимой области или None."""
+        view = self.view
+        if not len(view):
+            return None
+        top = max(view.first_line, min(self._top_line(), view.end_line - 1))
+        return self._to_source(top)
+
+    def _to_view(self, source):
+        """Номер отображаемой строки для абсолютного номера строки буфера."""
+        return source if self.view is self.buffer else self.view.view_line(source)
+
+    def _to_source(self, number):
+        """Абсолютный номер строки буфера для отображаемой строки."""
+        return number if self.view is self.buffer else self.view.source_line(number)
+
+    # Поиск и фильтр
+
+    def open_find(self):
+        """Показ панели поиска (Ctrl+F)."""
+        if self.find_bar is None:
+            self.find_bar = FindBar(
+                self.frame,
+                on_change=self.on_query_change,
+                on_next=self.find_next,
+                on_previous=lambda: self.find_next(backward=True),
+                on_filter=self.set_filter,
+                on_close=self.close_find,
+            )
+        reopened = not self.find_bar.visible and self.find_bar.query
+        self.find_bar.show(before=self.text)
+        if reopened:
+            self.apply_query()
+
+    def close_find(self):
+        """Скрытие панели поиска со сбросом поиска и фильтра."""
+        if self.find_bar is None:
+            return
+        self.find_bar.hide()
+        self._cancel_jobs()
+        self.search = None
+        self.current = None
+        self.set_filter(next(iter(OUTPUT_FILTERS)))
+        self.text.tag_remove("search", "1.0", END)
+        self.text.tag_remove("search_current", "1.0", END)
+        self.text.focus_set()
+
+    def _cancel_jobs(self):
+        for job in (self._query_job, self._scan_job):
+            if job is not None:
+                self.text.after_cancel(job)
+        self._query_job = None
+        self._scan_job = None
+
+    def _restart_search(self):
+        """Повтор поиска и фильтра для нового буфера."""
+        self._cancel_jobs()
+        self.search = None
+        self.filter_search = None
+        self.current = None
+        self.view = self.buffer
+        if self.find_bar is not None and self.find_bar.visible:
+            self.apply_query()
+
+    def on_query_change(self):
+        """Поиск запускается после паузы в наборе запроса."""
+        if self._query_job is not None:
+            self.text.after_cancel(self._query_job)
+        self._query_job = self.text.after(OUTPUT_SEARCH_DELAY_MS, self.apply_query)
+
+    def apply_query(self):
+        """Создание поиска по запросу из панели и подсветка совпадений."""
+        self._query_job = None
+        bar = self.find_bar
+        self.search = None
+        self.current = None
+        if bar.query:
+            try:
+                pattern = compile_query(bar.query, bar.regex, bar.ignore_case)
+            except re.error:
+                bar.set_status("Ошибка в выражении")
+            else:
+                self.search = OutputSearch(self.buffer, pattern)
+        if self.search is None:
+            self.text.tag_remove("search", "1.0", END)
+            self.text.tag_remove("search_current", "1.0", END)
+        # Фильтр по совпадениям поиска зависит от запроса
+        self.set_filter(self.filter_name)
+
+    def set_filter(self, name):
+        """
+        Показ только строк, прошедших фильтр.
+
+        Args:
+            name (str): Название фильтра из OUTPUT_FILTERS.
+        """
+        source = self._top_source()
+        expression = OUTPUT_FILTERS.get(name)
+        self.filter_name = name
+        if expression is None:
+            self.filter_search = None
+        elif expression == "":
+            self.filter_search = self.search
+        else:
+            # Уровни сообщений пишутся заглавными, поэтому регистр учитывается
+            self.filter_search = OutputSearch(
+                self.buffer, compile_query(expression, regex=True, ignore_case=False)
+            )
+        if self.filter_search is None:
+            self.view = self.buffer
+        else:
+            self.view = FilteredView(self.filter_search)
+        self._update_searches()
+
+        if self.follow or source is None:
+            self.scroll_to_line(self.view.end_line)
+        else:
+            self.scroll_to_line(self._to_view(source))
+        if self.search is not None:
+            self._highlight_visible()
+
+    def _searches(self):
+        searches = []
+        for search in (self.search, self.filter_search):
+            if search is not None and search not in searches:
+                searches.append(search)
+        return searches
+
+    def _update_searches(self):
+        """
+        Проверка новых строк буфера поиском и фильтром.
+
+        За один вызов проверяется не больше OUTPUT_SEARCH_CHUNK_LINES строк,
+        остальные — в следующих итерациях цикла событий, поэтому поиск
+        в большом буфере не останавливает интерфейс.
+
+        Returns:
+            int: Количество новых строк, прошедших фильтр.
+        """
+        added = 0
+        pending = False
+        for search in self._searches():
+            found = search.update(OUTPUT_SEARCH_CHUNK_LINES)
+            if search is self.filter_search:
+                added = found
+            pending = pending or not search.complete
+        if pending and self._scan_job is None:
+            self._scan_job = self.text.after(1, self._continue_scan)
+        self._update_status()
+        return added
+
+    def _continue_scan(self):
+        self._scan_job = None
+        added = self._update_searches()
+        if self.view is not self.buffer and self.follow and added:
+            self.scroll_to_line(self.view.end_line)
+        elif self.search is not None:
+            self._highlight_visible()
+
+    def find_next(self, backward=False):
+        """Переход к следующему (или предыдущему) совпадению поиска."""
+        search = self.search
+        if search is None:
+            return
+        self._update_searches()
+        if self.current is not None:
+            origin = self.current
+        else:
+            top = self._top_source()
+            top = self.buffer.first_line if top is None else top
+            # Совпадение в первой видимой строке тоже подходит
+            origin = top if backward else top - 1
+        step = search.previous if backward else search.next
+        number = self._step(step, origin)
+        if number is None:
+            # Поиск продолжается с другого конца буфера
+            wrap = self.buffer.end_line if backward else self.buffer.first_line - 1
+            number = self._step(step, wrap)
+        if number is None:
+            self.find_bar.set_status("Нет совпадений")
+            return
+        self.current = number
+        self.scroll_to_line(self._to_view(number) - self._visible_lines() // 2)
+        self._highlight_visible()
+        self._update_status()
+
+    def _step(self, step, origin):
+        """Ближайшее совпадение, видимое при текущем фильтре."""
+        number = step(origin)
+        if self.filter_search is not None and self.filter_search is not self.search:
+            # Совпадения вне фильтра пропускаются; каждая проверка — бисекция
+            while number is not None and not self.filter_search.contains(number):
+                number = step(number)
+        return number
+
+    def _highlight_visible(self):
+        """Подсветка совпадений только в видимых строках виджета."""
+        text = self.text
+        text.tag_remove("search", "1.0", END)
+        text.tag_remove("search_current", "1.0", END)
+        search = self.search
+        if search is None:
+            return
+        first_row = int(text.index("@0,0").split(".")[0])
+        last_row = int(text.index(f"@0,{text.winfo_height()}").split(".")[0])
+        first = self.view.first_line
+        end = self.view.end_line
+        for row in range(first_row, last_row + 1):
+            number = self.window_start + row - 1
+            if number < first:
+                continue
+            if number >= end:
+                break
+            source = self._to_source(number)
+            if not search.contains(source):
+                continue
+            tag = "search_current" if source == self.current else "search"
+            for start, stop in search.spans(source):
+                text.tag_add(tag, f"{row}.{start}", f"{row}.{stop}")
+        # Подсветка поверх тегов стилей ANSI
+        text.tag_raise("search")
+        text.tag_raise("search_current")
+
+    def _update_status(self):
+        """Счётчик совпадений в панели поиска."""
+        bar = self.find_bar
+        if bar is None or not bar.visible:
+            return
+        search = self.search
+        if search is None:
+            if not bar.query:
+                bar.set_status("")
+            return
+        total = len(search)
+        if self.current is not None and search.contains(self.current):
+            status = f"{search.position(self.current) + 1} из {total}"
+        else:
+            status = f"совпадений: {total}"
+        if not all(item.complete for item in self._searches()):
+            status += "…"
+        bar.set_status(status)
@@ -0,0 +1,185 @@
+# widgets/script_list.py
+
+import os
+import tkinter as tk
+import tkinter.font as tkfont
+import ttkbootstrap as ttkb
+from ttkbootstrap.constants import *
+
+
+class ScriptList:
+    """
+    Виртуализированный список скриптов.
+
+    В tk.Listbox находятся только строки, помещающиеся в видимую область,
+    поэтому стоимость отрисовки не зависит от числа скриптов. Полоса
+    прокрутки, колесо мыши и клавиши управления работают с полным списком
+    items, а выбранный скрипт хранится как путь, а не как номер строки.
+    Строки путей из множества marked выделяются цветом mark_color.
+    """
+
+    def __init__(self, parent, on_select=None, marked=None, mark_color="red"):
+        self.on_select = on_select
+        self.marked = marked if marked is not None else set()
+        self.mark_color = mark_color
+        self.items = []
+        self._positions = {}
+        self.selected = None
+        # Номер элемента items в первой строке виджета
+        self.top = 0
+        self.rows = 20
+
+        self.frame = ttkb.Frame(parent)
+
+        self.listbox = tk.Listbox(
+            self.frame,
+            width=40,
+            height=self.rows,
+            selectmode=SINGLE,
+            exportselection=False,
+            activestyle="none",
+        )
+        self.listbox.pack(side=LEFT, fill=BOTH, expand=True)
+
+        self.scrollbar = ttkb.Scrollbar(
+            self.frame,
+            orient=VERTICAL,
+            command=self.on_scrollbar,
+            bootstyle="primary-round",
+        )
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+
+        self.listbox.bind("<<ListboxSelect>>", self.on_click)
+        self.listbox.bind("<Configure>", self.on_resize)
+        self.listbox.bind("<MouseWheel>", self.on_wheel)
+        self.listbox.bind("<Button-4>", self.on_wheel)
+        self.listbox.bind("<Button-5>", self.on_wheel)
+        for key, step in (
+            ("<Up>", -1),
+            ("<Down>", 1),
+            ("<Prior>", "page-up"),
+            ("<Next>", "page-down"),
+            ("<Home>", "home"),
+            ("<End>", "end"),
+        ):
+            self.listbox.bind(key, lambda e, step=step: self.on_key(step))
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    @staticmethod
+    def display_name(path):
+        """Имя скрипта для строки списка (длинные имена обрезаются)."""
+        name = os.path.basename(path)
+        return (name[:97] + "...") if len(name) > 100 else name
+
+    def set_items(self, items):
+        """Замена отображаемых путей; выбор сохраняется, если путь остался."""
+        self.items = items
+        self._positions = {path: i for i, path in enumerate(items)}
+        if self.selected not in self._positions:
+            self.selected = None
+        self.top = max(0, min(self.top, len(items) - self.rows))
+        self.refresh()
+
+    def selection(self):
+        """Путь выбранного скрипта или None."""
+        return self.selected
+
+    def select(self, path):
+        """Выбор скрипта и прокрутка к нему."""
+        if path not in self._positions:
+            return
+        self.selected = path
+        self.see(self._positions[path])
+
+    def see(self, index):
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + self.rows:
+            self.top = index - self.rows + 1
+        self.refresh()
+
+    def refresh(self):
+        """Перерисовка видимых строк (например, после изменения marked)."""
+        visible = self.items[self.top : self.top + self.rows]
+        self.listbox.delete(0, END)
+        if visible:
+            self.listbox.insert(END, *(self.display_name(path) for path in visible))
+        for row, path in enumerate(visible):
+            if path in self.marked:
+                self.listbox.itemconfig(
+                    row, foreground=self.mark_color, selectforeground=self.mark_color
+                )
+            if path == self.selected:
+                self.listbox.selection_set(row)
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        if not self.items:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        total = len(self.items)
+        self.scrollbar.set(self.top / total, min(1.0, (self.top + self.rows) / total))
+
+    def scroll_to(self, top):
+        self.top = max(0, min(int(top), len(self.items) - self.rows))
+        self.refresh()
+
+    def on_resize(self, event):
+        """Пересчёт числа видимых строк по высоте виджета."""
+        font = tkfont.nametofont(self.listbox.cget("font"))
+        row_height = font.metrics("linespace") + 1
+        row_height += 2 * int(self.listbox.cget("selectborderwidth"))
+        border = int(self.listbox.cget("borderwidth"))
+        border += int(self.listbox.cget("highlightthickness"))
+        rows = max(1, (event.height - 2 * border) // row_height)
+        if rows != self.rows:
+            self.rows = rows
+            self.scroll_to(self.top)
+
+    def on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self.items))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= self.rows
+            self.scroll_to(self.top + amount)
+
+    def on_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_to(self.top - 3)
+        else:
+            self.scroll_to(self.top + 3)
+        return "break"
+
+    def on_click(self, event):
+        rows = self.listbox.curselection()
+        if not rows or self.top + rows[0] >= len(self.items):
+            return
+        self.selected = self.items[self.top + rows[0]]
+        if self.on_select is not None:
+            self.on_select()
+
+    def on_key(self, step):
+        """Перемещение выбора клавишами по всему списку, а не по видимым строкам."""
+        if not self.items:
+            return "break"
+        current = self._positions.get(self.selected, self.top - 1)
+        if step == "home":
+            index = 0
+        elif step == "end":
+            index = len(self.items) - 1
+        elif step == "page-up":
+            index = current - self.rows
+        elif step == "page-down":
+            index = current + self.rows
+        else:
+            index = current + step
+        index = max(0, min(index, len(self.items) - 1))
+        self.selected = self.items[index]
+        self.see(index)
+        if self.on_select is not None:
+            self.on_select()
+        return "break"
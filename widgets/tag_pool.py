@@ -0,0 +1,115 @@
+# widgets/tag_pool.py
+
+import tkinter as tk
+import tkinter.font as tkfont
+from collections import OrderedDict
+
+from constants import ANSI_TAG_EVICTION_SCAN, ANSI_TAG_POOL_SIZE
+
+
+class TagPool:
+    """
+    LRU-пул тегов tk.Text для стилей ANSI.
+
+    Один тег соответствует одному комбинированному стилю SGRStyle, а не
+    отдельному цвету, и создаётся при первом использовании. Когда число
+    тегов превышает capacity, из виджета удаляется наименее давно
+    использованный тег, которым не оформлен отрисованный текст и который не
+    выдан для текущей вставки (см. start_batch): удаление тега с видимых
+    строк сняло бы с них цвета. Если все проверенные теги заняты (например,
+    при 24-битном градиенте на экране больше capacity стилей), пул временно
+    превышает capacity и сокращается, когда строки уходят из окна.
+    """
+
+    def __init__(self, text, capacity=ANSI_TAG_POOL_SIZE):
+        self.text = text
+        self.capacity = capacity
+        self._tags = OrderedDict()
+        self._fonts = {}
+        self._counter = 0
+        # Момент последней выдачи тега для каждого стиля и начала текущей вставки
+        self._clock = 0
+        self._used = {}
+        self._batch_start = 0
+
+    def start_batch(self):
+        """Начало вставки: теги, выданные после этого, не вытесняются до следующей."""
+        self._batch_start = self._clock
+
+    def tag_for(self, style):
+        """Имя тега для стиля; None и пустой стиль дают пустой кортеж тегов."""
+        if style is None:
+            return ()
+        self._clock += 1
+        tag = self._tags.get(style)
+        if tag is not None:
+            self._tags.move_to_end(style)
+            self._used[style] = self._clock
+            return tag
+
+        self._counter += 1
+        tag = f"sgr{self._counter}"
+        try:
+            self.text.tag_configure(tag, **self._options(style))
+        except tk.TclError:
+            # Неизвестное Tk имя цвета: показываем текст без оформления
+            self.text.tag_configure(tag)
+        self._tags[style] = tag
+        self._used[style] = self._clock
+        if len(self._tags) > self.capacity:
+            self._evict()
+        return tag
+
+    def _evict(self):
+        """Удаление давних тегов, которые не используются в отрисованном тексте."""
+        for _ in range(ANSI_TAG_EVICTION_SCAN):
+            if len(self._tags) <= self.capacity:
+                break
+            style, tag = next(iter(self._tags.items()))
+            if self._used[style] > self._batch_start or self.text.tag_nextrange(
+                tag, "1.0"
+            ):
+                # Тег оформляет видимый текст или нужен текущей вставке
+                self._tags.move_to_end(style)
+                continue
+            del self._tags[style]
+            del self._used[style]
+            self.text.tag_delete(tag)
+
+    def clear(self):
+        """Удаление всех тегов пула из виджета."""
+        if self._tags:
+            self.text.tag_delete(*self._tags.values())
+        self._tags.clear()
+        self._used.clear()
+
+    def _options(self, style):
+        """Параметры tag_configure для стиля."""
+        fg, bg = style.fg, style.bg
+        if style.reverse:
+            fg = bg or self.text.cget("bg")
+            bg = style.fg or self.text.cget("fg")
+        options = {}
+        if fg:
+            options["foreground"] = fg
+        if bg:
+            options["background"] = bg
+        if style.underline:
+            options["underline"] = True
+        if style.strike:
+            options["overstrike"] = True
+        if style.bold or style.italic:
+            options["font"] = self._font(style.bold, style.italic)
+        return options
+
+    def _font(self, bold, italic):
+        """Производный от шрифта виджета шрифт; создаётся не более 3 раз."""
+        key = (bold, italic)
+        if key not in self._fonts:
+            font = tkfont.Font(font=self.text.cget("font"))
+            font.configure(
+                weight="bold" if bold else "normal",
+                slant="italic" if italic else "roman",
+            )
+            self._fonts[key] = font
+        return self._fonts[key]